@@ -20,6 +20,9 @@ extras_require = {
         "twine>=1.13",
         "wheel",
     ],
+    "numpy": [
+        "numpy>=2.0.0",
+    ],
     "docs": [
         "sphinx>=6.0.0",
         "sphinx-autobuild>=2021.3.14",
@@ -45,8 +48,11 @@ extras_require["dev"] = (
     + extras_require["docs"]
     + extras_require["test"]
     + extras_require["tester"]
+    + extras_require["numpy"]
+)
+extras_require["test"] = (
+    extras_require["test"] + extras_require["tester"] + extras_require["numpy"]
 )
-extras_require["test"] = extras_require["test"] + extras_require["tester"]
 
 
 with open("./README.md") as readme:
@@ -1,9 +1,13 @@
 import pytest
+import copy
+import pickle
 import random
 import re
 
 from web3.datastructures import (
     AttributeDict,
+    AttributeRecord,
+    LazyAttributeDict,
     NamedElementOnion,
     tupleize_lists_nested,
 )
@@ -89,6 +93,102 @@ def test_attribute_dict_raises_when_mutated():
         del test_attr_dict.address
 
 
+def test_lazy_attribute_dict_converts_values_when_read():
+    value = {"a": {"b": {"c": 1}}, "d": [{"e": 2}], "f": 3}
+    lazy = LazyAttributeDict.recursive(value)
+
+    assert isinstance(lazy, AttributeDict)
+    assert lazy.__dict__["a"] is value["a"]
+    assert isinstance(lazy.a, LazyAttributeDict)
+    assert lazy.__dict__["a"] is lazy.a
+    assert lazy.a.b.c == 1
+    assert isinstance(lazy["d"][0], LazyAttributeDict)
+    assert lazy.d[0].e == 2
+    assert lazy.f == 3
+
+    # the original value is not modified
+    assert value == {"a": {"b": {"c": 1}}, "d": [{"e": 2}], "f": 3}
+
+
+def test_lazy_attribute_dict_reads_like_attribute_dict():
+    value = {"a": {"b": [1, 2]}, "c": [{"d": 3}]}
+    attr_dict = AttributeDict.recursive(value)
+
+    assert LazyAttributeDict.recursive(value) == attr_dict
+    assert attr_dict == LazyAttributeDict.recursive(value)
+    assert LazyAttributeDict.recursive(value) == value
+    assert hash(LazyAttributeDict.recursive(value)) == hash(attr_dict)
+    assert repr(LazyAttributeDict.recursive(value)) == repr(attr_dict)
+    assert repr(LazyAttributeDict.recursive(value)) == (
+        "AttributeDict({'a': AttributeDict({'b': [1, 2]}), "
+        "'c': [AttributeDict({'d': 3})]})"
+    )
+    assert dict(LazyAttributeDict.recursive(value).items()) == dict(attr_dict.items())
+
+    lazy = LazyAttributeDict.recursive(value)
+    assert pickle.loads(pickle.dumps(lazy)) == attr_dict
+    assert copy.deepcopy(lazy) == attr_dict
+
+    with pytest.raises(TypeError):
+        lazy.a = 1
+    with pytest.raises(TypeError):
+        lazy["a"] = 1
+
+
+class PointRecord(AttributeRecord):
+    __slots__ = _fields = ("x", "y", "tags")
+
+
+def test_attribute_record_reads_like_attribute_dict():
+    record = PointRecord.recursive({"x": 1, "tags": [{"a": 1}], "label": "origin"})
+    attr_dict = AttributeDict.recursive({"x": 1, "tags": [{"a": 1}], "label": "origin"})
+
+    assert not hasattr(record, "__dict__")
+    assert record.x == record["x"] == 1
+    assert record.label == record["label"] == "origin"
+    assert isinstance(record.tags[0], AttributeDict)
+
+    # ``y`` is a field of the record, but was not set
+    assert "y" not in record
+    assert record.get("y") is None
+    with pytest.raises(KeyError):
+        record["y"]
+    with pytest.raises(AttributeError):
+        record.y
+
+    assert list(record) == ["x", "tags", "label"]
+    assert len(record) == 3
+    assert record == attr_dict
+    assert attr_dict == record
+    assert hash(record) == hash(attr_dict)
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert copy.deepcopy(record) == record
+
+
+def test_attribute_record_raises_when_mutated():
+    record = PointRecord({"x": 1})
+
+    with pytest.raises(TypeError):
+        record["x"] = 2
+
+    with pytest.raises(TypeError):
+        record.x = 2
+
+    with pytest.raises(TypeError):
+        record.y = 2
+
+    with pytest.raises(TypeError):
+        del record.x
+
+
+def test_attribute_dict_recursive_keeps_attribute_records():
+    record = PointRecord({"x": 1})
+    attr_dict = AttributeDict.recursive({"point": record, "points": [record]})
+
+    assert attr_dict.point is record
+    assert attr_dict.points[0] is record
+
+
 @pytest.mark.parametrize(
     "input,expected",
     (
@@ -213,6 +313,37 @@ def test_AttributeDict_hashing_backwards_compatibility(input, error):
         assert hash(tuple(sorted(input.items()))) == hash(input)
 
 
+def test_AttributeDict_hash_is_computed_once(monkeypatch):
+    calls = []
+    tupleize = tupleize_lists_nested
+
+    def counting_tupleize(d):
+        calls.append(d)
+        return tupleize(d)
+
+    monkeypatch.setattr("web3.datastructures.tupleize_lists_nested", counting_tupleize)
+    attr_dict = AttributeDict({"a": [1, 2], "b": "c"})
+    record = PointRecord({"x": 1, "tags": [1, 2]})
+
+    assert hash(attr_dict) == hash(attr_dict)
+    assert hash(record) == hash(record)
+    assert len(calls) == 2
+
+    # the cached hash is not part of the data
+    assert dict(attr_dict) == {"a": [1, 2], "b": "c"}
+    assert pickle.loads(pickle.dumps(attr_dict)) == attr_dict
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_AttributeDict_equality_short_circuits():
+    attr_dict = AttributeDict({"a": {1, 2}})
+    # a set is not hashable, so comparing by hash would raise
+    assert attr_dict == attr_dict
+    assert AttributeDict({"a": 1}) != AttributeDict({"a": 1, "b": 2})
+    assert AttributeDict({"a": 1}) == AttributeDict({"a": 1})
+    assert AttributeDict({"a": 1}) != AttributeDict({"a": 2})
+
+
 def test_NamedElementOnion_values():
     middleware = GasPriceStrategyMiddleware(None)
     initial_items = [(middleware, "gas_price_strategy")]
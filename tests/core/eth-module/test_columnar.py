@@ -0,0 +1,235 @@
+import pytest
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3.exceptions import (
+    BlockNotFound,
+    Web3ValueError,
+)
+from web3.providers.async_base import (
+    AsyncJSONBaseProvider,
+)
+from web3.providers.base import (
+    JSONBaseProvider,
+)
+
+np = pytest.importorskip("numpy")
+
+MINER = "0x" + "aa" * 20
+LOG_ADDRESS = "0x" + "bb" * 20
+NUM_BLOCKS = 10
+
+
+def _raw_block(number):
+    block = {
+        "number": hex(number),
+        "hash": "0x" + f"{number:064x}",
+        "parentHash": "0x" + f"{max(number - 1, 0):064x}",
+        "timestamp": hex(1_700_000_000 + 12 * number),
+        "gasUsed": hex(21_000 * number),
+        "miner": MINER,
+        "extraData": "0x" + "ff" * number,
+        "transactions": ["0x" + "11" * 32] * number,
+    }
+    # blocks before "London" have no base fee
+    if number >= 5:
+        block["baseFeePerGas"] = hex(7 * number)
+    return block
+
+
+def _raw_logs(from_block, to_block):
+    return [
+        {
+            "address": LOG_ADDRESS,
+            "blockHash": "0x" + f"{number:064x}",
+            "blockNumber": hex(number),
+            "data": "0x" + "00" * number,
+            "logIndex": "0x0",
+            "removed": False,
+            "topics": ["0x" + f"{topic:064x}" for topic in range(number % 5)],
+            "transactionHash": "0x" + "22" * 32,
+            "transactionIndex": hex(number),
+        }
+        for number in range(from_block, min(to_block, NUM_BLOCKS - 1) + 1)
+    ]
+
+
+def _make_response(request_id, method, params):
+    if method == "eth_getBlockByNumber":
+        number = int(params[0], 16)
+        result = _raw_block(number) if number < NUM_BLOCKS else None
+    elif method == "eth_getLogs":
+        filter_params = params[0]
+        result = _raw_logs(
+            int(filter_params["fromBlock"], 16), int(filter_params["toBlock"], 16)
+        )
+    else:
+        raise NotImplementedError(f"Cannot make request for {method}:{params}")
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+class FakeChainProvider(JSONBaseProvider):
+    def __init__(self):
+        super().__init__()
+        self.batch_sizes = []
+
+    def make_request(self, method, params):
+        return _make_response(0, method, params)
+
+    def make_batch_request(self, requests):
+        self.batch_sizes.append(len(requests))
+        return [
+            _make_response(request_id, method, params)
+            for request_id, (method, params) in enumerate(requests)
+        ]
+
+
+class AsyncFakeChainProvider(AsyncJSONBaseProvider):
+    def __init__(self):
+        super().__init__()
+        self.batch_sizes = []
+
+    async def make_request(self, method, params):
+        return _make_response(0, method, params)
+
+    async def make_batch_request(self, requests):
+        self.batch_sizes.append(len(requests))
+        return [
+            _make_response(request_id, method, params)
+            for request_id, (method, params) in enumerate(requests)
+        ]
+
+
+def test_get_blocks_columnar_decodes_selected_fields():
+    provider = FakeChainProvider()
+    w3 = Web3(provider)
+
+    columns = w3.eth.get_blocks_columnar(
+        range(NUM_BLOCKS),
+        fields=[
+            "number",
+            "baseFeePerGas",
+            "hash",
+            "miner",
+            "extraData",
+            "transactionCount",
+        ],
+        batch_size=4,
+    )
+
+    assert provider.batch_sizes == [4, 4, 2]
+    assert list(columns) == [
+        "number",
+        "baseFeePerGas",
+        "hash",
+        "miner",
+        "extraData",
+        "transactionCount",
+    ]
+    assert columns["number"].dtype == np.uint64
+    assert columns["number"].tolist() == list(range(NUM_BLOCKS))
+    # missing fields are 0
+    assert columns["baseFeePerGas"].tolist() == [0] * 5 + [35, 42, 49, 56, 63]
+    assert columns["hash"].dtype == np.uint8
+    assert columns["hash"].shape == (NUM_BLOCKS, 32)
+    assert columns["hash"][7].tobytes() == (7).to_bytes(32, "big")
+    assert columns["miner"].shape == (NUM_BLOCKS, 20)
+    assert columns["miner"][0].tobytes() == b"\xaa" * 20
+    assert columns["extraData"].tolist() == [b"\xff" * n for n in range(NUM_BLOCKS)]
+    assert columns["transactionCount"].tolist() == list(range(NUM_BLOCKS))
+
+
+def test_get_blocks_columnar_defaults_to_all_fields():
+    w3 = Web3(FakeChainProvider())
+
+    columns = w3.eth.get_blocks_columnar([3, 1])
+
+    assert "logsBloom" in columns
+    assert columns["number"].tolist() == [3, 1]
+    assert columns["logsBloom"].shape == (2, 256)
+    assert not columns["logsBloom"].any()
+    assert columns["totalDifficulty"].tolist() == [0, 0]
+
+
+def test_get_blocks_columnar_empty_range():
+    w3 = Web3(FakeChainProvider())
+
+    columns = w3.eth.get_blocks_columnar(range(0), fields=["number", "hash"])
+
+    assert columns["number"].shape == (0,)
+    assert columns["hash"].shape == (0, 32)
+
+
+def test_get_blocks_columnar_raises_for_missing_blocks():
+    w3 = Web3(FakeChainProvider())
+
+    with pytest.raises(BlockNotFound):
+        w3.eth.get_blocks_columnar(range(NUM_BLOCKS + 1), fields=["number"])
+
+
+@pytest.mark.parametrize(
+    "kwargs,match",
+    (
+        ({"fields": ["number", "unknown"]}, "Unsupported fields: \\['unknown'\\]"),
+        ({"fields": "number"}, "sequence of field names"),
+        ({"batch_size": 0}, "`batch_size` must be a positive integer"),
+    ),
+)
+def test_get_blocks_columnar_raises_for_invalid_arguments(kwargs, match):
+    provider = FakeChainProvider()
+    w3 = Web3(provider)
+
+    with pytest.raises(Web3ValueError, match=match):
+        w3.eth.get_blocks_columnar(range(NUM_BLOCKS), **kwargs)
+    assert provider.batch_sizes == []
+
+
+def test_get_logs_columnar_splits_block_range():
+    provider = FakeChainProvider()
+    w3 = Web3(provider)
+
+    columns = w3.eth.get_logs_columnar(
+        {"fromBlock": 0, "toBlock": NUM_BLOCKS - 1},
+        fields=["blockNumber", "address", "topicCount", "topic0", "topic3", "data"],
+        blocks_per_request=3,
+        batch_size=2,
+    )
+
+    # 4 requests of at most 3 blocks, in batches of 2 requests
+    assert provider.batch_sizes == [2, 2]
+    assert columns["blockNumber"].tolist() == list(range(NUM_BLOCKS))
+    assert columns["address"].shape == (NUM_BLOCKS, 20)
+    assert columns["topicCount"].tolist() == [n % 5 for n in range(NUM_BLOCKS)]
+    # missing topics are zero bytes, told apart from zero topics by ``topicCount``
+    assert not columns["topic0"].any()
+    assert [row[-1] for row in columns["topic3"]] == [0, 0, 0, 0, 3] * 2
+    assert columns["data"].tolist() == [b"\x00" * n for n in range(NUM_BLOCKS)]
+
+
+def test_get_logs_columnar_requires_integer_block_range_to_split():
+    w3 = Web3(FakeChainProvider())
+
+    with pytest.raises(Web3ValueError, match="integer `fromBlock` and `toBlock`"):
+        w3.eth.get_logs_columnar(
+            {"fromBlock": 0, "toBlock": "latest"}, blocks_per_request=3
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_get_blocks_and_logs_columnar():
+    provider = AsyncFakeChainProvider()
+    async_w3 = AsyncWeb3(provider)
+
+    blocks = await async_w3.eth.get_blocks_columnar(
+        range(NUM_BLOCKS), fields=["number", "gasUsed"], batch_size=5
+    )
+    logs = await async_w3.eth.get_logs_columnar(
+        {"fromBlock": 2, "toBlock": 4}, fields=["blockNumber", "transactionIndex"]
+    )
+
+    assert provider.batch_sizes == [5, 5, 1]
+    assert blocks["gasUsed"].tolist() == [21_000 * n for n in range(NUM_BLOCKS)]
+    assert logs["blockNumber"].tolist() == [2, 3, 4]
+    assert logs["transactionIndex"].tolist() == [2, 3, 4]
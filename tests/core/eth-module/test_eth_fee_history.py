@@ -4,6 +4,17 @@ from unittest.mock import (
     patch,
 )
 
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3.providers.async_base import (
+    AsyncJSONBaseProvider,
+)
+from web3.providers.base import (
+    JSONBaseProvider,
+)
+
 
 @pytest.mark.parametrize(
     "fee_history_args, expected",
@@ -20,3 +31,65 @@ def test_eth_fee_history_reward_percentiles_default_is_empty_list(
 ) -> None:
     w3.eth.fee_history(*fee_history_args)
     w3.eth._fee_history.assert_called_with(*expected)
+
+
+RAW_FEE_HISTORY = {
+    "oldestBlock": "0x3",
+    "baseFeePerGas": ["0xc13c0e2", "0xa9a3e29", "0x946b3b9", "0x81e8d2d", "0x71e8128"],
+    "gasUsedRatio": [0.0074, 0.0037, 0.0019, 0.0074],
+    "reward": [
+        ["0xdc", "0x6d076d"],
+        ["0xf4240", "0x5b8d55"],
+        ["0x226", "0x226"],
+        ["0x7d", "0xbc614e"],
+    ],
+}
+
+
+class FeeHistoryProvider(JSONBaseProvider):
+    def make_request(self, method, params):
+        assert method == "eth_feeHistory"
+        return {"jsonrpc": "2.0", "id": 0, "result": RAW_FEE_HISTORY}
+
+
+class AsyncFeeHistoryProvider(AsyncJSONBaseProvider):
+    async def make_request(self, method, params):
+        assert method == "eth_feeHistory"
+        return {"jsonrpc": "2.0", "id": 0, "result": RAW_FEE_HISTORY}
+
+
+def _assert_fee_history_arrays(arrays, np):
+    assert arrays["oldestBlock"] == 3
+    assert arrays["baseFeePerGas"].dtype == np.uint64
+    assert arrays["baseFeePerGas"].tolist() == [
+        int(value, 16) for value in RAW_FEE_HISTORY["baseFeePerGas"]
+    ]
+    assert arrays["gasUsedRatio"].dtype == np.float64
+    assert arrays["gasUsedRatio"].tolist() == RAW_FEE_HISTORY["gasUsedRatio"]
+    assert arrays["reward"].shape == (4, 2)
+    assert arrays["reward"].tolist() == [
+        [int(value, 16) for value in rewards] for rewards in RAW_FEE_HISTORY["reward"]
+    ]
+
+
+def test_eth_fee_history_as_arrays():
+    np = pytest.importorskip("numpy")
+    w3 = Web3(FeeHistoryProvider())
+
+    _assert_fee_history_arrays(
+        w3.eth.fee_history(4, "latest", [10, 90], as_arrays=True), np
+    )
+    # the default result is still formatted into Python ints
+    assert w3.eth.fee_history(4, "latest", [10, 90])["baseFeePerGas"][0] == int(
+        RAW_FEE_HISTORY["baseFeePerGas"][0], 16
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_eth_fee_history_as_arrays():
+    np = pytest.importorskip("numpy")
+    async_w3 = AsyncWeb3(AsyncFeeHistoryProvider())
+
+    _assert_fee_history_arrays(
+        await async_w3.eth.fee_history(4, "latest", [10, 90], as_arrays=True), np
+    )
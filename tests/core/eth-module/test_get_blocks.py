@@ -0,0 +1,191 @@
+import pytest
+import asyncio
+import threading
+import time
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3.exceptions import (
+    BlockNotFound,
+    Web3ValueError,
+)
+from web3.providers.async_base import (
+    AsyncJSONBaseProvider,
+)
+from web3.providers.base import (
+    JSONBaseProvider,
+)
+
+NUM_BLOCKS = 10
+
+
+def _raw_block(number):
+    return {
+        "number": hex(number),
+        "hash": "0x" + f"{number:064x}",
+        "parentHash": "0x" + f"{max(number - 1, 0):064x}",
+        "timestamp": hex(1_700_000_000 + 12 * number),
+        "gasUsed": hex(21_000 * number),
+        "miner": "0x" + "aa" * 20,
+        "transactions": ["0x" + "11" * 32] * number,
+    }
+
+
+def _make_response(request_id, method, params):
+    if method == "eth_getBlockByNumber":
+        number = int(params[0], 16)
+        result = _raw_block(number) if number < NUM_BLOCKS else None
+    else:
+        raise NotImplementedError(f"Cannot make request for {method}:{params}")
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+class FakeChainProvider(JSONBaseProvider):
+    def __init__(self, delay=0):
+        super().__init__()
+        self.delay = delay
+        self.requests = []
+        self.batch_sizes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def make_request(self, method, params):
+        return _make_response(0, method, params)
+
+    def make_batch_request(self, requests):
+        with self._lock:
+            self.requests.extend(requests)
+            self.batch_sizes.append(len(requests))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return [
+            _make_response(request_id, method, params)
+            for request_id, (method, params) in enumerate(requests)
+        ]
+
+
+class AsyncFakeChainProvider(AsyncJSONBaseProvider):
+    def __init__(self, delay=0):
+        super().__init__()
+        self.delay = delay
+        self.requests = []
+        self.batch_sizes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def make_request(self, method, params):
+        return _make_response(0, method, params)
+
+    async def make_batch_request(self, requests):
+        self.requests.extend(requests)
+        self.batch_sizes.append(len(requests))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return [
+            _make_response(request_id, method, params)
+            for request_id, (method, params) in enumerate(requests)
+        ]
+
+
+def test_get_blocks_yields_blocks_in_order():
+    provider = FakeChainProvider(delay=0.05)
+    w3 = Web3(provider)
+
+    blocks = list(w3.eth.get_blocks(0, 9, batch_size=3, max_concurrent_batches=2))
+
+    assert [block.number for block in blocks] == list(range(NUM_BLOCKS))
+    assert blocks[7].hash == (7).to_bytes(32, "big")
+    assert sorted(provider.batch_sizes) == [1, 3, 3, 3]
+    assert provider.max_in_flight == 2
+    assert all(params[1] is False for _method, params in provider.requests)
+
+
+def test_get_blocks_with_full_transactions():
+    provider = FakeChainProvider()
+    w3 = Web3(provider)
+
+    blocks = list(w3.eth.get_blocks(2, 4, full_transactions=True))
+
+    assert [block.number for block in blocks] == [2, 3, 4]
+    assert provider.batch_sizes == [3]
+    assert all(params[1] is True for _method, params in provider.requests)
+
+
+def test_get_blocks_prefetches_a_bounded_number_of_batches():
+    provider = FakeChainProvider()
+    w3 = Web3(provider)
+
+    blocks = w3.eth.get_blocks(0, 9, batch_size=1, max_concurrent_batches=2)
+    assert next(blocks).number == 0
+    blocks.close()
+
+    # the two initial batches and the one started when the first was consumed
+    assert len(provider.batch_sizes) <= 3
+
+
+def test_get_blocks_empty_range():
+    provider = FakeChainProvider()
+    w3 = Web3(provider)
+
+    assert list(w3.eth.get_blocks(5, 4)) == []
+    assert provider.batch_sizes == []
+
+
+def test_get_blocks_raises_for_missing_blocks():
+    w3 = Web3(FakeChainProvider())
+
+    with pytest.raises(BlockNotFound):
+        list(w3.eth.get_blocks(5, NUM_BLOCKS))
+
+
+@pytest.mark.parametrize(
+    "kwargs,match",
+    (
+        ({"batch_size": 0}, "`batch_size` must be a positive integer"),
+        ({"max_concurrent_batches": 0}, "`max_concurrent_batches` must be a positive"),
+    ),
+)
+def test_get_blocks_raises_for_invalid_arguments_before_iterating(kwargs, match):
+    w3 = Web3(FakeChainProvider())
+
+    with pytest.raises(Web3ValueError, match=match):
+        w3.eth.get_blocks(0, 9, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_async_get_blocks_yields_blocks_in_order():
+    provider = AsyncFakeChainProvider(delay=0.01)
+    async_w3 = AsyncWeb3(provider)
+
+    blocks = [
+        block
+        async for block in async_w3.eth.get_blocks(
+            0, 9, batch_size=4, max_concurrent_batches=2
+        )
+    ]
+
+    assert [block.number for block in blocks] == list(range(NUM_BLOCKS))
+    assert provider.batch_sizes == [4, 4, 2]
+    assert provider.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_async_get_blocks_stops_fetching_when_closed():
+    provider = AsyncFakeChainProvider(delay=0.01)
+    async_w3 = AsyncWeb3(provider)
+
+    blocks = async_w3.eth.get_blocks(0, 9, batch_size=1, max_concurrent_batches=2)
+    assert (await blocks.__anext__()).number == 0
+    await blocks.aclose()
+    await asyncio.sleep(0.05)
+
+    # no more batches are started once closed
+    assert len(provider.batch_sizes) <= 3
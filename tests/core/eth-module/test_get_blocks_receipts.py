@@ -0,0 +1,286 @@
+import pytest
+import asyncio
+import threading
+import time
+
+from web3 import (
+    AsyncWeb3,
+    Web3,
+)
+from web3.exceptions import (
+    Web3RPCError,
+    Web3ValueError,
+)
+from web3.providers.async_base import (
+    AsyncJSONBaseProvider,
+)
+from web3.providers.base import (
+    JSONBaseProvider,
+)
+
+NUM_BLOCKS = 10
+
+
+def _transaction_hash(block_number, index):
+    return "0x" + f"{block_number:032x}{index:032x}"
+
+
+def _raw_receipts(block_number):
+    return [
+        {
+            "blockHash": "0x" + f"{block_number:064x}",
+            "blockNumber": hex(block_number),
+            "transactionHash": _transaction_hash(block_number, index),
+            "transactionIndex": hex(index),
+            "status": "0x1",
+            "logs": [],
+        }
+        for index in range(block_number)
+    ]
+
+
+def _raw_block(number):
+    return {
+        "number": hex(number),
+        "hash": "0x" + f"{number:064x}",
+        "parentHash": "0x" + f"{max(number - 1, 0):064x}",
+        "timestamp": hex(1_700_000_000 + 12 * number),
+        "gasUsed": hex(21_000 * number),
+        "miner": "0x" + "aa" * 20,
+        "transactions": [_transaction_hash(number, index) for index in range(number)],
+    }
+
+
+METHOD_NOT_FOUND_ERROR = {
+    "code": -32601,
+    "message": "the method eth_getBlockReceipts does not exist",
+}
+
+
+def _make_response(request_id, method, params, block_receipts_error=None):
+    if method == "eth_getBlockReceipts" and block_receipts_error is not None:
+        return {"jsonrpc": "2.0", "id": request_id, "error": block_receipts_error}
+    elif method == "eth_getBlockReceipts":
+        number = int(params[0], 16)
+        result = _raw_receipts(number) if number < NUM_BLOCKS else None
+    elif method == "eth_getTransactionReceipt":
+        block_number, index = int(params[0][2:34], 16), int(params[0][34:], 16)
+        result = _raw_receipts(block_number)[index]
+    elif method == "eth_getBlockByNumber":
+        number = int(params[0], 16)
+        result = _raw_block(number) if number < NUM_BLOCKS else None
+    else:
+        raise NotImplementedError(f"Cannot make request for {method}:{params}")
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+class FakeChainProvider(JSONBaseProvider):
+    def __init__(
+        self, delay=0, supports_block_receipts=True, block_receipts_error=None
+    ):
+        super().__init__()
+        self.delay = delay
+        if block_receipts_error is None and not supports_block_receipts:
+            block_receipts_error = METHOD_NOT_FOUND_ERROR
+        self.block_receipts_error = block_receipts_error
+        # requests made on their own rather than as part of a batch
+        self.single_requests = []
+        self.requests = []
+        self.batch_sizes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def make_request(self, method, params):
+        self.single_requests.append((method, params))
+        return _make_response(0, method, params, self.block_receipts_error)
+
+    def make_batch_request(self, requests):
+        with self._lock:
+            self.requests.extend(requests)
+            self.batch_sizes.append(len(requests))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return [
+            _make_response(request_id, method, params, self.block_receipts_error)
+            for request_id, (method, params) in enumerate(requests)
+        ]
+
+
+class AsyncFakeChainProvider(AsyncJSONBaseProvider):
+    def __init__(
+        self, delay=0, supports_block_receipts=True, block_receipts_error=None
+    ):
+        super().__init__()
+        self.delay = delay
+        if block_receipts_error is None and not supports_block_receipts:
+            block_receipts_error = METHOD_NOT_FOUND_ERROR
+        self.block_receipts_error = block_receipts_error
+        # requests made on their own rather than as part of a batch
+        self.single_requests = []
+        self.requests = []
+        self.batch_sizes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def make_request(self, method, params):
+        self.single_requests.append((method, params))
+        return _make_response(0, method, params, self.block_receipts_error)
+
+    async def make_batch_request(self, requests):
+        self.requests.extend(requests)
+        self.batch_sizes.append(len(requests))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return [
+            _make_response(request_id, method, params, self.block_receipts_error)
+            for request_id, (method, params) in enumerate(requests)
+        ]
+
+
+def _transaction_hashes(blocks_receipts):
+    return [
+        [receipt.transactionHash.to_0x_hex() for receipt in block_receipts]
+        for block_receipts in blocks_receipts
+    ]
+
+
+EXPECTED_TRANSACTION_HASHES = [
+    [_transaction_hash(number, index) for index in range(number)]
+    for number in range(NUM_BLOCKS)
+]
+
+
+def test_get_blocks_receipts_with_block_receipts():
+    provider = FakeChainProvider()
+    w3 = Web3(provider)
+
+    blocks_receipts = list(w3.eth.get_blocks_receipts(0, 9, batch_size=4))
+
+    assert _transaction_hashes(blocks_receipts) == EXPECTED_TRANSACTION_HASHES
+    # support is detected with one request for the first block, whose receipts are
+    # not requested again
+    assert provider.single_requests == [("eth_getBlockReceipts", ("0x0",))]
+    assert provider.batch_sizes == [4, 4, 1]
+    assert [params[0] for _method, params in provider.requests] == [
+        hex(number) for number in range(1, NUM_BLOCKS)
+    ]
+    assert {method for method, _params in provider.requests} == {"eth_getBlockReceipts"}
+
+
+def test_get_blocks_receipts_falls_back_to_transaction_receipts():
+    provider = FakeChainProvider(supports_block_receipts=False)
+    w3 = Web3(provider)
+
+    blocks_receipts = list(
+        w3.eth.get_blocks_receipts(0, 9, batch_size=4, max_concurrent_batches=2)
+    )
+
+    assert _transaction_hashes(blocks_receipts) == EXPECTED_TRANSACTION_HASHES
+    assert blocks_receipts[3][2].blockNumber == 3
+    assert provider.single_requests == [("eth_getBlockReceipts", ("0x0",))]
+    transaction_receipt_requests = [
+        params
+        for method, params in provider.requests
+        if method == "eth_getTransactionReceipt"
+    ]
+    assert len(transaction_receipt_requests) == sum(range(NUM_BLOCKS))
+    assert max(provider.batch_sizes) <= 4
+
+
+@pytest.mark.parametrize(
+    "block_receipts_error",
+    (
+        METHOD_NOT_FOUND_ERROR,
+        {"code": -32000, "message": "Unsupported method: eth_getBlockReceipts"},
+        {"code": -32600, "message": "Method not found"},
+    ),
+)
+def test_get_blocks_receipts_falls_back_for_unsupported_method_errors(
+    block_receipts_error,
+):
+    provider = FakeChainProvider(block_receipts_error=block_receipts_error)
+    w3 = Web3(provider)
+
+    blocks_receipts = list(w3.eth.get_blocks_receipts(0, 9))
+
+    assert _transaction_hashes(blocks_receipts) == EXPECTED_TRANSACTION_HASHES
+    assert {method for method, _params in provider.requests} == {
+        "eth_getBlockByNumber",
+        "eth_getTransactionReceipt",
+    }
+
+
+def test_get_blocks_receipts_raises_other_errors():
+    provider = FakeChainProvider(
+        block_receipts_error={"code": -32000, "message": "header not found"}
+    )
+    w3 = Web3(provider)
+
+    with pytest.raises(Web3RPCError, match="header not found"):
+        list(w3.eth.get_blocks_receipts(0, 9))
+    assert w3.eth._cached_block_receipts_support() is None
+
+
+def test_get_blocks_receipts_detects_block_receipts_support_once_per_provider():
+    provider = FakeChainProvider(supports_block_receipts=False)
+    w3 = Web3(provider)
+
+    list(w3.eth.get_blocks_receipts(0, 4))
+    list(w3.eth.get_blocks_receipts(5, 9))
+    assert len(provider.single_requests) == 1
+
+    w3.provider = FakeChainProvider()
+    list(w3.eth.get_blocks_receipts(0, 4))
+    assert w3.provider.single_requests == [("eth_getBlockReceipts", ("0x0",))]
+    assert {method for method, _params in w3.provider.requests} == {
+        "eth_getBlockReceipts"
+    }
+
+
+def test_get_blocks_receipts_empty_range():
+    provider = FakeChainProvider()
+    w3 = Web3(provider)
+
+    assert list(w3.eth.get_blocks_receipts(5, 4)) == []
+    assert provider.single_requests == []
+
+
+def test_get_blocks_receipts_raises_for_invalid_arguments_before_iterating():
+    w3 = Web3(FakeChainProvider())
+
+    with pytest.raises(Web3ValueError, match="`batch_size` must be a positive"):
+        w3.eth.get_blocks_receipts(0, 9, batch_size=0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("supports_block_receipts", (True, False))
+async def test_async_get_blocks_receipts(supports_block_receipts):
+    provider = AsyncFakeChainProvider(
+        delay=0.01, supports_block_receipts=supports_block_receipts
+    )
+    async_w3 = AsyncWeb3(provider)
+
+    blocks_receipts = [
+        block_receipts
+        async for block_receipts in async_w3.eth.get_blocks_receipts(
+            0, 9, batch_size=3, max_concurrent_batches=2
+        )
+    ]
+    # support is only detected for the first range
+    async for _block_receipts in async_w3.eth.get_blocks_receipts(0, 1):
+        pass
+
+    assert _transaction_hashes(blocks_receipts) == EXPECTED_TRANSACTION_HASHES
+    assert provider.single_requests == [("eth_getBlockReceipts", ("0x0",))]
+    assert provider.max_in_flight == 2
+    if supports_block_receipts:
+        # the first range does not request the receipts of block 0 again
+        assert [params[0] for _method, params in provider.requests][:9] == [
+            hex(number) for number in range(1, NUM_BLOCKS)
+        ]
@@ -1,6 +1,7 @@
 import pytest
 from inspect import (
     isclass,
+    iscoroutinefunction,
 )
 
 from eth_utils.toolz import (
@@ -8,10 +9,13 @@ from eth_utils.toolz import (
 )
 
 from web3 import (
+    AsyncBaseProvider,
+    AsyncWeb3,
     EthereumTesterProvider,
     Web3,
 )
 from web3.exceptions import (
+    Web3TypeError,
     Web3ValidationError,
     Web3ValueError,
 )
@@ -380,8 +384,68 @@ def test_munger_class_method_access_raises_friendly_error():
         FakeModule.method(1, 2)
 
 
+def test_calling_a_method_instance_raises_friendly_error():
+    method = Method("eth_chainId")
+
+    with pytest.raises(Web3TypeError, match="Call it through the module"):
+        method()
+
+
+def test_methods_bound_to_async_modules_are_coroutine_functions():
+    async_w3 = AsyncWeb3(AsyncBaseProvider())
+    async_w3.eth.attach_methods({"custom_method": Method("eth_custom")})
+
+    assert iscoroutinefunction(async_w3.eth._get_balance)
+    assert iscoroutinefunction(async_w3.eth.custom_method)
+    assert not iscoroutinefunction(Web3(EthereumTesterProvider()).eth._get_balance)
+
+
 def test_munger_arguments_by_keyword(dummy_w3):
     with pytest.raises(Success):
         dummy_w3.fake.method(keyword_one=1, keyword_two="latest")
     with pytest.raises(Success):
         dummy_w3.fake.method(1, keyword_two=2)
+
+
+def test_process_params_composes_formatters_once_per_module(dummy_w3):
+    requested = []
+
+    def request_formatters(method):
+        requested.append(method)
+        return compose()
+
+    method = Method("eth_chainId", request_formatters=request_formatters)
+
+    for _ in range(3):
+        (method_str, _params), _formatters = method.process_params(dummy_w3.fake)
+        assert method_str == "eth_chainId"
+    assert requested == ["eth_chainId"]
+
+    # formatters are cached per module
+    other_w3 = Web3(EthereumTesterProvider(), modules={"fake": FakeModule})
+    method.process_params(other_w3.fake)
+    assert requested == ["eth_chainId", "eth_chainId"]
+
+
+def test_method_is_bound_once_per_module(dummy_w3):
+    assert dummy_w3.fake.method is dummy_w3.fake.method
+
+    other_w3 = Web3(EthereumTesterProvider(), modules={"fake": FakeModule})
+    assert other_w3.fake.method is not dummy_w3.fake.method
+
+
+def test_process_params_does_not_store_the_selected_method(dummy_w3):
+    method = Method(
+        mungers=[default_root_munger],
+        method_choice_depends_on_args=lambda value: (
+            "eth_getBlockByHash" if isinstance(value, bytes) else "eth_getBlockByNumber"
+        ),
+    )
+
+    (method_str, _params), _formatters = method.process_params(
+        dummy_w3.fake, b"\x00" * 32, False
+    )
+    assert method_str == "eth_getBlockByHash"
+    (method_str, _params), _formatters = method.process_params(dummy_w3.fake, 1, False)
+    assert method_str == "eth_getBlockByNumber"
+    assert method.json_rpc_method is None
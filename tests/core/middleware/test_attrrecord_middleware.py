@@ -0,0 +1,191 @@
+import pytest
+
+from web3 import (
+    AsyncBaseProvider,
+    AsyncWeb3,
+    Web3,
+)
+from web3.datastructures import (
+    AttributeDict,
+)
+from web3.middleware import (
+    AttributeRecordMiddleware,
+)
+from web3.middleware.attrrecord import (
+    BlockDataRecord,
+    LogReceiptRecord,
+    TxDataRecord,
+    TxReceiptRecord,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+
+BLOCK_HASH = "0x" + "11" * 32
+TX_HASH = "0x" + "22" * 32
+TOPIC = "0x" + "33" * 32
+ADDRESS = "0x" + "44" * 20
+
+RAW_LOG = {
+    "address": ADDRESS,
+    "blockHash": BLOCK_HASH,
+    "blockNumber": "0x1",
+    "data": "0x",
+    "logIndex": "0x0",
+    "removed": False,
+    "topics": [TOPIC],
+    "transactionHash": TX_HASH,
+    "transactionIndex": "0x0",
+}
+RAW_TRANSACTION = {
+    "blockHash": BLOCK_HASH,
+    "blockNumber": "0x1",
+    "from": ADDRESS,
+    "gas": "0x5208",
+    "gasPrice": "0x1",
+    "hash": TX_HASH,
+    "input": "0x",
+    "nonce": "0x0",
+    "to": ADDRESS,
+    "transactionIndex": "0x0",
+    "value": "0x1",
+    "type": "0x0",
+    "v": "0x1b",
+    "r": TOPIC,
+    "s": TOPIC,
+}
+RAW_RECEIPT = {
+    "blockHash": BLOCK_HASH,
+    "blockNumber": "0x1",
+    "contractAddress": None,
+    "cumulativeGasUsed": "0x5208",
+    "effectiveGasPrice": "0x1",
+    "from": ADDRESS,
+    "gasUsed": "0x5208",
+    "logs": [RAW_LOG],
+    "logsBloom": "0x" + "00" * 256,
+    "status": "0x1",
+    "to": ADDRESS,
+    "transactionHash": TX_HASH,
+    "transactionIndex": "0x0",
+    "type": "0x0",
+}
+RAW_BLOCK = {
+    "hash": BLOCK_HASH,
+    "number": "0x1",
+    "parentHash": BLOCK_HASH,
+    "timestamp": "0x1",
+    "transactions": [RAW_TRANSACTION],
+    "withdrawals": [
+        {"index": "0x0", "validatorIndex": "0x0", "address": ADDRESS, "amount": "0x1"}
+    ],
+    # not a ``BlockData`` field
+    "l1BlockNumber": "0x1",
+}
+MOCK_RESULTS = {
+    "eth_getBlockByNumber": RAW_BLOCK,
+    "eth_getTransactionReceipt": RAW_RECEIPT,
+    "eth_getLogs": [RAW_LOG],
+    "fake_endpoint": {"a": {"b": 1}},
+}
+
+
+class DummyProvider(BaseProvider):
+    def make_request(self, method, params):
+        raise NotImplementedError(f"Cannot make request for {method}:{params}")
+
+
+class AsyncDummyProvider(AsyncBaseProvider):
+    async def make_request(self, method, params):
+        raise NotImplementedError(f"Cannot make request for {method}:{params}")
+
+
+def _assert_block_records(block):
+    assert isinstance(block, BlockDataRecord)
+    assert not hasattr(block, "__dict__")
+    assert block.number == block["number"] == 1
+    assert block.l1BlockNumber == block["l1BlockNumber"] == "0x1"
+    assert "baseFeePerGas" not in block
+
+    transaction = block.transactions[0]
+    assert isinstance(transaction, TxDataRecord)
+    assert transaction["from"] == getattr(transaction, "from")
+    assert transaction.gas == 21000
+
+    assert isinstance(block.withdrawals[0], AttributeDict)
+    assert block.withdrawals[0].amount == 1
+
+
+def _assert_receipt_records(receipt):
+    assert isinstance(receipt, TxReceiptRecord)
+    assert receipt.status == 1
+    assert isinstance(receipt.logs[0], LogReceiptRecord)
+    assert receipt.logs[0].topics[0].to_0x_hex() == TOPIC
+
+
+def test_attrrecord_middleware_converts_results_to_records(request_mocker):
+    w3 = Web3(DummyProvider())
+    w3.middleware_onion.replace("attrdict", AttributeRecordMiddleware)
+
+    with request_mocker(w3, mock_results=MOCK_RESULTS):
+        block = w3.eth.get_block(1, True)
+        receipt = w3.eth.get_transaction_receipt(TX_HASH)
+        logs = w3.eth.get_logs({})
+        other = w3.manager.request_blocking("fake_endpoint", [])
+
+    _assert_block_records(block)
+    _assert_receipt_records(receipt)
+    assert isinstance(logs[0], LogReceiptRecord)
+    assert logs[0] == receipt.logs[0]
+
+    assert isinstance(other, AttributeDict)
+    assert isinstance(other.a, AttributeDict)
+
+
+def test_attrrecord_results_share_repeated_values(request_mocker):
+    w3 = Web3(DummyProvider())
+    w3.middleware_onion.replace("attrdict", AttributeRecordMiddleware)
+    second_log = {**RAW_LOG, "logIndex": "0x1", "data": "0x01"}
+
+    with request_mocker(w3, mock_results={"eth_getLogs": [RAW_LOG, second_log]}):
+        first, second = w3.eth.get_logs({})
+
+    assert first.blockHash is second.blockHash
+    assert first.transactionHash is second.transactionHash
+    assert first.address is second.address
+    assert first.topics is not second.topics
+    assert first.topics[0] is second.topics[0]
+    assert first.data != second.data
+
+
+def test_attrrecord_results_equal_attrdict_results(request_mocker):
+    w3 = Web3(DummyProvider())
+    with request_mocker(w3, mock_results=MOCK_RESULTS):
+        attrdict_block = w3.eth.get_block(1, True)
+
+    w3.middleware_onion.replace("attrdict", AttributeRecordMiddleware)
+    with request_mocker(w3, mock_results=MOCK_RESULTS):
+        block = w3.eth.get_block(1, True)
+
+    assert isinstance(attrdict_block, AttributeDict)
+    assert block == attrdict_block
+    assert attrdict_block == block
+    assert hash(block) == hash(attrdict_block)
+    assert dict(block) == dict(attrdict_block)
+
+
+@pytest.mark.asyncio
+async def test_async_attrrecord_middleware_converts_results_to_records(
+    request_mocker,
+):
+    async_w3 = AsyncWeb3(AsyncDummyProvider())
+    async_w3.middleware_onion.replace("attrdict", AttributeRecordMiddleware)
+
+    async with request_mocker(async_w3, mock_results=MOCK_RESULTS):
+        block = await async_w3.eth.get_block(1, True)
+        receipt = await async_w3.eth.get_transaction_receipt(TX_HASH)
+        other = await async_w3.manager.coro_request("fake_endpoint", [])
+
+    _assert_block_records(block)
+    _assert_receipt_records(receipt)
+    assert isinstance(other, AttributeDict)
@@ -94,6 +94,20 @@ def test_formatting_middleware_result_formatters_for_none(w3, request_mocker):
     assert actual == expected
 
 
+def test_formatting_middleware_does_not_mutate_shared_responses(w3):
+    w3.middleware_onion.add(
+        FormattingMiddlewareBuilder.build(
+            result_formatters={"test_endpoint": lambda x: f"STATUS: {x}"}
+        )
+    )
+    shared_response = {"jsonrpc": "2.0", "id": 1, "result": "done"}
+    w3.provider.make_request = lambda *_: shared_response
+
+    assert w3.manager.request_blocking("test_endpoint", []) == "STATUS: done"
+    assert w3.manager.request_blocking("test_endpoint", []) == "STATUS: done"
+    assert shared_response["result"] == "done"
+
+
 def test_formatting_middleware_error_formatters(w3, request_mocker):
     w3.middleware_onion.add(
         FormattingMiddlewareBuilder.build(
@@ -4,11 +4,14 @@ from web3 import (
     Web3,
 )
 from web3.exceptions import (
+    BadResponseFormat,
     Web3ValueError,
 )
 from web3.middleware import (
     FormattingMiddlewareBuilder,
+    ValidationMiddleware,
     Web3Middleware,
+    combine_middleware,
 )
 
 
@@ -79,3 +82,81 @@ def test_unnamed_class_middleware_are_given_unique_keys(w3):
     with pytest.raises(Web3ValueError):
         # adding the same middleware again should cause an error
         w3.middleware_onion.add(MockMiddleware)
+
+
+def test_combine_middleware_skips_middleware_for_unhandled_methods():
+    processed = []
+
+    class BlockNumberMiddleware(Web3Middleware):
+        handled_methods = {"eth_blockNumber"}
+
+        def request_processor(self, method, params):
+            processed.append(method)
+            return method, params
+
+    class RenamingMiddleware(Web3Middleware):
+        handled_methods = {"eth_renamed"}
+
+        def request_processor(self, method, params):
+            return "eth_blockNumber", params
+
+    def provider_request_fn(method, params):
+        return {"jsonrpc": "2.0", "id": 1, "result": method}
+
+    request_fn = combine_middleware(
+        [RenamingMiddleware, BlockNumberMiddleware], Web3(), provider_request_fn
+    )
+
+    assert request_fn("eth_chainId", [])["result"] == "eth_chainId"
+    assert processed == []
+
+    assert request_fn("eth_blockNumber", [])["result"] == "eth_blockNumber"
+    assert processed == ["eth_blockNumber"]
+
+    # the rest of the pipeline follows a method changed by a middleware
+    assert request_fn("eth_renamed", [])["result"] == "eth_blockNumber"
+    assert processed == ["eth_blockNumber", "eth_blockNumber"]
+
+
+def test_batch_requests_skip_middleware_for_unhandled_methods():
+    processed = []
+
+    class BlockNumberMiddleware(Web3Middleware):
+        handled_methods = {"eth_blockNumber"}
+
+        def request_processor(self, method, params):
+            processed.append(("request", method))
+            return method, params
+
+        def response_processor(self, method, response):
+            processed.append(("response", method))
+            return response
+
+    def make_batch_request(requests):
+        return [
+            {"jsonrpc": "2.0", "id": i, "result": method}
+            for i, (method, _params) in enumerate(requests)
+        ]
+
+    batch_request_fn = BlockNumberMiddleware(Web3()).wrap_make_batch_request(
+        make_batch_request
+    )
+    responses = batch_request_fn([("eth_chainId", []), ("eth_blockNumber", [])])
+
+    assert [response["result"] for response in responses] == [
+        "eth_chainId",
+        "eth_blockNumber",
+    ]
+    assert processed == [
+        ("request", "eth_blockNumber"),
+        ("response", "eth_blockNumber"),
+    ]
+
+
+def test_validation_middleware_checks_responses_to_every_method():
+    request_fn = combine_middleware(
+        [ValidationMiddleware], Web3(), lambda method, params: "not a response"
+    )
+
+    with pytest.raises(BadResponseFormat, match="Malformed response"):
+        request_fn("eth_blockNumber", [])
@@ -3,6 +3,7 @@ from unittest.mock import (
     AsyncMock,
     patch,
 )
+import zlib
 
 from aiohttp import (
     ClientSession,
@@ -37,6 +38,9 @@ from web3.net import (
 from web3.providers.rpc import (
     AsyncHTTPProvider,
 )
+from web3.providers.rpc.utils import (
+    CompressionConfiguration,
+)
 
 URI = "http://mynode.local:8545"
 
@@ -129,3 +133,35 @@ async def test_async_http_empty_batch_response(mock_async_post):
             await batch.async_execute()
 
     assert not async_w3.provider._is_batching
+
+
+def test_async_compression_headers():
+    config = CompressionConfiguration(accept_encodings=("gzip",))
+    provider = AsyncHTTPProvider(URI, compression_configuration=config)
+    assert provider.get_request_kwargs()["headers"]["Accept-Encoding"] == "gzip"
+
+    provider.compression_configuration = None
+    assert provider.get_request_kwargs()["headers"]["Accept-Encoding"] == "identity"
+
+
+@patch(
+    "web3._utils.http_session_manager.HTTPSessionManager.async_make_post_request",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_async_http_batch_request_body_compression(mock_async_post):
+    mock_async_post.return_value = (
+        b'[{"jsonrpc":"2.0","id":0,"result":"0x1"},'
+        b'{"jsonrpc":"2.0","id":1,"result":"0x1"}]'
+    )
+    config = CompressionConfiguration(request_encoding="deflate", request_min_size=0)
+    async_w3 = AsyncWeb3(AsyncHTTPProvider(URI, compression_configuration=config))
+    async with async_w3.batch_requests() as batch:
+        batch.add(async_w3.eth.chain_id)
+        batch.add(async_w3.eth.block_number)
+        assert await batch.async_execute() == [1, 1]
+
+    _uri, request_data = mock_async_post.call_args.args
+    headers = mock_async_post.call_args.kwargs["headers"]
+    assert headers["Content-Encoding"] == "deflate"
+    assert b"eth_chainId" in zlib.decompress(request_data)
@@ -1,4 +1,5 @@
 import pytest
+import gzip
 from unittest.mock import (
     Mock,
     patch,
@@ -21,6 +22,7 @@ from web3.eth import (
 from web3.exceptions import (
     ProviderConnectionError,
     Web3RPCError,
+    Web3ValidationError,
 )
 from web3.geth import (
     Geth,
@@ -40,6 +42,9 @@ from web3.net import (
 from web3.providers import (
     HTTPProvider,
 )
+from web3.providers.rpc.utils import (
+    CompressionConfiguration,
+)
 
 URI = "http://mynode.local:8545"
 
@@ -133,3 +138,71 @@ def test_http_empty_batch_response(mock_post):
 
     # assert that even though there was an error, we have reset the batching state
     assert not w3.provider._is_batching
+
+
+def test_default_compression_headers():
+    provider = HTTPProvider(URI)
+    headers = provider.get_request_kwargs()["headers"]
+    assert headers["Accept-Encoding"] == "gzip, deflate"
+    assert headers["Content-Type"] == "application/json"
+
+
+def test_compression_disabled_requests_identity_encoding():
+    provider = HTTPProvider(URI, compression_configuration=None)
+    headers = provider.get_request_kwargs()["headers"]
+    assert headers["Accept-Encoding"] == "identity"
+
+
+def test_user_provided_headers_take_precedence_over_compression_headers():
+    provider = HTTPProvider(
+        URI,
+        request_kwargs={"headers": {"Accept-Encoding": "br"}, "timeout": 60},
+    )
+    request_kwargs = provider.get_request_kwargs()
+    assert request_kwargs["headers"] == {"Accept-Encoding": "br"}
+    assert request_kwargs["timeout"] == 60
+
+
+@patch(
+    "web3._utils.http_session_manager.HTTPSessionManager.make_post_request",
+    new_callable=Mock,
+)
+def test_http_request_body_compression(mock_post):
+    mock_post.return_value = b'{"jsonrpc":"2.0","id":0,"result":"0x1"}'
+    config = CompressionConfiguration(request_encoding="gzip", request_min_size=0)
+    w3 = Web3(HTTPProvider(URI, compression_configuration=config))
+
+    assert w3.eth.block_number == 1
+
+    _uri, request_data = mock_post.call_args.args
+    headers = mock_post.call_args.kwargs["headers"]
+    assert headers["Content-Encoding"] == "gzip"
+    assert b"eth_blockNumber" in gzip.decompress(request_data)
+
+
+@patch(
+    "web3._utils.http_session_manager.HTTPSessionManager.make_post_request",
+    new_callable=Mock,
+)
+def test_http_request_body_below_min_size_is_not_compressed(mock_post):
+    mock_post.return_value = b'{"jsonrpc":"2.0","id":0,"result":"0x1"}'
+    config = CompressionConfiguration(request_encoding="gzip")
+    w3 = Web3(HTTPProvider(URI, compression_configuration=config))
+
+    assert w3.eth.block_number == 1
+
+    _uri, request_data = mock_post.call_args.args
+    assert "Content-Encoding" not in mock_post.call_args.kwargs["headers"]
+    assert b"eth_blockNumber" in request_data
+
+
+@pytest.mark.parametrize(
+    "config_kwargs",
+    (
+        {"accept_encodings": ("gzip", "compress")},
+        {"request_encoding": "zstd"},
+    ),
+)
+def test_compression_configuration_validates_encodings(config_kwargs):
+    with pytest.raises(Web3ValidationError):
+        CompressionConfiguration(**config_kwargs)
@@ -0,0 +1,149 @@
+import pytest
+import asyncio
+import json
+
+from web3.exceptions import (
+    Web3ValidationError,
+)
+from web3.providers.persistent import (
+    RequestPriority,
+    RequestSchedulingConfiguration,
+    WebSocketProvider,
+)
+from web3.providers.persistent.request_scheduler import (
+    RequestScheduler,
+)
+from web3.types import (
+    RPCEndpoint,
+)
+
+
+class SlowSocket:
+    """Records sent payloads; each send yields to the loop like a busy socket."""
+
+    def __init__(self) -> None:
+        self.sent: list[bytes] = []
+
+    async def send(self, request_data: bytes) -> None:
+        await asyncio.sleep(0)
+        self.sent.append(request_data)
+
+
+async def _send_all(scheduler, requests):
+    await asyncio.gather(
+        *(scheduler.send(data, priority) for data, priority in requests)
+    )
+
+
+@pytest.mark.asyncio
+async def test_strict_priority_overtakes_queued_requests():
+    socket = SlowSocket()
+    scheduler = RequestScheduler(socket.send, RequestSchedulingConfiguration())
+
+    await _send_all(
+        scheduler,
+        [
+            (b"low-1", RequestPriority.LOW),
+            (b"low-2", RequestPriority.LOW),
+            (b"normal", RequestPriority.NORMAL),
+            (b"high", RequestPriority.HIGH),
+        ],
+    )
+    assert socket.sent == [b"high", b"normal", b"low-1", b"low-2"]
+    assert len(scheduler) == 0
+
+
+@pytest.mark.asyncio
+async def test_weighted_priority_does_not_starve_low_priority_lanes():
+    socket = SlowSocket()
+    config = RequestSchedulingConfiguration(
+        weights={
+            RequestPriority.HIGH: 2,
+            RequestPriority.NORMAL: 1,
+            RequestPriority.LOW: 1,
+        }
+    )
+    scheduler = RequestScheduler(socket.send, config)
+
+    await _send_all(
+        scheduler,
+        [(b"low", RequestPriority.LOW)]
+        + [(f"high-{i}".encode(), RequestPriority.HIGH) for i in range(4)],
+    )
+    # the low priority request is sent once the high lane has used up its weight
+    assert socket.sent == [b"high-0", b"high-1", b"low", b"high-2", b"high-3"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_propagates_send_errors():
+    async def failing_send(_request_data):
+        raise ConnectionError("socket closed")
+
+    scheduler = RequestScheduler(failing_send, RequestSchedulingConfiguration())
+    with pytest.raises(ConnectionError, match="socket closed"):
+        await scheduler.send(b"data", RequestPriority.HIGH)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_clear_cancels_waiting_requests():
+    blocker = asyncio.Event()
+
+    async def blocked_send(_request_data):
+        await blocker.wait()
+
+    scheduler = RequestScheduler(blocked_send, RequestSchedulingConfiguration())
+    first = asyncio.create_task(scheduler.send(b"1", RequestPriority.NORMAL))
+    second = asyncio.create_task(scheduler.send(b"2", RequestPriority.NORMAL))
+    # let both requests queue up and the sender pick up the first one
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert scheduler.queue_depths()[RequestPriority.NORMAL] == 1
+
+    scheduler.clear()
+    for task in (first, second):
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert len(scheduler) == 0
+
+
+def test_scheduling_configuration_priorities():
+    config = RequestSchedulingConfiguration()
+    assert config.get_priority(RPCEndpoint("eth_sendRawTransaction")) == (
+        RequestPriority.HIGH
+    )
+    assert config.get_priority(RPCEndpoint("eth_getLogs")) == RequestPriority.LOW
+    assert config.get_priority(RPCEndpoint("eth_chainId")) == RequestPriority.NORMAL
+    assert (
+        config.get_batch_priority([RPCEndpoint("eth_getLogs"), RPCEndpoint("eth_call")])
+        == RequestPriority.HIGH
+    )
+
+
+@pytest.mark.parametrize(
+    "weights",
+    (
+        {RequestPriority.HIGH: 1},
+        {RequestPriority.HIGH: 1, RequestPriority.NORMAL: 0, RequestPriority.LOW: 1},
+    ),
+)
+def test_scheduling_configuration_validates_weights(weights):
+    with pytest.raises(Web3ValidationError):
+        RequestSchedulingConfiguration(weights=weights)
+
+
+@pytest.mark.asyncio
+async def test_persistent_provider_sends_through_scheduler():
+    provider = WebSocketProvider(
+        "ws://mocked",
+        request_scheduling_configuration=RequestSchedulingConfiguration(),
+    )
+    socket = SlowSocket()
+    provider.socket_send = socket.send
+
+    await asyncio.gather(
+        provider.send_request(RPCEndpoint("eth_getLogs"), [{}]),
+        provider.send_request(RPCEndpoint("eth_getLogs"), [{}]),
+        provider.send_request(RPCEndpoint("eth_sendRawTransaction"), ["0x00"]),
+    )
+    sent_methods = [json.loads(data)["method"] for data in socket.sent]
+    assert sent_methods == ["eth_sendRawTransaction", "eth_getLogs", "eth_getLogs"]
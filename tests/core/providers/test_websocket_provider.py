@@ -24,6 +24,7 @@ from web3 import (
 from web3._utils.caching import (
     RequestInformation,
     generate_cache_key,
+    generate_request_cache_key,
 )
 from web3._utils.module_testing.module_testing_utils import (
     WebSocketMessageStreamMock,
@@ -31,15 +32,24 @@ from web3._utils.module_testing.module_testing_utils import (
 from web3.exceptions import (
     TimeExhausted,
     Web3RPCError,
+    Web3ValidationError,
 )
 from web3.providers.persistent import (
+    SubscriptionQueueOverflowPolicy,
     WebSocketProvider,
 )
+from web3.providers.persistent.websocket import (
+    WebSocketCompressionConfiguration,
+)
 from web3.types import (
     RPCEndpoint,
 )
 from web3.utils import (
     EthSubscription,
+    SimpleCache,
+)
+from web3.utils.subscriptions import (
+    NewHeadsSubscription,
 )
 
 
@@ -86,6 +96,35 @@ def test_websocket_provider_default_values():
         assert provider.use_text_frames is False
 
 
+def test_websocket_provider_compression_configuration():
+    provider = WebSocketProvider("ws://mocked")
+    # library defaults are used when not configured
+    assert "compression" not in provider.websocket_kwargs
+    assert "extensions" not in provider.websocket_kwargs
+
+    provider = WebSocketProvider("ws://mocked", compression_configuration=None)
+    assert provider.websocket_kwargs["compression"] is None
+
+    provider = WebSocketProvider(
+        "ws://mocked",
+        compression_configuration=WebSocketCompressionConfiguration(
+            client_max_window_bits=12, compress_settings={"memLevel": 4}
+        ),
+    )
+    (extension,) = provider.websocket_kwargs["extensions"]
+    assert extension.client_max_window_bits == 12
+    assert extension.compress_settings == {"memLevel": 4}
+
+
+def test_websocket_provider_compression_configuration_conflicts_with_kwargs():
+    with pytest.raises(Web3ValidationError, match="compression"):
+        WebSocketProvider(
+            "ws://mocked",
+            websocket_kwargs={"compression": None},
+            compression_configuration=WebSocketCompressionConfiguration(),
+        )
+
+
 @pytest.mark.asyncio
 async def test_disconnect_cleanup():
     provider = WebSocketProvider("ws://mocked")
@@ -184,6 +223,391 @@ async def test_async_make_request_times_out_of_while_loop_looking_for_response()
         await method_under_test(RPCEndpoint("some_method"), ["desired_params"])
 
 
+@pytest.mark.asyncio
+async def test_per_method_request_timeout():
+    provider = WebSocketProvider(
+        "ws://mocked",
+        request_timeout=30,
+        request_timeouts={RPCEndpoint("eth_call"): 0.001},
+    )
+    _mock_ws(provider)
+
+    assert provider.get_request_timeout(RPCEndpoint("eth_call")) == 0.001
+    assert provider.get_request_timeout(RPCEndpoint("eth_chainId")) == 30
+    with pytest.raises(TimeExhausted, match=r"after 0.001 second\(s\)"):
+        await provider.make_request(RPCEndpoint("eth_call"), [{}, "latest"])
+
+
+@pytest.mark.asyncio
+async def test_timed_out_request_is_deregistered_and_late_response_dropped():
+    provider = WebSocketProvider("ws://mocked", request_timeout=0.001)
+    _mock_ws(provider)
+    request_processor = provider._request_processor
+
+    # an in-flight request that is still being waited on
+    request_processor._request_information_cache.cache(
+        generate_cache_key(100), RequestInformation("eth_chainId", [], ((), (), ()))
+    )
+
+    rpc_request = await provider.send_request(RPCEndpoint("eth_call"), [])
+    request_processor.cache_request_information(
+        rpc_request["id"], "eth_call", [], ((), (), ())
+    )
+    with pytest.raises(TimeExhausted):
+        await provider.recv_for_request(rpc_request)
+
+    # only the live request remains registered
+    assert len(request_processor._request_information_cache) == 1
+    assert generate_cache_key(100) in request_processor._request_information_cache
+
+    # the late response is dropped on arrival instead of taking up a cache slot
+    await request_processor.cache_raw_response(
+        {"jsonrpc": "2.0", "id": rpc_request["id"], "result": "0x1"}
+    )
+    assert len(request_processor._request_response_cache) == 0
+    assert len(request_processor._cancelled_request_cache) == 0
+
+
+def test_request_information_kept_only_for_responses_from_request_cache():
+    provider = WebSocketProvider("ws://mocked")
+    request_processor = provider._request_processor
+    provider._request_cache = SimpleCache(10_000)
+    for i in range(10_000):
+        provider._request_cache.cache(
+            generate_request_cache_key("eth_getBalance", [f"0x{i:040x}", "latest"]),
+            {"jsonrpc": "2.0", "id": i, "result": "0x0"},
+        )
+
+    cached_response = {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+    provider._request_cache.cache(
+        generate_request_cache_key("eth_chainId", []), cached_response
+    )
+    for request_id, method in ((1, "eth_chainId"), (2, "eth_blockNumber")):
+        request_processor._request_information_cache.cache(
+            generate_cache_key(request_id),
+            RequestInformation(method, [], ((), (), ())),
+        )
+
+    # cached responses keep their request information for future cache hits
+    info = request_processor.get_request_information_for_response(cached_response)
+    assert info.method == "eth_chainId"
+    assert generate_cache_key(1) in request_processor._request_information_cache
+
+    # other responses pop their request information
+    info = request_processor.get_request_information_for_response(
+        {"jsonrpc": "2.0", "id": 2, "result": "0x1"}
+    )
+    assert info.method == "eth_blockNumber"
+    assert generate_cache_key(2) not in request_processor._request_information_cache
+
+
+def test_request_information_not_cached_again_for_cached_requests():
+    provider = WebSocketProvider("ws://mocked")
+    request_processor = provider._request_processor
+    provider._request_cache.cache(
+        generate_request_cache_key("eth_chainId", []),
+        {"jsonrpc": "2.0", "id": 1, "result": "0x1"},
+    )
+
+    # the first request for the cached response is cached as usual
+    assert request_processor.cache_request_information(
+        1, "eth_chainId", [], ((), (), ())
+    ) == generate_cache_key(1)
+    # later identical requests are served from the request cache
+    assert (
+        request_processor.cache_request_information(2, "eth_chainId", [], ((), (), ()))
+        is None
+    )
+    assert generate_cache_key(2) not in request_processor._request_information_cache
+    assert len(request_processor._request_information_cache) == 1
+
+
+class QueuedWebSocketConnection:
+    """
+    Mocked websocket connection that reads from a shared queue, raising any queued
+    exceptions, and records all sent messages.
+    """
+
+    def __init__(self, messages, sent):
+        self.state = State.OPEN
+        self._messages = messages
+        self._sent = sent
+
+    async def recv(self):
+        message = await self._messages.get()
+        if isinstance(message, Exception):
+            self.state = State.CLOSED
+            raise message
+        return json.dumps(message)
+
+    async def send(self, data):
+        self._sent.append(json.loads(data))
+
+    async def close(self):
+        self.state = State.CLOSED
+
+    @staticmethod
+    async def wait_for_sent(sent, count):
+        for _ in range(100):
+            if len(sent) >= count:
+                return
+            await asyncio.sleep(0)
+        raise AssertionError(f"Expected {count} sent messages, got: {sent}")
+
+
+@pytest.mark.asyncio
+async def test_auto_reconnect_replays_in_flight_requests_and_resubscribes():
+    messages = asyncio.Queue()
+    sent = []
+    connections = []
+
+    async def _connect(*_args, **_kwargs):
+        connections.append(QueuedWebSocketConnection(messages, sent))
+        return connections[-1]
+
+    provider = WebSocketProvider("ws://mocked", auto_reconnect=True)
+    async_w3 = AsyncWeb3(provider)
+    with patch("web3.providers.persistent.websocket.connect", new=_connect):
+        await provider.connect()
+
+        # an active subscription, as left behind by the subscription manager
+        sub = EthSubscription(subscription_params=("newHeads",))
+        sub._id = "0xold"
+        async_w3.subscription_manager._add_subscription(sub)
+        request_info = RequestInformation("eth_subscribe", ["newHeads"], ((), (), ()))
+        request_info.subscription_id = "0xold"
+        provider._request_processor._request_information_cache.cache(
+            generate_cache_key("0xold"), request_info
+        )
+
+        request_task = asyncio.create_task(
+            provider.make_request(RPCEndpoint("eth_blockNumber"), [])
+        )
+        await QueuedWebSocketConnection.wait_for_sent(sent, 1)
+        assert sent[0]["method"] == "eth_blockNumber"
+
+        # drop the connection before the response arrives
+        messages.put_nowait(ConnectionClosed(None, None))
+        await QueuedWebSocketConnection.wait_for_sent(sent, 3)
+
+        assert len(connections) == 2
+        # the in-flight request is replayed with its original id
+        assert sent[1] == sent[0]
+        # the subscription is re-established on the new connection
+        resubscribe = sent[2]
+        assert resubscribe["method"] == "eth_subscribe"
+        assert resubscribe["params"] == ["newHeads"]
+
+        messages.put_nowait({"jsonrpc": "2.0", "id": sent[0]["id"], "result": "0x1"})
+        messages.put_nowait(
+            {"jsonrpc": "2.0", "id": resubscribe["id"], "result": "0xnew"}
+        )
+        response = await asyncio.wait_for(request_task, 1)
+        assert response["result"] == "0x1"
+
+        await asyncio.wait_for(provider._connection_restore_task, 1)
+        assert sub.id == "0xnew"
+        assert async_w3.subscription_manager.get_by_id("0xnew") is sub
+        assert async_w3.subscription_manager.get_by_id("0xold") is None
+        request_info_cache = provider._request_processor._request_information_cache
+        assert generate_cache_key("0xold") not in request_info_cache
+        assert (
+            request_info_cache.get_cache_entry(generate_cache_key("0xnew"))
+            is request_info
+        )
+        assert provider._in_flight_requests == {}
+
+        await provider.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_auto_reconnect_does_not_replay_requests_with_side_effects():
+    messages = asyncio.Queue()
+    sent = []
+
+    async def _connect(*_args, **_kwargs):
+        return QueuedWebSocketConnection(messages, sent)
+
+    provider = WebSocketProvider("ws://mocked", auto_reconnect=True)
+    with patch("web3.providers.persistent.websocket.connect", new=_connect):
+        await provider.connect()
+
+        request_tasks = [
+            asyncio.create_task(provider.make_request(RPCEndpoint(method), params))
+            for method, params in (
+                ("eth_sendRawTransaction", ["0x01"]),
+                ("eth_newFilter", [{}]),
+                ("eth_blockNumber", []),
+            )
+        ]
+        await QueuedWebSocketConnection.wait_for_sent(sent, 3)
+
+        messages.put_nowait(ConnectionClosed(None, None))
+        await QueuedWebSocketConnection.wait_for_sent(sent, 4)
+        # give any further replays a chance to be sent
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert [request["method"] for request in sent[3:]] == ["eth_blockNumber"]
+        assert list(provider._in_flight_requests.values()) == [sent[2]]
+
+        for task in request_tasks:
+            task.cancel()
+        await provider.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_auto_reconnect_replays_request_lost_while_sending():
+    messages = asyncio.Queue()
+    sent = []
+
+    class LostOnFirstSendConnection(QueuedWebSocketConnection):
+        lost = False
+
+        async def send(self, data):
+            if not LostOnFirstSendConnection.lost:
+                LostOnFirstSendConnection.lost = True
+                messages.put_nowait(ConnectionClosed(None, None))
+                raise ConnectionClosed(None, None)
+            await super().send(data)
+
+    async def _connect(*_args, **_kwargs):
+        return LostOnFirstSendConnection(messages, sent)
+
+    provider = WebSocketProvider("ws://mocked", auto_reconnect=True)
+    with patch("web3.providers.persistent.websocket.connect", new=_connect):
+        await provider.connect()
+
+        request_task = asyncio.create_task(
+            provider.make_request(RPCEndpoint("eth_blockNumber"), [])
+        )
+        # nothing reaches the first connection; the request is sent on the new one
+        await QueuedWebSocketConnection.wait_for_sent(sent, 1)
+        assert sent[0]["method"] == "eth_blockNumber"
+
+        messages.put_nowait({"jsonrpc": "2.0", "id": sent[0]["id"], "result": "0x1"})
+        response = await asyncio.wait_for(request_task, 1)
+        assert response["result"] == "0x1"
+        assert provider._in_flight_requests == {}
+
+        await provider.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_resubscribe_failure_does_not_stop_other_subscriptions(caplog):
+    caplog.set_level("INFO")
+    provider = WebSocketProvider("ws://mocked")
+    async_w3 = AsyncWeb3(provider)
+    for sub_id, params in (("0xa", ["newHeads"]), ("0xb", ["newPendingTransactions"])):
+        sub = EthSubscription(subscription_params=tuple(params))
+        sub._id = sub_id
+        async_w3.subscription_manager._add_subscription(sub)
+        request_info = RequestInformation("eth_subscribe", params, ((), (), ()))
+        request_info.subscription_id = sub_id
+        provider._request_processor._request_information_cache.cache(
+            generate_cache_key(sub_id), request_info
+        )
+
+    sent = []
+
+    async def socket_send(request_data):
+        request = json.loads(request_data)
+        if request["params"] == ["newHeads"]:
+            raise ConnectionClosed(None, None)
+        sent.append(request)
+
+    provider.socket_send = socket_send
+    provider._get_response_for_request_id = AsyncMock(
+        return_value={"jsonrpc": "2.0", "id": 2, "result": "0xnew"}
+    )
+
+    await asyncio.wait_for(provider._resubscribe(), 1)
+
+    assert [request["params"] for request in sent] == [["newPendingTransactions"]]
+    assert "Failed to re-establish subscription after reconnect" in caplog.text
+    assert "subscription_id=0xa" in caplog.text
+    assert "Re-established 1 of 2 subscription(s) after reconnect." in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_auto_reconnect_backfills_missed_headers_before_live_headers():
+    messages = asyncio.Queue()
+    sent = []
+
+    async def _connect(*_args, **_kwargs):
+        return QueuedWebSocketConnection(messages, sent)
+
+    def header_message(sub_id, number):
+        header = {"number": hex(number), "hash": f"0x{number:064x}"}
+        return {
+            "jsonrpc": "2.0",
+            "method": "eth_subscription",
+            "params": {"subscription": sub_id, "result": header},
+        }
+
+    provider = WebSocketProvider("ws://mocked", auto_reconnect=True)
+    async_w3 = AsyncWeb3(provider)
+    with patch("web3.providers.persistent.websocket.connect", new=_connect):
+        await provider.connect()
+
+        sub = NewHeadsSubscription()
+        sub._id = "0xold"
+        async_w3.subscription_manager._add_subscription(sub)
+        request_info = RequestInformation("eth_subscribe", ["newHeads"], ((), (), ()))
+        request_info.subscription_id = "0xold"
+        provider._request_processor._request_information_cache.cache(
+            generate_cache_key("0xold"), request_info
+        )
+
+        messages.put_nowait(header_message("0xold", 5))
+        messages.put_nowait(ConnectionClosed(None, None))
+        await QueuedWebSocketConnection.wait_for_sent(sent, 1)
+        assert sub.last_block_number == 5
+        assert sent[0]["method"] == "eth_subscribe"
+
+        # live headers arriving during the backfill are held back, and header 7,
+        # which is also backfilled, is only delivered once
+        messages.put_nowait({"jsonrpc": "2.0", "id": sent[0]["id"], "result": "0xnew"})
+        messages.put_nowait(header_message("0xnew", 7))
+        messages.put_nowait(header_message("0xnew", 8))
+
+        await QueuedWebSocketConnection.wait_for_sent(sent, 2)
+        assert sent[1]["method"] == "eth_blockNumber"
+        messages.put_nowait({"jsonrpc": "2.0", "id": sent[1]["id"], "result": "0x7"})
+        # the missed headers are fetched with one batch request
+        await QueuedWebSocketConnection.wait_for_sent(sent, 3)
+        assert [request["method"] for request in sent[2]] == [
+            "eth_getBlockByNumber"
+        ] * 2
+        assert [request["params"] for request in sent[2]] == [
+            ["0x6", False],
+            ["0x7", False],
+        ]
+        messages.put_nowait(
+            [
+                {
+                    "jsonrpc": "2.0",
+                    "id": request["id"],
+                    "result": header_message("0xnew", number)["params"]["result"],
+                }
+                for request, number in zip(sent[2], (6, 7))
+            ]
+        )
+
+        await asyncio.wait_for(provider._connection_restore_task, 1)
+        assert sub.id == "0xnew"
+        assert sub.last_block_number == 8
+
+        queue = provider._request_processor._subscription_response_queue
+        delivered = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert [
+            (response["params"]["subscription"], response["params"]["result"]["number"])
+            for response in delivered
+        ] == [("0xold", "0x5"), ("0xnew", "0x6"), ("0xnew", "0x7"), ("0xnew", "0x8")]
+
+        await provider.disconnect()
+
+
 @pytest.mark.asyncio
 async def test_msg_listener_task_starts_on_provider_connect_and_clears_on_disconnect():
     provider = WebSocketProvider("ws://mocked")
@@ -265,13 +689,20 @@ async def test_listen_event_awaits_msg_processing_when_subscription_queue_is_ful
     """
     This test is to ensure that the `listen_event` method will wait for the
     `process_subscriptions` method to process a message when the subscription queue
-    is full.
+    is full and the ``BLOCK`` overflow policy is used.
     """
     with patch(
         "web3.providers.persistent.websocket.connect",
         new=lambda *_1, **_2: _mocked_ws_conn(),
     ):
-        async_w3 = await AsyncWeb3(WebSocketProvider("ws://mocked"))
+        async_w3 = await AsyncWeb3(
+            WebSocketProvider(
+                "ws://mocked",
+                subscription_queue_overflow_policy=(
+                    SubscriptionQueueOverflowPolicy.BLOCK
+                ),
+            )
+        )
 
     _mock_ws(async_w3.provider)
 
@@ -347,6 +778,117 @@ async def test_listen_event_awaits_msg_processing_when_subscription_queue_is_ful
     await async_w3.provider.disconnect()
 
 
+def _sub_msg(sub_id, result):
+    return {
+        "jsonrpc": "2.0",
+        "method": "eth_subscription",
+        "params": {"subscription": sub_id, "result": result},
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "policy,new_msg,expected_queue,dropped,coalesced",
+    (
+        (
+            SubscriptionQueueOverflowPolicy.DROP_OLDEST,
+            _sub_msg("0xa", "0x2"),
+            [_sub_msg("0xb", "0x1"), _sub_msg("0xa", "0x2")],
+            1,
+            0,
+        ),
+        (
+            SubscriptionQueueOverflowPolicy.DROP_NEWEST,
+            _sub_msg("0xa", "0x2"),
+            [_sub_msg("0xa", "0x1"), _sub_msg("0xb", "0x1")],
+            1,
+            0,
+        ),
+        (
+            SubscriptionQueueOverflowPolicy.COALESCE,
+            _sub_msg("0xa", "0x2"),
+            [_sub_msg("0xa", "0x2"), _sub_msg("0xb", "0x1")],
+            0,
+            1,
+        ),
+        (
+            # nothing to coalesce with, falls back to dropping the oldest
+            SubscriptionQueueOverflowPolicy.COALESCE,
+            _sub_msg("0xc", "0x1"),
+            [_sub_msg("0xb", "0x1"), _sub_msg("0xc", "0x1")],
+            1,
+            0,
+        ),
+    ),
+)
+async def test_subscription_queue_overflow_policies(
+    policy, new_msg, expected_queue, dropped, coalesced
+):
+    provider = WebSocketProvider(
+        "ws://mocked",
+        subscription_response_queue_size=2,
+        subscription_queue_overflow_policy=policy,
+    )
+    request_processor = provider._request_processor
+
+    await request_processor.cache_raw_response(
+        _sub_msg("0xa", "0x1"), subscription=True
+    )
+    await request_processor.cache_raw_response(
+        _sub_msg("0xb", "0x1"), subscription=True
+    )
+    # the socket reader is never paused, so this returns right away
+    await asyncio.wait_for(
+        request_processor.cache_raw_response(new_msg, subscription=True),
+        timeout=1,
+    )
+
+    queue = request_processor._subscription_response_queue
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == expected_queue
+    # dropped and coalesced responses are not left as unfinished tasks
+    for _ in expected_queue:
+        queue.task_done()
+    await asyncio.wait_for(queue.join(), timeout=1)
+    assert provider.subscription_queue_metrics()["subscription_response_queue"] == {
+        "depth": 0,
+        "max_depth": 2,
+        "dropped": dropped,
+        "coalesced": coalesced,
+    }
+
+
+@pytest.mark.asyncio
+async def test_full_subscription_queue_does_not_stall_request_responses():
+    messages = asyncio.Queue()
+    sent = []
+
+    async def _connect(*_args, **_kwargs):
+        return QueuedWebSocketConnection(messages, sent)
+
+    # the default overflow policy never pauses the socket reader
+    provider = WebSocketProvider("ws://mocked", subscription_response_queue_size=1)
+    with patch("web3.providers.persistent.websocket.connect", new=_connect):
+        await provider.connect()
+
+        # subscription responses no one consumes fill the queue
+        for i in range(3):
+            messages.put_nowait(_sub_msg("0xa", hex(i)))
+
+        request_task = asyncio.create_task(
+            provider.make_request(RPCEndpoint("eth_blockNumber"), [])
+        )
+        await QueuedWebSocketConnection.wait_for_sent(sent, 1)
+        messages.put_nowait({"jsonrpc": "2.0", "id": sent[0]["id"], "result": "0x1"})
+
+        response = await asyncio.wait_for(request_task, 1)
+        assert response["result"] == "0x1"
+        metrics = provider.subscription_queue_metrics()["subscription_response_queue"]
+        assert metrics["depth"] == 1
+        assert metrics["dropped"] == 2
+
+        await provider.disconnect()
+
+
 @pytest.mark.asyncio
 async def test_async_iterator_pattern_exception_handling_for_requests():
     iterations = 1
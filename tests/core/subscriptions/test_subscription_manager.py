@@ -1,6 +1,7 @@
 import pytest
 import asyncio
 import itertools
+import json
 import time
 from typing import (
     cast,
@@ -18,8 +19,15 @@ from web3 import (
     AsyncWeb3,
     PersistentConnectionProvider,
 )
+from web3._utils.batching import (
+    BATCH_REQUEST_ID,
+)
+from web3._utils.caching import (
+    generate_cache_key,
+)
 from web3.exceptions import (
     SubscriptionHandlerTaskException,
+    Web3RPCError,
     Web3ValueError,
 )
 from web3.providers.persistent.request_processor import (
@@ -29,13 +37,17 @@ from web3.types import (
     RPCResponse,
 )
 from web3.utils.subscriptions import (
+    EthSubscription,
+    HandlerBackpressurePolicy,
     LogsSubscription,
     NewHeadsSubscription,
     PendingTxSubscription,
+    order_by_subscription_id,
 )
 
 
 class MockProvider(PersistentConnectionProvider):
+    endpoint_uri = "ws://mocked"
     socket_recv = AsyncMock()
     socket_send = AsyncMock()
 
@@ -48,6 +60,26 @@ async def subscription_manager():
     w3.eth._subscribe.side_effect = lambda *_: f"0x{str(next(countr))}"
     w3.eth._unsubscribe = AsyncMock()
     w3.eth._unsubscribe.return_value = True
+
+    async def respond_to_batch(request_data):
+        # eth_subscribe / eth_unsubscribe for multiple subscriptions are batched
+        responses = [
+            {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "result": (
+                    f"0x{str(next(countr))}"
+                    if request["method"] == "eth_subscribe"
+                    else True
+                ),
+            }
+            for request in json.loads(request_data)
+        ]
+        w3.provider._request_processor._request_response_cache.cache(
+            generate_cache_key(BATCH_REQUEST_ID), responses
+        )
+
+    w3.provider.socket_send = AsyncMock(side_effect=respond_to_batch)
     yield w3.subscription_manager
 
 
@@ -235,6 +267,76 @@ async def test_unsubscribe_with_subscriptions_reference_does_not_mutate_the_list
     assert subscription_manager.subscriptions == []
 
 
+@pytest.mark.asyncio
+async def test_subscribe_and_unsubscribe_many_are_sent_in_batches(
+    subscription_manager,
+):
+    provider = subscription_manager._w3.provider
+    subscription_manager.batch_size = 2
+    subs = [NewHeadsSubscription() for _ in range(5)]
+
+    sub_ids = await subscription_manager.subscribe(subs)
+
+    assert sub_ids == ["0x0", "0x1", "0x2", "0x3", "0x4"]
+    assert [sub.id for sub in subs] == sub_ids
+    assert subscription_manager.subscriptions == subs
+    sent_batches = [json.loads(c.args[0]) for c in provider.socket_send.call_args_list]
+    assert [len(batch) for batch in sent_batches] == [2, 2, 1]
+    assert all(
+        request["method"] == "eth_subscribe" and request["params"] == ["newHeads"]
+        for batch in sent_batches
+        for request in batch
+    )
+    # subscription request info is kept by subscription id to format messages
+    assert set(provider._request_processor.active_subscriptions) == set(sub_ids)
+
+    provider.socket_send.reset_mock()
+    assert await subscription_manager.unsubscribe_all() is True
+
+    assert subscription_manager.subscriptions == []
+    sent_batches = [json.loads(c.args[0]) for c in provider.socket_send.call_args_list]
+    assert [[r["params"] for r in batch] for batch in sent_batches] == [
+        [["0x0"], ["0x1"]],
+        [["0x2"], ["0x3"]],
+        [["0x4"]],
+    ]
+    assert provider._request_processor.active_subscriptions == {}
+
+
+@pytest.mark.asyncio
+async def test_batch_subscribe_maps_errors_to_subscriptions(subscription_manager):
+    provider = subscription_manager._w3.provider
+
+    async def respond_with_one_error(request_data):
+        requests = json.loads(request_data)
+        responses = [
+            {"jsonrpc": "2.0", "id": requests[0]["id"], "result": "0xa"},
+            {
+                "jsonrpc": "2.0",
+                "id": requests[1]["id"],
+                "error": {"code": -32000, "message": "too many subscriptions"},
+            },
+            {"jsonrpc": "2.0", "id": requests[2]["id"], "result": "0xc"},
+        ]
+        provider._request_processor._request_response_cache.cache(
+            generate_cache_key(BATCH_REQUEST_ID), responses
+        )
+
+    provider.socket_send.side_effect = respond_with_one_error
+    sub1 = NewHeadsSubscription(label="foo")
+    sub2 = PendingTxSubscription(label="bar")
+    sub3 = LogsSubscription(label="baz")
+
+    with pytest.raises(Web3RPCError, match="too many subscriptions"):
+        await subscription_manager.subscribe([sub1, sub2, sub3])
+
+    # the successful subscriptions are managed, the failed one is not
+    assert subscription_manager.subscriptions == [sub1, sub3]
+    assert sub1.id == "0xa"
+    assert sub3.id == "0xc"
+    assert sub2._id is None
+
+
 @pytest.mark.asyncio
 async def test_high_throughput_subscription_with_parallelize(
     subscription_manager,
@@ -492,6 +594,339 @@ async def test_performance_difference_with_subscription_overrides(
     assert len(manager_tasks) == 0  # all tasks cleaned up
 
 
+@pytest.mark.asyncio
+async def test_parallel_handler_calls_are_bounded(subscription_manager) -> None:
+    provider = subscription_manager._w3.provider
+    subscription_manager.parallelize = True
+    subscription_manager.max_parallel_handlers = 5
+    num_msgs = 50
+
+    class Counter:
+        val: int = 0
+        in_flight: int = 0
+        max_in_flight: int = 0
+
+    counter = Counter()
+
+    async def handler(context) -> None:
+        counter.in_flight += 1
+        counter.max_in_flight = max(counter.max_in_flight, counter.in_flight)
+        await asyncio.sleep(0.001)
+        counter.in_flight -= 1
+
+        counter.val += 1
+        if counter.val == num_msgs:
+            await context.subscription.unsubscribe()
+
+    sub_id = await subscription_manager.subscribe(NewHeadsSubscription(handler=handler))
+    provider._request_processor.cache_request_information(
+        request_id=sub_id,
+        method="eth_subscribe",
+        params=[],
+        response_formatters=((), (), ()),
+    )
+    for _ in range(num_msgs):
+        provider._request_processor._handler_subscription_queue.put_nowait(
+            create_subscription_message(sub_id)
+        )
+
+    await subscription_manager.handle_subscriptions()
+
+    assert counter.val == num_msgs
+    assert counter.max_in_flight == 5
+    assert subscription_manager.dropped_handler_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_parallel_handler_calls_dropped_when_limit_reached(
+    subscription_manager,
+) -> None:
+    provider = subscription_manager._w3.provider
+    subscription_manager.parallelize = True
+    subscription_manager.max_parallel_handlers = 2
+    subscription_manager.handler_backpressure = HandlerBackpressurePolicy.DROP
+
+    release = asyncio.Event()
+
+    async def blocking_handler(_ctx) -> None:
+        await release.wait()
+
+    async def finish_handler(_ctx) -> None:
+        release.set()
+        await asyncio.wait(set(subscription_manager._tasks))
+        await subscription_manager.unsubscribe_all()
+
+    blocking_sub_id = await subscription_manager.subscribe(
+        NewHeadsSubscription(handler=blocking_handler)
+    )
+    finish_sub_id = await subscription_manager.subscribe(
+        NewHeadsSubscription(handler=finish_handler, parallelize=False)
+    )
+    for sub_id in (blocking_sub_id, finish_sub_id):
+        provider._request_processor.cache_request_information(
+            request_id=sub_id,
+            method="eth_subscribe",
+            params=[],
+            response_formatters=((), (), ()),
+        )
+
+    for _ in range(5):
+        provider._request_processor._handler_subscription_queue.put_nowait(
+            create_subscription_message(blocking_sub_id)
+        )
+    provider._request_processor._handler_subscription_queue.put_nowait(
+        create_subscription_message(finish_sub_id)
+    )
+
+    await subscription_manager.handle_subscriptions()
+
+    # two calls fill the slots, the other three are dropped
+    assert subscription_manager.total_handler_calls == 3
+    assert subscription_manager.dropped_handler_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_parallel_handler_calls_with_ordering_key_run_in_order(
+    subscription_manager,
+) -> None:
+    provider = subscription_manager._w3.provider
+    subscription_manager.parallelize = True
+    subscription_manager.handler_ordering_key = order_by_subscription_id
+    num_msgs = 10
+
+    calls = {}
+
+    async def handler(context) -> None:
+        sub_calls = calls.setdefault(context.subscription.id, [])
+        call_number = len(sub_calls)
+        sub_calls.append(None)
+        # earlier calls sleep longer, so they would finish last if run in parallel
+        await asyncio.sleep(0.001 * (num_msgs - call_number))
+        sub_calls[call_number] = call_number
+
+        if sum(len(c) for c in calls.values()) == 2 * num_msgs and all(
+            None not in c for c in calls.values()
+        ):
+            await subscription_manager.unsubscribe_all()
+
+    sub_ids = await subscription_manager.subscribe(
+        [NewHeadsSubscription(handler=handler), NewHeadsSubscription(handler=handler)]
+    )
+    for sub_id in sub_ids:
+        provider._request_processor.cache_request_information(
+            request_id=sub_id,
+            method="eth_subscribe",
+            params=[],
+            response_formatters=((), (), ()),
+        )
+    for _ in range(num_msgs):
+        for sub_id in sub_ids:
+            provider._request_processor._handler_subscription_queue.put_nowait(
+                create_subscription_message(sub_id)
+            )
+
+    await subscription_manager.handle_subscriptions()
+
+    assert calls == {sub_id: list(range(num_msgs)) for sub_id in sub_ids}
+    # one task per ordering key
+    assert subscription_manager._ordered_handler_calls == {}
+    assert len(subscription_manager._tasks) == 0
+
+
+@pytest.mark.asyncio
+async def test_parallel_handler_slots_released_when_keyed_handler_raises(
+    subscription_manager,
+) -> None:
+    provider = subscription_manager._w3.provider
+    subscription_manager.parallelize = True
+    subscription_manager.max_parallel_handlers = 3
+    subscription_manager.handler_ordering_key = order_by_subscription_id
+
+    async def failing_handler(_ctx) -> None:
+        # give the other calls for the key time to be queued behind this one
+        await asyncio.sleep(0.01)
+        raise ValueError("handler failed")
+
+    sub_id = await subscription_manager.subscribe(
+        NewHeadsSubscription(handler=failing_handler)
+    )
+    provider._request_processor.cache_request_information(
+        request_id=sub_id,
+        method="eth_subscribe",
+        params=[],
+        response_formatters=((), (), ()),
+    )
+    for _ in range(3):
+        provider._request_processor._handler_subscription_queue.put_nowait(
+            create_subscription_message(sub_id)
+        )
+
+    with pytest.raises(SubscriptionHandlerTaskException, match="handler failed"):
+        await subscription_manager.handle_subscriptions()
+
+    # the queued calls that never ran gave back their slots
+    assert subscription_manager._handler_slots._value == 3
+    assert subscription_manager._ordered_handler_calls == {}
+
+
+@pytest.mark.asyncio
+async def test_parallel_handler_slot_not_taken_when_ordering_key_raises(
+    subscription_manager,
+) -> None:
+    provider = subscription_manager._w3.provider
+    subscription_manager.parallelize = True
+    subscription_manager.max_parallel_handlers = 2
+
+    def failing_ordering_key(_ctx):
+        raise ValueError("no ordering key")
+
+    subscription_manager.handler_ordering_key = failing_ordering_key
+
+    async def handler(_ctx) -> None:
+        pass
+
+    sub_id = await subscription_manager.subscribe(NewHeadsSubscription(handler=handler))
+    provider._request_processor.cache_request_information(
+        request_id=sub_id,
+        method="eth_subscribe",
+        params=[],
+        response_formatters=((), (), ()),
+    )
+    provider._request_processor._handler_subscription_queue.put_nowait(
+        create_subscription_message(sub_id)
+    )
+
+    with pytest.raises(ValueError, match="no ordering key"):
+        await subscription_manager.handle_subscriptions()
+
+    assert subscription_manager._handler_slots._value == 2
+
+
+@pytest.mark.asyncio
+async def test_raw_subscription_handler_receives_unformatted_result(
+    subscription_manager,
+) -> None:
+    async_w3 = subscription_manager._w3
+    provider = async_w3.provider
+    async_w3.manager._process_response = AsyncMock()
+    raw_header = {"number": "0x10", "hash": "0x" + "ab" * 32}
+
+    results = []
+
+    async def raw_handler(context) -> None:
+        results.append(context.result)
+        await context.subscription.unsubscribe()
+
+    sub_id = await subscription_manager.subscribe(
+        NewHeadsSubscription(handler=raw_handler, raw=True)
+    )
+    provider._request_processor._handler_subscription_queue.put_nowait(
+        {
+            "jsonrpc": "2.0",
+            "method": "eth_subscription",
+            "params": {"subscription": sub_id, "result": raw_header},
+        }
+    )
+
+    await subscription_manager.handle_subscriptions()
+
+    assert results == [raw_header]
+    async_w3.manager._process_response.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_shared_subscriptions_use_one_upstream_subscription(
+    subscription_manager,
+) -> None:
+    subscription_manager.share_subscriptions = True
+    async_w3 = subscription_manager._w3
+    sub1 = NewHeadsSubscription()
+    sub2 = NewHeadsSubscription()
+
+    assert await subscription_manager.subscribe(sub1) == "0x0"
+    assert await subscription_manager.subscribe(sub2) == "0x0"
+    assert async_w3.eth._subscribe.call_count == 1
+    assert subscription_manager.subscriptions == [sub1, sub2]
+
+    # the upstream subscription is kept while another subscription shares it
+    assert await subscription_manager.unsubscribe(sub1) is True
+    async_w3.eth._unsubscribe.assert_not_called()
+    assert subscription_manager.get_by_id("0x0") == sub2
+
+    assert await subscription_manager.unsubscribe(sub2) is True
+    async_w3.eth._unsubscribe.assert_called_once_with("0x0")
+    assert subscription_manager._subscription_container.subscribers_by_id == {}
+
+
+@pytest.mark.asyncio
+async def test_shared_logs_subscriptions_are_merged_and_demultiplexed(
+    subscription_manager,
+) -> None:
+    subscription_manager.share_subscriptions = True
+    async_w3 = subscription_manager._w3
+    provider = async_w3.provider
+    address_a = "0x" + "aa" * 20
+    address_b = "0x" + "bb" * 20
+    topic = "0x" + "11" * 32
+
+    results = {address_a: [], address_b: []}
+
+    def make_handler(address):
+        async def handler(context) -> None:
+            results[address].append(context.result)
+            await context.subscription.unsubscribe()
+
+        return handler
+
+    sub_a = LogsSubscription(
+        address=address_a, topics=[topic], handler=make_handler(address_a), raw=True
+    )
+    sub_b = LogsSubscription(
+        address=address_b, topics=[topic], handler=make_handler(address_b), raw=True
+    )
+    assert await subscription_manager.subscribe([sub_a, sub_b]) == ["0x0", "0x0"]
+
+    # one upstream subscription for the union of both filters
+    assert provider.socket_send.call_count == 1
+    (request,) = json.loads(provider.socket_send.call_args.args[0])
+    assert request["params"] == [
+        "logs",
+        {"address": [address_a, address_b], "topics": [topic]},
+    ]
+
+    log_a = {"address": address_a, "topics": [topic]}
+    log_b = {"address": address_b, "topics": [topic]}
+    for log in (log_a, log_b):
+        provider._request_processor._handler_subscription_queue.put_nowait(
+            {
+                "jsonrpc": "2.0",
+                "method": "eth_subscription",
+                "params": {"subscription": "0x0", "result": log},
+            }
+        )
+
+    await subscription_manager.handle_subscriptions()
+
+    # each log is only delivered to the subscription whose filter matches it
+    assert results == {address_a: [log_a], address_b: [log_b]}
+    async_w3.eth._unsubscribe.assert_called_once_with("0x0")
+
+
+@pytest.mark.asyncio
+async def test_shared_logs_subscription_joins_unfiltered_upstream_subscription(
+    subscription_manager,
+) -> None:
+    subscription_manager.share_subscriptions = True
+    async_w3 = subscription_manager._w3
+    all_logs_sub = EthSubscription(subscription_params=("logs",))
+    address_sub = LogsSubscription(address="0x" + "aa" * 20)
+
+    assert await subscription_manager.subscribe(all_logs_sub) == "0x0"
+    # a logs filter is covered by the upstream subscription to all logs
+    assert await subscription_manager.subscribe(address_sub) == "0x0"
+    assert async_w3.eth._subscribe.call_count == 1
+
+
 @pytest.mark.asyncio
 async def test_eth_subscribe_api_call_with_all_kwargs(subscription_manager):
     async_w3 = subscription_manager._w3
@@ -3,15 +3,36 @@ import pytest
 from eth_typing import (
     HexStr,
 )
+from eth_utils import (
+    is_address,
+    to_checksum_address,
+)
+from hexbytes import (
+    HexBytes,
+)
 
+from web3._utils.checksum import (
+    _checksum_unprefixed_hex_address,
+)
 from web3._utils.method_formatters import (
+    bytes_formatter,
+    checksum_address,
+    checksum_address_if_address,
+    compile_dict_formatter,
     get_error_formatters,
+    hexbytes_formatter,
+    hexstr_formatter,
     raise_contract_logic_error_on_revert,
     storage_key_to_hexstr,
+    to_bytes_result,
+    to_hexstr_result,
 )
 from web3._utils.rpc_abi import (
     RPC,
 )
+from web3.datastructures import (
+    AttributeDict,
+)
 from web3.exceptions import (
     ContractLogicError,
     Web3ValueError,
@@ -236,3 +257,113 @@ def test_storage_key_to_hexstr(input_value, expected_output):
             storage_key_to_hexstr(input_value)
     else:
         assert storage_key_to_hexstr(input_value) == expected_output
+
+
+@pytest.mark.parametrize(
+    "address",
+    (
+        "0xd3cda913deb6f67967b99d67acdfa1712c293601",
+        "0xD3CDA913DEB6F67967B99D67ACDFA1712C293601",
+        "0xd3CdA913deB6f67967B99D67aCDFa1712C293601",
+        # an invalid checksum
+        "0xD3cda913deb6f67967b99d67acdfa1712c293601",
+        "0x0000000000000000000000000000000000000001",
+        HexBytes("0xd3cda913deb6f67967b99d67acdfa1712c293601"),
+    ),
+)
+def test_checksum_address_matches_to_checksum_address(address):
+    assert checksum_address(address) == to_checksum_address(address)
+    expected = to_checksum_address(address) if is_address(address) else address
+    assert checksum_address_if_address(address) == expected
+
+
+def test_checksum_address_is_memoized():
+    _checksum_unprefixed_hex_address.cache_clear()
+    address = "0xd3cda913deb6f67967b99d67acdfa1712c293601"
+
+    assert checksum_address(address) == to_checksum_address(address)
+    assert checksum_address(address) == to_checksum_address(address)
+    assert checksum_address(HexBytes(address)) == to_checksum_address(address)
+
+    cache_info = _checksum_unprefixed_hex_address.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
+
+def test_checksum_address_if_address_skips_non_addresses():
+    assert checksum_address_if_address(None) is None
+    assert checksum_address_if_address("0x") == "0x"
+
+
+def test_checksum_address_raises_for_invalid_addresses():
+    with pytest.raises(ValueError):
+        checksum_address("0xzzcda913deb6f67967b99d67acdfa1712c293601")
+
+
+def test_hexbytes_formatter():
+    to_hash32 = hexbytes_formatter(32)
+    assert to_hash32("0x" + "ab" * 32) == HexBytes("0x" + "ab" * 32)
+    # leading zero bytes beyond 32 bytes are dropped
+    assert to_hash32("0x00" + "ab" * 32) == HexBytes("0x" + "ab" * 32)
+    with pytest.raises(ValueError):
+        to_hash32("0x" + "zz" * 32)
+    with pytest.raises(ValueError):
+        to_hash32("0x" + "ab" * 31)
+
+
+@pytest.mark.parametrize(
+    "formatter,to_expected",
+    (
+        (bytes_formatter, bytes),
+        (hexstr_formatter, lambda value: value.to_0x_hex()),
+    ),
+)
+def test_bytes_representation_formatters_match_hexbytes_formatter(
+    formatter, to_expected
+):
+    to_hash32 = formatter(32)
+    to_nonce = formatter(8, variable_length=True)
+    for value in (
+        "0x" + "ab" * 32,
+        "0x" + "AB" * 32,
+        "0x00" + "ab" * 32,
+        b"\xab" * 32,
+    ):
+        assert to_hash32(value) == to_expected(hexbytes_formatter(32)(value))
+    assert to_nonce("0x01") == to_expected(HexBytes("0x01"))
+
+    with pytest.raises(ValueError):
+        to_hash32("0x" + "zz" * 32)
+    with pytest.raises(ValueError):
+        to_hash32("0x" + "ab" * 31)
+
+
+def test_bytes_representation_formatters_of_any_length():
+    for value in ("0x", "0xabcd", "0xABCD", "0xabc", b"\xab\xcd"):
+        assert to_bytes_result(value) == bytes(HexBytes(value))
+        assert to_hexstr_result(value) == HexBytes(value).to_0x_hex()
+
+    assert type(to_bytes_result("0xabcd")) is bytes
+    with pytest.raises(ValueError):
+        to_hexstr_result("0xzz")
+
+
+def test_compile_dict_formatter():
+    formatter = compile_dict_formatter({"number": lambda value: int(value, 16)})
+
+    assert formatter({"number": "0x10", "other": "0x10"}) == {
+        "number": 16,
+        "other": "0x10",
+    }
+    formatted = formatter(AttributeDict({"number": "0x10", "nested": {"a": 1}}))
+    assert formatted == AttributeDict({"number": 16, "nested": AttributeDict({"a": 1})})
+    assert isinstance(formatted, AttributeDict)
+
+    with pytest.raises(
+        ValueError, match="Could not format invalid value 'zz' as field 'number'"
+    ):
+        formatter({"number": "zz"})
+    with pytest.raises(
+        TypeError, match="Could not format invalid type 1 as field 'number'"
+    ):
+        formatter({"number": 1})
@@ -0,0 +1,106 @@
+import pytest
+
+from web3.exceptions import (
+    Web3ValueError,
+)
+from web3.utils import (
+    fee_history_to_arrays,
+    hex_quantities_to_array,
+)
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize(
+    "values,expected",
+    (
+        ([], []),
+        (["0x0", "0x1", "0xff", "0X1F"], [0, 1, 255, 31]),
+        (["0x3b9aca00", "0x5208"], [1_000_000_000, 21_000]),
+        (["0xffffffffffffffff"], [2**64 - 1]),
+        # leading zeros beyond 16 digits
+        (["0x" + "0" * 62 + "ff"], [255]),
+        ([1, 2**64 - 1], [1, 2**64 - 1]),
+    ),
+)
+def test_hex_quantities_to_array(values, expected):
+    array = hex_quantities_to_array(values)
+
+    assert array.dtype == np.uint64
+    assert array.tolist() == expected
+
+
+def test_hex_quantities_to_array_matches_int():
+    values = [
+        hex(value) for value in (0, 7, 2**16 + 5, 2**40 - 3, 2**63 + 1)
+    ] * 50
+
+    assert hex_quantities_to_array(values).tolist() == [int(v, 16) for v in values]
+
+
+@pytest.mark.parametrize(
+    "values,match",
+    (
+        (["0x1", "0x"], "Invalid hex quantity: '0x'"),
+        (["0x1", "1"], "Invalid hex quantity: '1'"),
+        (["0x1", "0xzz"], "Invalid hex quantity: '0xzz'"),
+        (["0x1", "00x1"], "Invalid hex quantity: '00x1'"),
+        (["0x1", "0x0x1"], "Invalid hex quantity: '0x0x1'"),
+        (["0x1", "0xX0a"], "Invalid hex quantity: '0xX0a'"),
+        (["0x1", "0xxxx"], "Invalid hex quantity: '0xxxx'"),
+        (["0x1", "0x00x"], "Invalid hex quantity: '0x00x'"),
+        (["0x1", 2], "Invalid hex quantity: 2"),
+        (["0x1", "0x1" + "0" * 16], "does not fit in 64 bits: '0x10000000000000000'"),
+        (["0xé"], "must be ascii strings"),
+        ([-1], "non-negative integers of at most 64 bits"),
+        ([2**64], "non-negative integers of at most 64 bits"),
+    ),
+)
+def test_hex_quantities_to_array_raises_for_invalid_values(values, match):
+    with pytest.raises(Web3ValueError, match=match):
+        hex_quantities_to_array(values)
+
+
+def test_fee_history_to_arrays():
+    arrays = fee_history_to_arrays(
+        {
+            "oldestBlock": "0x10",
+            "baseFeePerGas": ["0x7", "0x8", "0x9"],
+            "gasUsedRatio": [0.5, 0.25],
+            "reward": [["0x1", "0x2"], ["0x3", "0x4"]],
+        }
+    )
+
+    assert arrays["oldestBlock"] == 16
+    assert arrays["baseFeePerGas"].tolist() == [7, 8, 9]
+    assert arrays["gasUsedRatio"].dtype == np.float64
+    assert arrays["gasUsedRatio"].tolist() == [0.5, 0.25]
+    assert arrays["reward"].dtype == np.uint64
+    assert arrays["reward"].tolist() == [[1, 2], [3, 4]]
+    assert "baseFeePerBlobGas" not in arrays
+
+
+def test_fee_history_to_arrays_raises_for_ragged_rewards():
+    with pytest.raises(Web3ValueError, match=r"same number of rewards.*\[2, 1\]"):
+        fee_history_to_arrays(
+            {
+                "oldestBlock": "0x10",
+                "baseFeePerGas": ["0x7", "0x8", "0x9"],
+                "gasUsedRatio": [0.5, 0.25],
+                "reward": [["0x1", "0x2"], ["0x3"]],
+            }
+        )
+
+
+def test_fee_history_to_arrays_accepts_formatted_fee_history():
+    arrays = fee_history_to_arrays(
+        {
+            "oldestBlock": 16,
+            "baseFeePerGas": [7, 8],
+            "gasUsedRatio": [0.5],
+        }
+    )
+
+    assert arrays["oldestBlock"] == 16
+    assert arrays["baseFeePerGas"].tolist() == [7, 8]
+    assert "reward" not in arrays
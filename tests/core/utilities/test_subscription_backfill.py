@@ -0,0 +1,65 @@
+import pytest
+import asyncio
+import logging
+
+from web3._utils.subscription_backfill import (
+    fetch_subscription_backfill,
+)
+from web3.exceptions import (
+    Web3RPCError,
+)
+
+
+class BackfillProvider:
+    logger = logging.getLogger("BackfillProvider")
+
+    def __init__(self, latest_block, missing_blocks=(), error_block=None):
+        self._backfill_batch_lock = asyncio.Lock()
+        self.latest_block = latest_block
+        self.missing_blocks = missing_blocks
+        self.error_block = error_block
+        self.batches = []
+
+    async def make_request(self, method, params):
+        assert method == "eth_blockNumber"
+        return {"jsonrpc": "2.0", "id": 0, "result": hex(self.latest_block)}
+
+    async def make_batch_request(self, requests):
+        self.batches.append(requests)
+        responses = []
+        for i, (method, (block_id, full_transactions)) in enumerate(requests):
+            assert method == "eth_getBlockByNumber"
+            assert full_transactions is False
+            number = int(block_id, 16)
+            if number == self.error_block:
+                responses.append(
+                    {"jsonrpc": "2.0", "id": i, "error": {"code": -1, "message": "x"}}
+                )
+            else:
+                header = None if number in self.missing_blocks else {"number": block_id}
+                responses.append({"jsonrpc": "2.0", "id": i, "result": header})
+        return responses
+
+
+@pytest.mark.asyncio
+async def test_new_heads_backfill_is_fetched_in_batches():
+    provider = BackfillProvider(latest_block=10, missing_blocks=(4,))
+
+    results = await fetch_subscription_backfill(
+        provider, ("newHeads",), 3, chunk_size=1000, batch_size=3
+    )
+
+    assert [len(batch) for batch in provider.batches] == [3, 3, 2]
+    assert [result["number"] for result in results] == [
+        hex(number) for number in range(3, 11) if number != 4
+    ]
+
+
+@pytest.mark.asyncio
+async def test_new_heads_backfill_raises_for_error_responses():
+    provider = BackfillProvider(latest_block=5, error_block=4)
+
+    with pytest.raises(Web3RPCError):
+        await fetch_subscription_backfill(
+            provider, ("newHeads",), 1, chunk_size=1000, batch_size=10
+        )
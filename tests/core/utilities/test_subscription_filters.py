@@ -0,0 +1,63 @@
+import pytest
+
+from web3._utils.subscription_filters import (
+    log_matches_filter,
+    logs_filter_covers,
+    merge_logs_filters,
+)
+
+ADDRESS_A = "0x" + "aa" * 20
+ADDRESS_B = "0x" + "bb" * 20
+TOPIC_X = "0x" + "11" * 32
+TOPIC_Y = "0x" + "22" * 32
+
+
+def test_merge_logs_filters_unions_addresses():
+    merged = merge_logs_filters(
+        [
+            {"address": ADDRESS_A, "topics": [TOPIC_X]},
+            {"address": [ADDRESS_B, ADDRESS_A.upper().replace("0X", "0x")]},
+        ]
+    )
+    assert merged == {"address": [ADDRESS_A, ADDRESS_B], "topics": [TOPIC_X]}
+
+
+def test_merge_logs_filters_without_address_matches_any_address():
+    merged = merge_logs_filters([{"address": ADDRESS_A}, {}])
+    assert merged == {}
+
+
+@pytest.mark.parametrize(
+    "upstream,logs_filter,expected",
+    (
+        ({}, {"address": ADDRESS_A, "topics": [TOPIC_X]}, True),
+        ({"address": [ADDRESS_A, ADDRESS_B]}, {"address": ADDRESS_B}, True),
+        ({"address": ADDRESS_A}, {"address": ADDRESS_B}, False),
+        ({"address": ADDRESS_A}, {}, False),
+        ({"topics": [TOPIC_X]}, {"topics": [TOPIC_X, TOPIC_Y]}, True),
+        ({"topics": [None, TOPIC_Y]}, {"topics": [TOPIC_X, TOPIC_Y]}, True),
+        ({"topics": [TOPIC_X]}, {"topics": [[TOPIC_X, TOPIC_Y]]}, False),
+        ({"topics": [[TOPIC_X, TOPIC_Y]]}, {"topics": [TOPIC_Y]}, True),
+        ({"fromBlock": "latest"}, {}, False),
+    ),
+)
+def test_logs_filter_covers(upstream, logs_filter, expected):
+    assert logs_filter_covers(upstream, logs_filter) is expected
+
+
+@pytest.mark.parametrize(
+    "logs_filter,expected",
+    (
+        ({}, True),
+        ({"address": ADDRESS_A}, True),
+        ({"address": [ADDRESS_B]}, False),
+        ({"topics": [TOPIC_X]}, True),
+        ({"topics": [None, TOPIC_Y]}, True),
+        ({"topics": [[TOPIC_Y, TOPIC_X]]}, True),
+        ({"topics": [TOPIC_Y]}, False),
+        ({"topics": [TOPIC_X, TOPIC_Y, TOPIC_Y]}, False),
+    ),
+)
+def test_log_matches_filter(logs_filter, expected):
+    log = {"address": ADDRESS_A, "topics": [TOPIC_X, TOPIC_Y]}
+    assert log_matches_filter(log, logs_filter) is expected
@@ -0,0 +1,139 @@
+import pytest
+
+from hexbytes import (
+    HexBytes,
+)
+
+from web3 import (
+    AsyncBaseProvider,
+    AsyncWeb3,
+    Web3,
+)
+from web3.exceptions import (
+    Web3ValueError,
+)
+from web3.providers.base import (
+    BaseProvider,
+)
+from web3.utils import (
+    BytesRepresentation,
+)
+
+BLOCK_HASH = "0x" + "11" * 32
+TX_HASH = "0x" + "22" * 32
+TOPIC = "0x" + "33" * 32
+ADDRESS = "0x" + "44" * 20
+DATA = "0x" + "ab" * 40
+
+RAW_LOG = {
+    "address": ADDRESS,
+    "blockHash": BLOCK_HASH,
+    "blockNumber": "0x1",
+    "data": DATA,
+    "logIndex": "0x0",
+    "removed": False,
+    "topics": [TOPIC],
+    "transactionHash": TX_HASH,
+    "transactionIndex": "0x0",
+}
+RAW_BLOCK = {
+    "hash": BLOCK_HASH,
+    "number": "0x1",
+    "parentHash": BLOCK_HASH,
+    # leading zero bytes beyond 8 bytes are dropped
+    "nonce": "0x000000000000000000000000000000ff",
+    "transactions": [TX_HASH],
+}
+MOCK_RESULTS = {
+    "eth_getBlockByNumber": RAW_BLOCK,
+    "eth_getLogs": [RAW_LOG],
+}
+
+
+class DummyProvider(BaseProvider):
+    def make_request(self, method, params):
+        raise NotImplementedError(f"Cannot make request for {method}:{params}")
+
+
+class AsyncDummyProvider(AsyncBaseProvider):
+    async def make_request(self, method, params):
+        raise NotImplementedError(f"Cannot make request for {method}:{params}")
+
+
+@pytest.mark.parametrize(
+    "bytes_representation,expected_hash,expected_data,expected_nonce",
+    (
+        (
+            BytesRepresentation.HEXBYTES,
+            HexBytes(BLOCK_HASH),
+            HexBytes(DATA),
+            HexBytes("0x00000000000000ff"),
+        ),
+        (
+            BytesRepresentation.BYTES,
+            bytes(HexBytes(BLOCK_HASH)),
+            bytes(HexBytes(DATA)),
+            bytes(HexBytes("0x00000000000000ff")),
+        ),
+        (BytesRepresentation.HEX, BLOCK_HASH, DATA, "0x00000000000000ff"),
+        ("hex", BLOCK_HASH, DATA, "0x00000000000000ff"),
+    ),
+)
+def test_bytes_representation_formats_results(
+    request_mocker, bytes_representation, expected_hash, expected_data, expected_nonce
+):
+    w3 = Web3(DummyProvider())
+    w3.bytes_representation = bytes_representation
+    assert w3.bytes_representation == BytesRepresentation(bytes_representation)
+
+    with request_mocker(w3, mock_results=MOCK_RESULTS):
+        block = w3.eth.get_block(1)
+        logs = w3.eth.get_logs({})
+
+    assert type(block.hash) is type(expected_hash)
+    assert block.hash == expected_hash
+    assert block.parentHash == block.hash
+    assert type(block.transactions[0]) is type(expected_hash)
+    assert block.nonce == expected_nonce
+    assert block.number == 1
+
+    assert type(logs[0].data) is type(expected_data)
+    assert logs[0].data == expected_data
+    assert logs[0].blockHash == expected_hash
+    assert logs[0].address == Web3.to_checksum_address(ADDRESS)
+
+
+def test_changing_bytes_representation_applies_to_later_requests(request_mocker):
+    w3 = Web3(DummyProvider())
+    assert w3.bytes_representation == BytesRepresentation.HEXBYTES
+
+    with request_mocker(w3, mock_results=MOCK_RESULTS):
+        assert isinstance(w3.eth.get_block(1).hash, HexBytes)
+        w3.bytes_representation = BytesRepresentation.HEX
+        assert w3.eth.get_block(1).hash == BLOCK_HASH
+        w3.bytes_representation = BytesRepresentation.HEXBYTES
+        assert isinstance(w3.eth.get_block(1).hash, HexBytes)
+
+    # other instances keep their own representation
+    assert Web3(DummyProvider()).bytes_representation == BytesRepresentation.HEXBYTES
+
+
+def test_invalid_bytes_representation_raises():
+    w3 = Web3(DummyProvider())
+    with pytest.raises(Web3ValueError, match="Invalid bytes representation"):
+        w3.bytes_representation = "base64"
+    assert w3.bytes_representation == BytesRepresentation.HEXBYTES
+
+
+@pytest.mark.asyncio
+async def test_async_bytes_representation_formats_results(request_mocker):
+    async_w3 = AsyncWeb3(AsyncDummyProvider())
+    async_w3.bytes_representation = BytesRepresentation.BYTES
+
+    async with request_mocker(async_w3, mock_results=MOCK_RESULTS):
+        block = await async_w3.eth.get_block(1)
+        logs = await async_w3.eth.get_logs({})
+
+    assert type(block.hash) is bytes
+    assert type(logs[0].topics[0]) is bytes
+    assert logs[0].topics[0] == bytes(HexBytes(TOPIC))
@@ -1,17 +1,34 @@
+import asyncio
+from collections import (
+    deque,
+)
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+import itertools
 from types import (
     TracebackType,
 )
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    Awaitable,
     Callable,
     Coroutine,
     Generic,
+    Iterable,
+    Iterator,
     Union,
     cast,
 )
 import warnings
 
+from eth_utils.toolz import (
+    partition_all,
+)
+
 from web3._utils.compat import (
     Self,
 )
@@ -21,6 +38,7 @@ from web3.exceptions import (
 from web3.types import (
     TFunc,
     TReturn,
+    TValue,
 )
 
 if TYPE_CHECKING:
@@ -53,6 +71,10 @@ if TYPE_CHECKING:
 
 
 BATCH_REQUEST_ID = "batch_request"  # for use as the cache key for batch requests
+# the number of requests sent in each batch request by the bulk fetch methods
+DEFAULT_BATCH_SIZE = 100
+# the number of batch requests the bulk fetch methods have in flight at once
+DEFAULT_MAX_CONCURRENT_BATCHES = 4
 
 BatchRequestInformation = tuple[tuple["RPCEndpoint", Any], tuple[Any, ...]]
 RPC_METHODS_UNSUPPORTED_DURING_BATCH = {
@@ -206,3 +228,99 @@ def sort_batch_response_by_response_ids(
             stacklevel=2,
         )
         return responses
+
+
+def batched(items: Iterable[TValue], batch_size: int) -> Iterator[tuple[TValue, ...]]:
+    """
+    Split ``items`` into tuples of at most ``batch_size`` items, for sending many
+    requests as batch requests of ``batch_size`` requests each.
+    """
+    if batch_size < 1:
+        raise Web3ValueError("`batch_size` must be a positive integer.")
+    return partition_all(batch_size, items)
+
+
+def validate_batch_arguments(batch_size: int, max_concurrent_batches: int) -> None:
+    if batch_size < 1:
+        raise Web3ValueError("`batch_size` must be a positive integer.")
+    elif max_concurrent_batches < 1:
+        raise Web3ValueError("`max_concurrent_batches` must be a positive integer.")
+
+
+def iter_concurrent_batches(
+    fetch_batch: Callable[[tuple[TValue, ...]], list[TReturn]],
+    items: Iterable[TValue],
+    batch_size: int,
+    max_concurrent_batches: int,
+) -> Iterator[TReturn]:
+    """
+    Yield the results of ``fetch_batch`` for ``items`` split into batches of
+    ``batch_size``, in order. Up to ``max_concurrent_batches`` batches are fetched
+    ahead of the consumer in worker threads, so at most that many batches of results
+    are held at once.
+    """
+    validate_batch_arguments(batch_size, max_concurrent_batches)
+    return _iter_concurrent_batches(
+        fetch_batch, batched(items, batch_size), max_concurrent_batches
+    )
+
+
+def _iter_concurrent_batches(
+    fetch_batch: Callable[[tuple[TValue, ...]], list[TReturn]],
+    batches: Iterator[tuple[TValue, ...]],
+    max_concurrent_batches: int,
+) -> Iterator[TReturn]:
+    with ThreadPoolExecutor(max_workers=max_concurrent_batches) as executor:
+        pending: deque[Future[list[TReturn]]] = deque(
+            executor.submit(fetch_batch, batch)
+            for batch in itertools.islice(batches, max_concurrent_batches)
+        )
+        try:
+            while pending:
+                results = pending.popleft().result()
+                # start on the next batch before handing these results over
+                for batch in itertools.islice(batches, 1):
+                    pending.append(executor.submit(fetch_batch, batch))
+                yield from results
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def async_iter_concurrent_batches(
+    fetch_batch: Callable[[tuple[TValue, ...]], Awaitable[list[TReturn]]],
+    items: Iterable[TValue],
+    batch_size: int,
+    max_concurrent_batches: int,
+) -> AsyncGenerator[TReturn, None]:
+    """
+    The async equivalent of ``iter_concurrent_batches``, fetching batches ahead of
+    the consumer in tasks instead of threads.
+    """
+    validate_batch_arguments(batch_size, max_concurrent_batches)
+    return _async_iter_concurrent_batches(
+        fetch_batch, batched(items, batch_size), max_concurrent_batches
+    )
+
+
+async def _async_iter_concurrent_batches(
+    fetch_batch: Callable[[tuple[TValue, ...]], Awaitable[list[TReturn]]],
+    batches: Iterator[tuple[TValue, ...]],
+    max_concurrent_batches: int,
+) -> AsyncGenerator[TReturn, None]:
+    pending: deque[asyncio.Future[list[TReturn]]] = deque(
+        asyncio.ensure_future(fetch_batch(batch))
+        for batch in itertools.islice(batches, max_concurrent_batches)
+    )
+    try:
+        while pending:
+            results = await pending.popleft()
+            # start on the next batch before handing these results over
+            for batch in itertools.islice(batches, 1):
+                pending.append(asyncio.ensure_future(fetch_batch(batch)))
+            for result in results:
+                yield result
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
@@ -6,6 +6,7 @@ from .caching_utils import (
     CACHEABLE_REQUESTS,
     async_handle_request_caching,
     generate_cache_key,
+    generate_request_cache_key,
     handle_request_caching,
     is_cacheable_request,
     RequestInformation,
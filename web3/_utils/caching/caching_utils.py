@@ -89,6 +89,14 @@ def generate_cache_key(value: Any) -> str:
         )
 
 
+def generate_request_cache_key(method: RPCEndpoint, params: Any) -> str:
+    """
+    Generates the provider request cache key for a request. The key is unique per
+    thread so that cached responses are not shared across threads.
+    """
+    return generate_cache_key(f"{threading.get_ident()}:{(method, params)}")
+
+
 class RequestInformation:
     def __init__(
         self,
@@ -240,9 +248,7 @@ def handle_request_caching(
     ) -> "RPCResponse":
         if is_cacheable_request(provider, method, params):
             request_cache = provider._request_cache
-            cache_key = generate_cache_key(
-                f"{threading.get_ident()}:{(method, params)}"
-            )
+            cache_key = generate_request_cache_key(method, params)
             cache_result = request_cache.get_cache_entry(cache_key)
             if cache_result is not None:
                 return cache_result
@@ -344,9 +350,7 @@ def async_handle_request_caching(
     ) -> "RPCResponse":
         if is_cacheable_request(provider, method, params):
             request_cache = provider._request_cache
-            cache_key = generate_cache_key(
-                f"{threading.get_ident()}:{(method, params)}"
-            )
+            cache_key = generate_request_cache_key(method, params)
             cache_result = request_cache.get_cache_entry(cache_key)
             if cache_result is not None:
                 return cache_result
@@ -377,9 +381,7 @@ def async_handle_send_caching(
     ) -> "RPCRequest":
         if is_cacheable_request(provider, method, params):
             request_cache = provider._request_cache
-            cache_key = generate_cache_key(
-                f"{threading.get_ident()}:{(method, params)}"
-            )
+            cache_key = generate_request_cache_key(method, params)
             cached_response = request_cache.get_cache_entry(cache_key)
             if cached_response is not None:
                 # The request data isn't used, this just prevents a cached request from
@@ -406,9 +408,7 @@ def async_handle_recv_caching(
         params = rpc_request["params"]
         if is_cacheable_request(provider, method, params):
             request_cache = provider._request_cache
-            cache_key = generate_cache_key(
-                f"{threading.get_ident()}:{(method, params)}"
-            )
+            cache_key = generate_request_cache_key(method, params)
             cache_result = request_cache.get_cache_entry(cache_key)
             if cache_result is not None:
                 return cache_result
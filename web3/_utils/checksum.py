@@ -0,0 +1,76 @@
+import functools
+from typing import (
+    Any,
+    cast,
+)
+
+from eth_hash.auto import (
+    keccak,
+)
+from eth_typing import (
+    ChecksumAddress,
+)
+from eth_utils import (
+    is_address,
+    to_checksum_address,
+)
+
+# The number of checksummed addresses kept. Results repeat the same addresses, such
+# as popular contracts and senders, far more often than this many distinct ones.
+CHECKSUM_CACHE_SIZE = 8192
+
+_HEX_CHARS = frozenset("0123456789abcdef")
+# maps each hex digit of an address hash to a mask byte selecting the upper case
+# address character where the digit is 8 or more
+_CHECKSUM_MASK_TABLE = bytes(0xFF if chr(i) in "89abcdef" else 0 for i in range(256))
+
+
+def _unprefixed_hex_address(value: Any) -> str | None:
+    if (
+        isinstance(value, str)
+        and len(value) == 42
+        and value[:2] in ("0x", "0X")
+        and _HEX_CHARS.issuperset(value[2:].lower())
+    ):
+        return value[2:]
+    return None
+
+
+@functools.lru_cache(maxsize=CHECKSUM_CACHE_SIZE)
+def _checksum_unprefixed_hex_address(unprefixed: str) -> ChecksumAddress:
+    lower = unprefixed.lower().encode("ascii")
+    address_hash = keccak(lower).hex()[:40].encode("ascii")
+    # select upper and lower case characters for the whole address at once
+    mask = int.from_bytes(address_hash.translate(_CHECKSUM_MASK_TABLE), "big")
+    checksummed = (int.from_bytes(lower, "big") & ~mask) | (
+        int.from_bytes(lower.upper(), "big") & mask
+    )
+    return cast(ChecksumAddress, "0x" + checksummed.to_bytes(40, "big").decode("ascii"))
+
+
+def checksum_address(value: Any) -> ChecksumAddress:
+    """
+    The same as ``to_checksum_address``, with a fast path for hex string and 20 byte
+    addresses. Their checksums are memoized.
+    """
+    unprefixed = _unprefixed_hex_address(value)
+    if unprefixed is not None:
+        return _checksum_unprefixed_hex_address(unprefixed)
+    elif isinstance(value, (bytes, bytearray)) and len(value) == 20:
+        return _checksum_unprefixed_hex_address(value.hex())
+    return to_checksum_address(value)
+
+
+def checksum_address_if_address(value: Any) -> Any:
+    """
+    The same as ``apply_formatter_if(is_address, to_checksum_address)``, with a fast
+    path for hex string addresses that are not checksummed yet.
+    """
+    unprefixed = _unprefixed_hex_address(value)
+    if unprefixed is not None and (
+        unprefixed.islower() or unprefixed.isupper() or unprefixed.isnumeric()
+    ):
+        return _checksum_unprefixed_hex_address(unprefixed)
+    elif is_address(value):
+        return checksum_address(value)
+    return value
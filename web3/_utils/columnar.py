@@ -0,0 +1,245 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+
+from web3.exceptions import (
+    Web3ValueError,
+)
+from web3.types import (
+    FilterParams,
+)
+from web3.utils.numeric import (
+    _import_numpy,
+    hex_quantities_to_array,
+)
+
+if TYPE_CHECKING:
+    import numpy  # noqa: F401
+    from numpy.typing import NDArray  # noqa: F401
+
+ColumnExtractor = Callable[[Sequence[Mapping[str, Any]]], list[Any]]
+ColumnDecoder = Callable[[list[Any]], "NDArray[Any]"]
+
+
+# -- column decoders -- #
+
+
+def _decode_quantities(values: list[Any]) -> "NDArray[numpy.uint64]":
+    # fields missing from some results, e.g. ``baseFeePerGas`` before London, are 0
+    if None in values:
+        values = ["0x0" if value is None else value for value in values]
+    return hex_quantities_to_array(values)
+
+
+def _decode_big_quantities(values: list[Any]) -> "NDArray[numpy.object_]":
+    # quantities which may not fit in 64 bits, as an array of python ints
+    np = _import_numpy()
+    return np.array(
+        [0 if value is None else int(value, 16) for value in values], dtype=object
+    )
+
+
+def _decode_counts(values: list[Any]) -> "NDArray[numpy.uint64]":
+    np = _import_numpy()
+    return np.array(values, dtype=np.uint64)
+
+
+def _decode_booleans(values: list[Any]) -> "NDArray[numpy.bool_]":
+    np = _import_numpy()
+    return np.array(values, dtype=bool)
+
+
+def _decode_variable_bytes(values: list[Any]) -> "NDArray[numpy.object_]":
+    np = _import_numpy()
+    try:
+        return np.array(
+            [b"" if value is None else bytes.fromhex(value[2:]) for value in values],
+            dtype=object,
+        )
+    except ValueError as exc:
+        raise Web3ValueError(f"Invalid hex bytes: {exc}") from exc
+
+
+def _fixed_bytes_decoder(num_bytes: int) -> ColumnDecoder:
+    hex_length = 2 + 2 * num_bytes
+    empty_value = "0x" + "00" * num_bytes
+
+    def decode_fixed_bytes(values: list[Any]) -> "NDArray[numpy.uint8]":
+        # a row of ``num_bytes`` bytes per value, decoded from one joined hex string
+        np = _import_numpy()
+        if None in values:
+            values = [empty_value if value is None else value for value in values]
+        if set(map(len, values)) - {hex_length}:
+            raise Web3ValueError(
+                f"Expected {num_bytes} byte hex values, got: "
+                f"{next(value for value in values if len(value) != hex_length)!r}"
+            )
+        try:
+            buffer = bytes.fromhex("".join(values).replace("0x", ""))
+        except ValueError as exc:
+            raise Web3ValueError(f"Invalid hex bytes: {exc}") from exc
+        return np.frombuffer(buffer, dtype=np.uint8).reshape(len(values), num_bytes)
+
+    return decode_fixed_bytes
+
+
+_decode_addresses = _fixed_bytes_decoder(20)
+_decode_hashes = _fixed_bytes_decoder(32)
+
+
+# -- column extractors -- #
+
+
+def _field(name: str) -> ColumnExtractor:
+    def extract_field(results: Sequence[Mapping[str, Any]]) -> list[Any]:
+        return [result.get(name) for result in results]
+
+    return extract_field
+
+
+def _count_of(name: str) -> ColumnExtractor:
+    def extract_count(results: Sequence[Mapping[str, Any]]) -> list[Any]:
+        return [len(result.get(name) or ()) for result in results]
+
+    return extract_count
+
+
+def _topic(index: int) -> ColumnExtractor:
+    def extract_topic(results: Sequence[Mapping[str, Any]]) -> list[Any]:
+        return [
+            topics[index] if len(topics) > index else None
+            for topics in (result.get("topics") or () for result in results)
+        ]
+
+    return extract_topic
+
+
+BLOCK_COLUMNS: dict[str, tuple[ColumnExtractor, ColumnDecoder]] = {
+    **{
+        field: (_field(field), _decode_quantities)
+        for field in (
+            "number",
+            "timestamp",
+            "gasLimit",
+            "gasUsed",
+            "baseFeePerGas",
+            "size",
+            "difficulty",
+            "blobGasUsed",
+            "excessBlobGas",
+        )
+    },
+    **{
+        field: (_field(field), _decode_hashes)
+        for field in (
+            "hash",
+            "parentHash",
+            "stateRoot",
+            "transactionsRoot",
+            "receiptsRoot",
+            "sha3Uncles",
+            "mixHash",
+            "withdrawalsRoot",
+            "parentBeaconBlockRoot",
+            "requestsHash",
+        )
+    },
+    "totalDifficulty": (_field("totalDifficulty"), _decode_big_quantities),
+    "miner": (_field("miner"), _decode_addresses),
+    "nonce": (_field("nonce"), _fixed_bytes_decoder(8)),
+    "logsBloom": (_field("logsBloom"), _fixed_bytes_decoder(256)),
+    "extraData": (_field("extraData"), _decode_variable_bytes),
+    "transactionCount": (_count_of("transactions"), _decode_counts),
+}
+
+LOG_COLUMNS: dict[str, tuple[ColumnExtractor, ColumnDecoder]] = {
+    **{
+        field: (_field(field), _decode_quantities)
+        for field in ("blockNumber", "blockTimestamp", "logIndex", "transactionIndex")
+    },
+    "address": (_field("address"), _decode_addresses),
+    "blockHash": (_field("blockHash"), _decode_hashes),
+    "transactionHash": (_field("transactionHash"), _decode_hashes),
+    "data": (_field("data"), _decode_variable_bytes),
+    "removed": (_field("removed"), _decode_booleans),
+    "topicCount": (_count_of("topics"), _decode_counts),
+    **{f"topic{index}": (_topic(index), _decode_hashes) for index in range(4)},
+}
+
+
+class ColumnarResults:
+    """
+    Decode the selected fields of raw JSON-RPC results, one batch of results at a
+    time, into a NumPy array per field: ``numpy.uint64`` arrays of quantities,
+    ``(rows, num_bytes)`` ``numpy.uint8`` arrays of hashes, addresses and other fixed
+    size bytes, and object arrays of variable size bytes. Fields missing from a
+    result are zero, and only the selected fields are ever read from a result.
+    """
+
+    def __init__(
+        self,
+        columns: Mapping[str, tuple[ColumnExtractor, ColumnDecoder]],
+        fields: Sequence[str] | None = None,
+    ) -> None:
+        if fields is None:
+            fields = tuple(columns)
+        elif isinstance(fields, str):
+            raise Web3ValueError(
+                f"Fields must be a sequence of field names: {fields!r}"
+            )
+        unsupported_fields = [field for field in fields if field not in columns]
+        if unsupported_fields:
+            raise Web3ValueError(
+                f"Unsupported fields: {unsupported_fields}. Expected any of: "
+                f"{list(columns)}"
+            )
+        # the field names in order, without duplicates
+        self._columns = {field: columns[field] for field in fields}
+        self._chunks: dict[str, list["NDArray[Any]"]] = {
+            field: [] for field in self._columns
+        }
+
+    def add(self, results: Sequence[Mapping[str, Any]]) -> None:
+        for field, (extract, decode) in self._columns.items():
+            self._chunks[field].append(decode(extract(results)))
+
+    def to_columns(self) -> dict[str, "NDArray[Any]"]:
+        np = _import_numpy()
+        if any(not chunks for chunks in self._chunks.values()):
+            self.add([])
+        return {field: np.concatenate(chunks) for field, chunks in self._chunks.items()}
+
+
+def split_filter_params(
+    filter_params: FilterParams, blocks_per_request: int | None
+) -> Iterator[FilterParams]:
+    """
+    Split the block range of ``filter_params`` into filters of at most
+    ``blocks_per_request`` blocks each, or yield ``filter_params`` as is if
+    ``blocks_per_request`` is ``None``.
+    """
+    if blocks_per_request is None:
+        yield filter_params
+        return
+
+    from_block = filter_params.get("fromBlock")
+    to_block = filter_params.get("toBlock")
+    if not isinstance(from_block, int) or not isinstance(to_block, int):
+        raise Web3ValueError(
+            "Splitting a filter into requests of `blocks_per_request` blocks requires "
+            "integer `fromBlock` and `toBlock` filter params."
+        )
+    elif blocks_per_request < 1:
+        raise Web3ValueError("`blocks_per_request` must be a positive integer.")
+
+    for start in range(from_block, to_block + 1, blocks_per_request):
+        yield {
+            **filter_params,
+            "fromBlock": start,
+            "toBlock": min(start + blocks_per_request - 1, to_block),
+        }
@@ -53,6 +53,7 @@ from web3._utils.validation import (
 )
 from web3.datastructures import (
     AttributeDict,
+    AttributeRecord,
 )
 from web3.exceptions import (
     Web3TypeError,
@@ -296,6 +297,8 @@ class Web3JsonEncoder(json.JSONEncoder):
     def default(self, obj: Any) -> dict[Any, Any] | HexStr:
         if isinstance(obj, AttributeDict):
             return obj.__dict__
+        elif isinstance(obj, AttributeRecord):
+            return dict(obj)
         elif isinstance(obj, (HexBytes, bytes)):
             return to_hex(obj)
         elif isinstance(obj, BaseModel):
@@ -72,6 +72,7 @@ from web3._utils.normalizers import (
 )
 from web3.datastructures import (
     AttributeDict,
+    AttributeRecord,
 )
 from web3.exceptions import (
     InvalidEventABI,
@@ -292,7 +293,7 @@ def get_event_data(
         blockNumber=log_entry["blockNumber"],
     )
 
-    if isinstance(log_entry, AttributeDict):
+    if isinstance(log_entry, (AttributeDict, AttributeRecord)):
         return cast(EventData, AttributeDict.recursive(event_data))
 
     return event_data
@@ -1,11 +1,16 @@
+import binascii
 import codecs
 import operator
+import re
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Collection,
+    ItemsView,
     Iterable,
+    Mapping,
+    NamedTuple,
     NoReturn,
     TypeVar,
     Union,
@@ -26,12 +31,10 @@ from eth_utils.curried import (
     apply_formatters_to_sequence,
     apply_one_of_formatters,
     is_0x_prefixed,
-    is_address,
     is_bytes,
     is_integer,
     is_null,
     is_string,
-    to_checksum_address,
     to_list,
     to_tuple,
 )
@@ -40,6 +43,7 @@ from eth_utils.toolz import (
     compose,
     curried,
     curry,
+    identity,
     partial,
 )
 from hexbytes import (
@@ -52,6 +56,10 @@ from pydantic import (
 from web3._utils.abi import (
     is_length,
 )
+from web3._utils.checksum import (
+    checksum_address,
+    checksum_address_if_address,
+)
 from web3._utils.error_formatters_utils import (
     raise_block_not_found_on_error,
     raise_contract_logic_error_on_revert,
@@ -91,6 +99,7 @@ from web3._utils.utility_methods import (
 )
 from web3.datastructures import (
     AttributeDict,
+    AttributeRecord,
     ReadableAttributeDict,
 )
 from web3.exceptions import (
@@ -110,6 +119,9 @@ from web3.types import (
     TxParams,
     _Hash32,
 )
+from web3.utils.formatting import (
+    BytesRepresentation,
+)
 
 if TYPE_CHECKING:
     from web3.eth import AsyncEth  # noqa: F401
@@ -118,13 +130,24 @@ if TYPE_CHECKING:
 
 TValue = TypeVar("TValue")
 
+_LOWER_HEXSTR_PATTERN = re.compile("0x[0-9a-f]*")
+
 
 def bytes_to_ascii(value: bytes) -> str:
     return codecs.decode(value, "ascii")
 
 
 to_ascii_if_bytes = apply_formatter_if(is_bytes, bytes_to_ascii)
-to_integer_if_hex = apply_formatter_if(is_string, hex_to_integer)
+
+
+def to_integer_if_hex(value: Any) -> Any:
+    # the same as ``apply_formatter_if(is_string, hex_to_integer)``, without the
+    # curried layers, since it formats most numeric result fields
+    if isinstance(value, (str, bytes, bytearray)):
+        return int(value, 16)
+    return value
+
+
 to_hex_if_integer = apply_formatter_if(is_integer, integer_to_hex)
 
 is_false = partial(operator.is_, False)
@@ -156,6 +179,26 @@ def is_attrdict(val: Any) -> bool:
     return isinstance(val, AttributeDict)
 
 
+def _preserve_result_type(value: Any, formatted: dict[str, Any]) -> Any:
+    """
+    Convert ``formatted`` back to the ``AttributeDict`` or ``AttributeRecord`` type of
+    the original ``value``.
+    """
+    if isinstance(value, (AttributeDict, AttributeRecord)):
+        return type(value).recursive(formatted)
+    return formatted
+
+
+def _unconverted_items(value: Mapping[str, Any]) -> ItemsView[str, Any]:
+    """
+    The items of ``value``, without converting the values of a ``LazyAttributeDict``
+    that have not been read yet. The formatted result is converted again anyway.
+    """
+    if is_attrdict(value):
+        return value.__dict__.items()
+    return value.items()
+
+
 @curry
 def type_aware_apply_formatters_to_dict(
     formatters: Formatters,
@@ -170,12 +213,10 @@ def type_aware_apply_formatters_to_dict(
     if isinstance(value, BaseModel):
         value = value.model_dump(by_alias=True)
 
-    formatted_dict: dict[str, Any] = apply_formatters_to_dict(formatters, dict(value))
-    return (
-        AttributeDict.recursive(formatted_dict)
-        if is_attrdict(value)
-        else formatted_dict
+    formatted_dict: dict[str, Any] = apply_formatters_to_dict(
+        formatters, dict(_unconverted_items(value))
     )
+    return _preserve_result_type(value, formatted_dict)
 
 
 def type_aware_apply_formatters_to_dict_keys_and_values(
@@ -190,19 +231,197 @@ def type_aware_apply_formatters_to_dict_keys_and_values(
         dict_like_object = dict_like_object.model_dump(by_alias=True)
 
     formatted_dict = {
-        key_formatters(k): value_formatters(v) for k, v in dict_like_object.items()
+        key_formatters(k): value_formatters(v)
+        for k, v in _unconverted_items(dict_like_object)
     }
-    return (
-        AttributeDict.recursive(formatted_dict)
-        if is_attrdict(dict_like_object)
-        else formatted_dict
-    )
+    return _preserve_result_type(dict_like_object, formatted_dict)
 
 
 def apply_list_to_array_formatter(formatter: Any) -> Callable[..., Any]:
     return to_list(apply_formatter_to_array(formatter))
 
 
+# -- compiled schema formatters -- #
+
+# Blocks, transactions, receipts and logs are formatted field by field for every
+# result, so their schemas are built from the plain field formatters below rather
+# than curried ``eth_utils`` applicators, and each schema is compiled into a
+# formatter that makes a single pass over the dict.
+
+
+def format_if_not_null(formatter: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def _format_if_not_null(value: Any) -> Any:
+        return value if value is None else formatter(value)
+
+    return _format_if_not_null
+
+
+def format_list(formatter: Callable[[Any], Any]) -> Callable[[Any], list[Any]]:
+    def _format_list(value: Any) -> list[Any]:
+        return [formatter(item) for item in value]
+
+    return _format_list
+
+
+def format_array(formatter: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Like ``format_list``, but keeps the type of the array, as
+    ``apply_formatter_to_array`` does.
+    """
+
+    def _format_array(value: Any) -> Any:
+        formatted = [formatter(item) for item in value]
+        return formatted if type(value) is list else type(value)(formatted)
+
+    return _format_array
+
+
+def hexbytes_formatter(
+    num_bytes: int, variable_length: bool = False
+) -> Callable[[Any], HexBytes]:
+    to_hexbytes_func = to_hexbytes.func
+    hexstr_length = 2 + 2 * num_bytes
+
+    def _to_hexbytes(value: Any) -> HexBytes:
+        if (
+            isinstance(value, str)
+            and len(value) == hexstr_length
+            and value.startswith("0x")
+        ):
+            # a hex string of exactly ``num_bytes`` needs no length checks
+            try:
+                return HexBytes(binascii.unhexlify(value[2:]))
+            except binascii.Error:
+                pass
+        return to_hexbytes_func(num_bytes, value, variable_length)
+
+    return _to_hexbytes
+
+
+def bytes_formatter(
+    num_bytes: int, variable_length: bool = False
+) -> Callable[[Any], bytes]:
+    """
+    The same as ``hexbytes_formatter``, returning plain ``bytes``.
+    """
+    to_hexbytes_func = to_hexbytes.func
+    hexstr_length = 2 + 2 * num_bytes
+
+    def _to_bytes(value: Any) -> bytes:
+        if (
+            isinstance(value, str)
+            and len(value) == hexstr_length
+            and value.startswith("0x")
+        ):
+            try:
+                return binascii.unhexlify(value[2:])
+            except binascii.Error:
+                pass
+        return bytes(to_hexbytes_func(num_bytes, value, variable_length))
+
+    return _to_bytes
+
+
+def hexstr_formatter(
+    num_bytes: int, variable_length: bool = False
+) -> Callable[[Any], HexStr]:
+    """
+    The same as ``hexbytes_formatter``, returning the 0x-prefixed, lower case hex
+    string of the bytes. Such a hex string of exactly ``num_bytes`` is returned as is,
+    without decoding it.
+    """
+    to_hexbytes_func = to_hexbytes.func
+    hexstr_length = 2 + 2 * num_bytes
+
+    def _to_hexstr(value: Any) -> HexStr:
+        if (
+            isinstance(value, str)
+            and len(value) == hexstr_length
+            and _LOWER_HEXSTR_PATTERN.fullmatch(value)
+        ):
+            return cast(HexStr, value)
+        return cast(
+            HexStr, to_hexbytes_func(num_bytes, value, variable_length).to_0x_hex()
+        )
+
+    return _to_hexstr
+
+
+def to_bytes_result(value: Any) -> bytes:
+    """
+    The same as ``HexBytes``, returning plain ``bytes``.
+    """
+    if isinstance(value, str) and value.startswith("0x"):
+        try:
+            return binascii.unhexlify(value[2:])
+        except binascii.Error:
+            pass
+    return bytes(HexBytes(value))
+
+
+def to_hexstr_result(value: Any) -> HexStr:
+    """
+    The 0x-prefixed, lower case hex string of ``HexBytes(value)``, returning such a
+    hex string as is.
+    """
+    if (
+        isinstance(value, str)
+        and len(value) % 2 == 0
+        and _LOWER_HEXSTR_PATTERN.fullmatch(value)
+    ):
+        return cast(HexStr, value)
+    return cast(HexStr, HexBytes(value).to_0x_hex())
+
+
+# the formatters of sized byte fields, like ``hexbytes_formatter``, and of byte fields
+# of any length, like ``HexBytes``, for each ``BytesRepresentation``
+BYTES_REPRESENTATION_FORMATTERS: dict[
+    BytesRepresentation,
+    tuple[Callable[..., Callable[[Any], Any]], Callable[[Any], Any]],
+] = {
+    BytesRepresentation.HEXBYTES: (hexbytes_formatter, HexBytes),
+    BytesRepresentation.BYTES: (bytes_formatter, to_bytes_result),
+    BytesRepresentation.HEX: (hexstr_formatter, to_hexstr_result),
+}
+
+
+def compile_dict_formatter(
+    formatters: Mapping[str, Callable[..., Any]],
+) -> Callable[[Any], Any]:
+    """
+    Compile ``formatters`` into a single pass formatter that behaves like
+    ``type_aware_apply_formatters_to_dict(formatters)``.
+    """
+    get_formatter = formatters.get
+
+    def _compiled_formatter(
+        value: AttributeDict[str, Any] | dict[str, Any],
+    ) -> ReadableAttributeDict[str, Any] | dict[str, Any]:
+        if isinstance(value, BaseModel):
+            value = value.model_dump(by_alias=True)
+
+        formatted: dict[str, Any] = {}
+        for key, item in _unconverted_items(value):
+            formatter = get_formatter(key)
+            if formatter is None:
+                formatted[key] = item
+                continue
+            try:
+                formatted[key] = formatter(item)
+            except ValueError as exc:
+                raise Web3ValueError(
+                    f"Could not format invalid value {item!r} as field {key!r}"
+                ) from exc
+            except TypeError as exc:
+                raise Web3TypeError(
+                    f"Could not format invalid type {item!r} as field {key!r}"
+                ) from exc
+
+        return _preserve_result_type(value, formatted)
+
+    return _compiled_formatter
+
+
 def storage_key_to_hexstr(value: bytes | int | str) -> HexStr:
     if not isinstance(value, (bytes, int, str)):
         raise Web3ValueError(
@@ -221,10 +440,10 @@ def storage_key_to_hexstr(value: bytes | int | str) -> HexStr:
     raise Web3ValueError(f"Storage key must be a 32-byte value, got {value!r}")
 
 
-ACCESS_LIST_FORMATTER = type_aware_apply_formatters_to_dict(
+ACCESS_LIST_FORMATTER = compile_dict_formatter(
     {
-        "address": to_checksum_address,
-        "storageKeys": apply_list_to_array_formatter(storage_key_to_hexstr),
+        "address": checksum_address,
+        "storageKeys": format_list(storage_key_to_hexstr),
     }
 )
 
@@ -235,109 +454,163 @@ ACCESS_LIST_RESPONSE_FORMATTER = type_aware_apply_formatters_to_dict(
     }
 )
 
-AUTH_LIST_RESULT_FORMATTER = apply_formatter_if(
-    is_not_null,
-    apply_formatter_to_array(
-        type_aware_apply_formatters_to_dict(
-            {
-                "chainId": to_integer_if_hex,
-                "address": to_checksum_address,
-                "nonce": to_integer_if_hex,
-                "yParity": to_integer_if_hex,
-                "r": to_hexbytes(32, variable_length=True),
-                "s": to_hexbytes(32, variable_length=True),
-            }
-        ),
-    ),
-)
-
-TRANSACTION_RESULT_FORMATTERS = {
-    "blockHash": apply_formatter_if(is_not_null, to_hexbytes(32)),
-    "blockNumber": apply_formatter_if(is_not_null, to_integer_if_hex),
-    "transactionIndex": apply_formatter_if(is_not_null, to_integer_if_hex),
-    "nonce": to_integer_if_hex,
-    "gas": to_integer_if_hex,
-    "gasPrice": to_integer_if_hex,
-    "maxFeePerGas": to_integer_if_hex,
-    "maxPriorityFeePerGas": to_integer_if_hex,
-    "value": to_integer_if_hex,
-    "from": to_checksum_address,
-    "publicKey": apply_formatter_if(is_not_null, to_hexbytes(64)),
-    "r": apply_formatter_if(is_not_null, to_hexbytes(32, variable_length=True)),
-    "raw": HexBytes,
-    "s": apply_formatter_if(is_not_null, to_hexbytes(32, variable_length=True)),
-    "to": apply_formatter_if(is_address, to_checksum_address),
-    "hash": to_hexbytes(32),
-    "v": apply_formatter_if(is_not_null, to_integer_if_hex),
-    "yParity": apply_formatter_if(is_not_null, to_integer_if_hex),
-    "standardV": apply_formatter_if(is_not_null, to_integer_if_hex),
-    "type": apply_formatter_if(is_not_null, to_integer_if_hex),
-    "chainId": apply_formatter_if(is_not_null, to_integer_if_hex),
-    "accessList": apply_formatter_if(
-        is_not_null,
-        apply_formatter_to_array(ACCESS_LIST_FORMATTER),
-    ),
-    "input": HexBytes,
-    "data": HexBytes,  # Nethermind, for example, returns both `input` and `data`
-    "maxFeePerBlobGas": to_integer_if_hex,
-    "blobVersionedHashes": apply_formatter_if(
-        is_not_null, apply_formatter_to_array(to_hexbytes(32))
-    ),
-    "authorizationList": AUTH_LIST_RESULT_FORMATTER,
-}
-
-
-transaction_result_formatter = type_aware_apply_formatters_to_dict(
-    TRANSACTION_RESULT_FORMATTERS
-)
-
-WITHDRAWAL_RESULT_FORMATTERS = {
+WITHDRAWAL_RESULT_FORMATTERS: dict[str, Callable[..., Any]] = {
     "index": to_integer_if_hex,
     "validatorIndex": to_integer_if_hex,
-    "address": to_checksum_address,
+    "address": checksum_address,
     "amount": to_integer_if_hex,
 }
-withdrawal_result_formatter = type_aware_apply_formatters_to_dict(
-    WITHDRAWAL_RESULT_FORMATTERS
-)
+withdrawal_result_formatter = compile_dict_formatter(WITHDRAWAL_RESULT_FORMATTERS)
 
 
-LOG_ENTRY_FORMATTERS = {
-    "blockHash": apply_formatter_if(is_not_null, to_hexbytes(32)),
-    "blockNumber": apply_formatter_if(is_not_null, to_integer_if_hex),
-    "transactionIndex": apply_formatter_if(is_not_null, to_integer_if_hex),
-    "transactionHash": apply_formatter_if(is_not_null, to_hexbytes(32)),
-    "logIndex": to_integer_if_hex,
-    "address": to_checksum_address,
-    "topics": apply_list_to_array_formatter(to_hexbytes(32)),
-    "data": HexBytes,
-}
+class ResultSchemas(NamedTuple):
+    transaction: dict[str, Callable[..., Any]]
+    log_entry: dict[str, Callable[..., Any]]
+    receipt: dict[str, Callable[..., Any]]
+    block: dict[str, Callable[..., Any]]
 
 
-log_entry_formatter = type_aware_apply_formatters_to_dict(LOG_ENTRY_FORMATTERS)
+def build_result_schemas(bytes_representation: BytesRepresentation) -> ResultSchemas:
+    """
+    The field formatters of transaction, log entry, receipt and block results, with
+    their hashes, topics and other byte fields formatted as ``bytes_representation``.
+    """
+    sized_bytes, unsized_bytes = BYTES_REPRESENTATION_FORMATTERS[bytes_representation]
+    to_hash32 = sized_bytes(32)
+
+    auth_list_formatter = format_if_not_null(
+        format_array(
+            compile_dict_formatter(
+                {
+                    "chainId": to_integer_if_hex,
+                    "address": checksum_address,
+                    "nonce": to_integer_if_hex,
+                    "yParity": to_integer_if_hex,
+                    "r": sized_bytes(32, variable_length=True),
+                    "s": sized_bytes(32, variable_length=True),
+                }
+            ),
+        ),
+    )
 
+    transaction = {
+        "blockHash": format_if_not_null(to_hash32),
+        "blockNumber": format_if_not_null(to_integer_if_hex),
+        "transactionIndex": format_if_not_null(to_integer_if_hex),
+        "nonce": to_integer_if_hex,
+        "gas": to_integer_if_hex,
+        "gasPrice": to_integer_if_hex,
+        "maxFeePerGas": to_integer_if_hex,
+        "maxPriorityFeePerGas": to_integer_if_hex,
+        "value": to_integer_if_hex,
+        "from": checksum_address,
+        "publicKey": format_if_not_null(sized_bytes(64)),
+        "r": format_if_not_null(sized_bytes(32, variable_length=True)),
+        "raw": unsized_bytes,
+        "s": format_if_not_null(sized_bytes(32, variable_length=True)),
+        "to": checksum_address_if_address,
+        "hash": to_hash32,
+        "v": format_if_not_null(to_integer_if_hex),
+        "yParity": format_if_not_null(to_integer_if_hex),
+        "standardV": format_if_not_null(to_integer_if_hex),
+        "type": format_if_not_null(to_integer_if_hex),
+        "chainId": format_if_not_null(to_integer_if_hex),
+        "accessList": format_if_not_null(format_array(ACCESS_LIST_FORMATTER)),
+        "input": unsized_bytes,
+        # Nethermind, for example, returns both `input` and `data`
+        "data": unsized_bytes,
+        "maxFeePerBlobGas": to_integer_if_hex,
+        "blobVersionedHashes": format_if_not_null(format_array(to_hash32)),
+        "authorizationList": auth_list_formatter,
+    }
 
-RECEIPT_FORMATTERS = {
-    "blockHash": apply_formatter_if(is_not_null, to_hexbytes(32)),
-    "blockNumber": apply_formatter_if(is_not_null, to_integer_if_hex),
-    "transactionIndex": apply_formatter_if(is_not_null, to_integer_if_hex),
-    "transactionHash": to_hexbytes(32),
-    "cumulativeGasUsed": to_integer_if_hex,
-    "status": to_integer_if_hex,
-    "gasUsed": to_integer_if_hex,
-    "contractAddress": apply_formatter_if(is_not_null, to_checksum_address),
-    "logs": apply_list_to_array_formatter(log_entry_formatter),
-    "logsBloom": to_hexbytes(256, variable_length=True),
-    "from": apply_formatter_if(is_not_null, to_checksum_address),
-    "to": apply_formatter_if(is_address, to_checksum_address),
-    "effectiveGasPrice": to_integer_if_hex,
-    "type": to_integer_if_hex,
-    "blobGasPrice": to_integer_if_hex,
-    "blobGasUsed": to_integer_if_hex,
-}
+    log_entry = {
+        "blockHash": format_if_not_null(to_hash32),
+        "blockNumber": format_if_not_null(to_integer_if_hex),
+        "transactionIndex": format_if_not_null(to_integer_if_hex),
+        "transactionHash": format_if_not_null(to_hash32),
+        "logIndex": to_integer_if_hex,
+        "address": checksum_address,
+        "topics": format_list(to_hash32),
+        "data": unsized_bytes,
+    }
 
+    receipt = {
+        "blockHash": format_if_not_null(to_hash32),
+        "blockNumber": format_if_not_null(to_integer_if_hex),
+        "transactionIndex": format_if_not_null(to_integer_if_hex),
+        "transactionHash": to_hash32,
+        "cumulativeGasUsed": to_integer_if_hex,
+        "status": to_integer_if_hex,
+        "gasUsed": to_integer_if_hex,
+        "contractAddress": format_if_not_null(checksum_address),
+        "logs": format_list(compile_dict_formatter(log_entry)),
+        "logsBloom": sized_bytes(256, variable_length=True),
+        "from": format_if_not_null(checksum_address),
+        "to": checksum_address_if_address,
+        "effectiveGasPrice": to_integer_if_hex,
+        "type": to_integer_if_hex,
+        "blobGasPrice": to_integer_if_hex,
+        "blobGasUsed": to_integer_if_hex,
+    }
 
-receipt_formatter = type_aware_apply_formatters_to_dict(RECEIPT_FORMATTERS)
+    format_transactions = format_list(compile_dict_formatter(transaction))
+    format_transaction_hashes = format_list(to_hash32)
+
+    def format_block_transactions(value: Any) -> list[Any]:
+        # the same as ``apply_one_of_formatters`` over full transactions and hashes
+        if is_array_of_dicts(value):
+            return format_transactions(value)
+        elif is_array_of_strings(value):
+            return format_transaction_hashes(value)
+        raise Web3ValueError(
+            "The provided value did not satisfy any of the formatter conditions"
+        )
+
+    block = {
+        "baseFeePerGas": to_integer_if_hex,
+        "extraData": format_if_not_null(sized_bytes(32, variable_length=True)),
+        "gasLimit": to_integer_if_hex,
+        "gasUsed": to_integer_if_hex,
+        "size": to_integer_if_hex,
+        "timestamp": to_integer_if_hex,
+        "hash": format_if_not_null(to_hash32),
+        "logsBloom": format_if_not_null(sized_bytes(256, variable_length=True)),
+        "miner": format_if_not_null(checksum_address),
+        "mixHash": format_if_not_null(to_hash32),
+        "nonce": format_if_not_null(sized_bytes(8, variable_length=True)),
+        "number": format_if_not_null(to_integer_if_hex),
+        "parentHash": format_if_not_null(to_hash32),
+        "sha3Uncles": format_if_not_null(to_hash32),
+        "uncles": format_list(to_hash32),
+        "difficulty": to_integer_if_hex,
+        "receiptsRoot": format_if_not_null(to_hash32),
+        "stateRoot": format_if_not_null(to_hash32),
+        "totalDifficulty": to_integer_if_hex,
+        "transactions": format_block_transactions,
+        "transactionsRoot": format_if_not_null(to_hash32),
+        "withdrawals": format_if_not_null(format_list(withdrawal_result_formatter)),
+        "withdrawalsRoot": format_if_not_null(to_hash32),
+        "blobGasUsed": to_integer_if_hex,
+        "excessBlobGas": to_integer_if_hex,
+        "parentBeaconBlockRoot": format_if_not_null(to_hash32),
+        "requestsHash": format_if_not_null(to_hash32),
+    }
+
+    return ResultSchemas(transaction, log_entry, receipt, block)
+
+
+(
+    TRANSACTION_RESULT_FORMATTERS,
+    LOG_ENTRY_FORMATTERS,
+    RECEIPT_FORMATTERS,
+    BLOCK_RESULT_FORMATTERS,
+) = build_result_schemas(BytesRepresentation.HEXBYTES)
+
+transaction_result_formatter = compile_dict_formatter(TRANSACTION_RESULT_FORMATTERS)
+log_entry_formatter = compile_dict_formatter(LOG_ENTRY_FORMATTERS)
+receipt_formatter = compile_dict_formatter(RECEIPT_FORMATTERS)
+block_result_formatter = compile_dict_formatter(BLOCK_RESULT_FORMATTERS)
 
 BLOCK_REQUEST_FORMATTERS = {
     "baseFeePerGas": to_hex_if_integer,
@@ -348,7 +621,7 @@ BLOCK_REQUEST_FORMATTERS = {
     "timestamp": to_hex_if_integer,
     "hash": to_hex_if_bytes,
     "logsBloom": to_hex_if_bytes,
-    "miner": to_checksum_address,
+    "miner": checksum_address,
     "mixHash": to_hex_if_bytes,
     "nonce": to_hex_if_bytes,
     "number": to_hex_if_integer,
@@ -365,49 +638,6 @@ BLOCK_REQUEST_FORMATTERS = {
 }
 block_request_formatter = type_aware_apply_formatters_to_dict(BLOCK_REQUEST_FORMATTERS)
 
-BLOCK_RESULT_FORMATTERS = {
-    "baseFeePerGas": to_integer_if_hex,
-    "extraData": apply_formatter_if(is_not_null, to_hexbytes(32, variable_length=True)),
-    "gasLimit": to_integer_if_hex,
-    "gasUsed": to_integer_if_hex,
-    "size": to_integer_if_hex,
-    "timestamp": to_integer_if_hex,
-    "hash": apply_formatter_if(is_not_null, to_hexbytes(32)),
-    "logsBloom": apply_formatter_if(
-        is_not_null, to_hexbytes(256, variable_length=True)
-    ),
-    "miner": apply_formatter_if(is_not_null, to_checksum_address),
-    "mixHash": apply_formatter_if(is_not_null, to_hexbytes(32)),
-    "nonce": apply_formatter_if(is_not_null, to_hexbytes(8, variable_length=True)),
-    "number": apply_formatter_if(is_not_null, to_integer_if_hex),
-    "parentHash": apply_formatter_if(is_not_null, to_hexbytes(32)),
-    "sha3Uncles": apply_formatter_if(is_not_null, to_hexbytes(32)),
-    "uncles": apply_list_to_array_formatter(to_hexbytes(32)),
-    "difficulty": to_integer_if_hex,
-    "receiptsRoot": apply_formatter_if(is_not_null, to_hexbytes(32)),
-    "stateRoot": apply_formatter_if(is_not_null, to_hexbytes(32)),
-    "totalDifficulty": to_integer_if_hex,
-    "transactions": apply_one_of_formatters(
-        (
-            (
-                is_array_of_dicts,
-                apply_list_to_array_formatter(transaction_result_formatter),
-            ),
-            (is_array_of_strings, apply_list_to_array_formatter(to_hexbytes(32))),
-        )
-    ),
-    "transactionsRoot": apply_formatter_if(is_not_null, to_hexbytes(32)),
-    "withdrawals": apply_formatter_if(
-        is_not_null, apply_list_to_array_formatter(withdrawal_result_formatter)
-    ),
-    "withdrawalsRoot": apply_formatter_if(is_not_null, to_hexbytes(32)),
-    "blobGasUsed": to_integer_if_hex,
-    "excessBlobGas": to_integer_if_hex,
-    "parentBeaconBlockRoot": apply_formatter_if(is_not_null, to_hexbytes(32)),
-    "requestsHash": apply_formatter_if(is_not_null, to_hexbytes(32)),
-}
-block_result_formatter = type_aware_apply_formatters_to_dict(BLOCK_RESULT_FORMATTERS)
-
 
 SYNCING_FORMATTERS = {
     "startingBlock": to_integer_if_hex,
@@ -468,7 +698,7 @@ STORAGE_PROOF_FORMATTERS = {
 }
 
 ACCOUNT_PROOF_FORMATTERS = {
-    "address": to_checksum_address,
+    "address": checksum_address,
     "accountProof": apply_list_to_array_formatter(HexBytes),
     "balance": to_integer_if_hex,
     "codeHash": to_hexbytes(32),
@@ -503,7 +733,7 @@ AUTH_LIST_REQUEST_FORMATTER = apply_formatter_if(
         type_aware_apply_formatters_to_dict(
             {
                 "chainId": to_hex_if_integer,
-                "address": to_checksum_address,
+                "address": checksum_address,
                 "nonce": to_hex_if_integer,
                 "yParity": to_hex_if_integer,
                 "r": to_hex_if_integer,
@@ -514,8 +744,8 @@ AUTH_LIST_REQUEST_FORMATTER = apply_formatter_if(
 )
 
 TRANSACTION_REQUEST_FORMATTER = {
-    "from": to_checksum_address,
-    "to": apply_formatter_if(is_address, to_checksum_address),
+    "from": checksum_address,
+    "to": checksum_address_if_address,
     "gas": to_hex_if_integer,
     "gasPrice": to_hex_if_integer,
     "value": to_hex_if_integer,
@@ -578,7 +808,7 @@ call_with_override: Callable[
         transaction_param_formatter,
         to_hex_if_integer,
         lambda val: type_aware_apply_formatters_to_dict_keys_and_values(
-            to_checksum_address,
+            checksum_address,
             state_override_formatter,
             val,
         ),
@@ -605,7 +835,7 @@ estimate_gas_with_override: Callable[
         transaction_param_formatter,
         to_hex_if_integer,
         lambda val: type_aware_apply_formatters_to_dict_keys_and_values(
-            to_checksum_address,
+            checksum_address,
             state_override_formatter,
             val,
         ),
@@ -622,7 +852,7 @@ block_state_calls_formatter: Callable[
             "blockOverrides": block_request_formatter,
             "stateOverrides": (
                 lambda val: type_aware_apply_formatters_to_dict_keys_and_values(
-                    to_checksum_address,
+                    checksum_address,
                     state_override_formatter,
                     val,
                 )
@@ -679,7 +909,7 @@ FILTER_PARAM_NORMALIZERS = type_aware_apply_formatters_to_dict(
 )
 
 
-GETH_WALLET_FORMATTER = {"address": to_checksum_address}
+GETH_WALLET_FORMATTER = {"address": checksum_address}
 
 geth_wallet_formatter = type_aware_apply_formatters_to_dict(GETH_WALLET_FORMATTER)
 
@@ -760,7 +990,7 @@ DEBUG_CALLTRACE_LOG_ENTRY_FORMATTERS = apply_formatter_if(
     is_not_null,
     type_aware_apply_formatters_to_dict(
         {
-            "address": to_checksum_address,
+            "address": checksum_address,
             "topics": apply_list_to_array_formatter(to_hexbytes(32)),
             "data": HexBytes,
             "position": to_integer_if_hex,
@@ -781,7 +1011,7 @@ PRETRACE_INNER_FORMATTERS = {
 
 
 def has_pretrace_keys(val: Any) -> bool:
-    if isinstance(val, dict) or isinstance(val, AttributeDict):
+    if isinstance(val, (dict, AttributeDict, AttributeRecord)):
         return (
             val.get("balance")
             or val.get("nonce")
@@ -796,7 +1026,7 @@ def pretrace_formatter(
     resp: AttributeDict[str, Any] | dict[str, Any],
 ) -> ReadableAttributeDict[str, Any] | dict[str, Any]:
     return type_aware_apply_formatters_to_dict_keys_and_values(
-        apply_formatter_if(is_address, to_checksum_address),
+        checksum_address_if_address,
         apply_formatter_if(
             has_pretrace_keys,
             type_aware_apply_formatters_to_dict(PRETRACE_INNER_FORMATTERS),
@@ -812,8 +1042,8 @@ DEBUG_PRESTATE_DIFFMODE_FORMATTERS = {
 
 
 DEBUG_CALLTRACE_FORMATTERS = {
-    "from": to_checksum_address,
-    "to": to_checksum_address,
+    "from": checksum_address,
+    "to": checksum_address,
     "value": to_integer_if_hex,
     "gas": to_integer_if_hex,
     "gasUsed": to_integer_if_hex,
@@ -860,18 +1090,18 @@ TRACE_ACTION_FORMATTERS = apply_formatter_if(
     type_aware_apply_formatters_to_dict(
         {
             # call and create types
-            "from": to_checksum_address,
-            "to": to_checksum_address,
+            "from": checksum_address,
+            "to": checksum_address,
             "input": HexBytes,
             "value": to_integer_if_hex,
             "gas": to_integer_if_hex,
             # create type
             "init": HexBytes,
             # suicide type
-            "address": to_checksum_address,
-            "refundAddress": to_checksum_address,
+            "address": checksum_address,
+            "refundAddress": checksum_address,
             # reward type
-            "author": to_checksum_address,
+            "author": checksum_address,
         }
     ),
 )
@@ -881,7 +1111,7 @@ TRACE_RESULT_FORMATTERS = apply_formatter_if(
     is_not_null,
     type_aware_apply_formatters_to_dict(
         {
-            "address": to_checksum_address,
+            "address": checksum_address,
             "code": HexBytes,
             "output": HexBytes,
             "gasUsed": to_integer_if_hex,
@@ -919,68 +1149,88 @@ common_tracing_result_formatter = type_aware_apply_formatters_to_dict(
 
 
 # -- eth_subscribe -- #
-def subscription_formatter(value: Any) -> HexBytes | HexStr | dict[str, Any]:
-    if is_hexstr(value):
-        # subscription id from the original subscription request
-        return HexStr(value)
-
-    elif isinstance(value, dict):
-        # subscription messages
-
-        result = value.get("result")
-        result_formatter = None
-
-        if isinstance(result, str) and len(result.replace("0x", "")) == 64:
-            # transaction hash, from `newPendingTransactions` subscription w/o full_txs
-            result_formatter = HexBytes
-
-        elif isinstance(result, (dict, AttributeDict)):
-            result_key_set = set(result.keys())
-
-            # handle dict subscription responses
-            if either_set_is_a_subset(
-                result_key_set,
-                set(BLOCK_RESULT_FORMATTERS.keys()),
-                percentage=90,
-            ):
-                # block format, newHeads
-                result_formatter = block_result_formatter
-
-            elif either_set_is_a_subset(
-                result_key_set, set(LOG_ENTRY_FORMATTERS.keys()), percentage=75
-            ):
-                # logs
-                result_formatter = log_entry_formatter
-
-            elif either_set_is_a_subset(
-                result_key_set, set(TRANSACTION_RESULT_FORMATTERS.keys()), percentage=75
-            ):
-                # newPendingTransactions, full transactions
-                result_formatter = transaction_result_formatter
-
-            elif any(_ in result_key_set for _ in {"syncing", "status"}):
-                # geth syncing response
-                result_formatter = type_aware_apply_formatters_to_dict(
-                    GETH_SYNCING_SUBSCRIPTION_FORMATTERS
-                )
-
-            elif either_set_is_a_subset(
-                result_key_set,
-                set(SYNCING_FORMATTERS.keys()),
-                percentage=75,
-            ):
-                # syncing response object
-                result_formatter = syncing_formatter
-
-        if result_formatter is not None:
-            value["result"] = result_formatter(result)
+def _build_subscription_formatter(
+    block_formatter: Callable[[Any], Any],
+    log_formatter: Callable[[Any], Any],
+    transaction_formatter: Callable[[Any], Any],
+    transaction_hash_formatter: Callable[[Any], Any],
+) -> Callable[[Any], Any]:
+    block_keys = set(BLOCK_RESULT_FORMATTERS.keys())
+    log_entry_keys = set(LOG_ENTRY_FORMATTERS.keys())
+    transaction_keys = set(TRANSACTION_RESULT_FORMATTERS.keys())
+
+    def _subscription_formatter(value: Any) -> HexBytes | HexStr | dict[str, Any]:
+        if is_hexstr(value):
+            # subscription id from the original subscription request
+            return HexStr(value)
 
-    return value
+        elif isinstance(value, dict):
+            # subscription messages
+
+            result = value.get("result")
+            result_formatter: Callable[..., Any] | None = None
+
+            if isinstance(result, str) and len(result.replace("0x", "")) == 64:
+                # transaction hash, from `newPendingTransactions` w/o full_txs
+                result_formatter = transaction_hash_formatter
+
+            elif isinstance(result, (dict, AttributeDict, AttributeRecord)):
+                result_key_set = set(result.keys())
+
+                # handle dict subscription responses
+                if either_set_is_a_subset(
+                    result_key_set,
+                    block_keys,
+                    percentage=90,
+                ):
+                    # block format, newHeads
+                    result_formatter = block_formatter
+
+                elif either_set_is_a_subset(
+                    result_key_set, log_entry_keys, percentage=75
+                ):
+                    # logs
+                    result_formatter = log_formatter
+
+                elif either_set_is_a_subset(
+                    result_key_set, transaction_keys, percentage=75
+                ):
+                    # newPendingTransactions, full transactions
+                    result_formatter = transaction_formatter
+
+                elif any(_ in result_key_set for _ in {"syncing", "status"}):
+                    # geth syncing response
+                    result_formatter = type_aware_apply_formatters_to_dict(
+                        GETH_SYNCING_SUBSCRIPTION_FORMATTERS
+                    )
+
+                elif either_set_is_a_subset(
+                    result_key_set,
+                    set(SYNCING_FORMATTERS.keys()),
+                    percentage=75,
+                ):
+                    # syncing response object
+                    result_formatter = syncing_formatter
+
+            if result_formatter is not None:
+                value["result"] = result_formatter(result)
+
+        return value
+
+    return _subscription_formatter
+
+
+subscription_formatter = _build_subscription_formatter(
+    block_result_formatter,
+    log_entry_formatter,
+    transaction_result_formatter,
+    HexBytes,
+)
 
 
 PYTHONIC_RESULT_FORMATTERS: dict[RPCEndpoint, Callable[..., Any]] = {
     # Eth
-    RPC.eth_accounts: apply_list_to_array_formatter(to_checksum_address),
+    RPC.eth_accounts: apply_list_to_array_formatter(checksum_address),
     RPC.eth_blobBaseFee: to_integer_if_hex,
     RPC.eth_blockNumber: to_integer_if_hex,
     RPC.eth_chainId: to_integer_if_hex,
@@ -1066,6 +1316,69 @@ PYTHONIC_RESULT_FORMATTERS: dict[RPCEndpoint, Callable[..., Any]] = {
     ),
 }
 
+
+def _build_bytes_representation_result_formatters(
+    bytes_representation: BytesRepresentation,
+) -> dict[RPCEndpoint, Callable[..., Any]]:
+    """
+    The result formatters of the methods returning blocks, transactions, receipts and
+    logs, with their byte fields formatted as ``bytes_representation``.
+    """
+    sized_bytes, unsized_bytes = BYTES_REPRESENTATION_FORMATTERS[bytes_representation]
+    schemas = build_result_schemas(bytes_representation)
+    transaction_formatter = compile_dict_formatter(schemas.transaction)
+    log_formatter = compile_dict_formatter(schemas.log_entry)
+    receipt_formatter = compile_dict_formatter(schemas.receipt)
+    block_formatter = compile_dict_formatter(schemas.block)
+
+    filter_formatter = apply_one_of_formatters(
+        (
+            (is_array_of_dicts, apply_list_to_array_formatter(log_formatter)),
+            (is_array_of_strings, apply_list_to_array_formatter(sized_bytes(32))),
+        )
+    )
+    return {
+        RPC.eth_getBlockByHash: apply_formatter_if(is_not_null, block_formatter),
+        RPC.eth_getBlockByNumber: apply_formatter_if(is_not_null, block_formatter),
+        RPC.eth_getBlockReceipts: apply_formatter_to_array(receipt_formatter),
+        RPC.eth_getFilterChanges: filter_formatter,
+        RPC.eth_getFilterLogs: filter_formatter,
+        RPC.eth_getLogs: filter_formatter,
+        RPC.eth_getTransactionByBlockHashAndIndex: apply_formatter_if(
+            is_not_null, transaction_formatter
+        ),
+        RPC.eth_getTransactionByBlockNumberAndIndex: apply_formatter_if(
+            is_not_null, transaction_formatter
+        ),
+        RPC.eth_getTransactionByHash: apply_formatter_if(
+            is_not_null, transaction_formatter
+        ),
+        RPC.eth_getTransactionReceipt: apply_formatter_if(
+            is_not_null, receipt_formatter
+        ),
+        RPC.eth_subscribe: apply_formatter_if(
+            is_not_null,
+            _build_subscription_formatter(
+                block_formatter, log_formatter, transaction_formatter, unsized_bytes
+            ),
+        ),
+    }
+
+
+PYTHONIC_RESULT_FORMATTERS_BY_BYTES_REPRESENTATION: dict[
+    BytesRepresentation, dict[RPCEndpoint, Callable[..., Any]]
+] = {
+    BytesRepresentation.HEXBYTES: PYTHONIC_RESULT_FORMATTERS,
+    BytesRepresentation.BYTES: {
+        **PYTHONIC_RESULT_FORMATTERS,
+        **_build_bytes_representation_result_formatters(BytesRepresentation.BYTES),
+    },
+    BytesRepresentation.HEX: {
+        **PYTHONIC_RESULT_FORMATTERS,
+        **_build_bytes_representation_result_formatters(BytesRepresentation.HEX),
+    },
+}
+
 METHOD_NORMALIZERS: dict[RPCEndpoint, Callable[..., Any]] = {
     RPC.eth_getLogs: apply_formatter_at_index(FILTER_PARAM_NORMALIZERS, 0),
     RPC.eth_newFilter: apply_formatter_at_index(FILTER_PARAM_NORMALIZERS, 0),
@@ -1242,11 +1555,25 @@ def apply_module_to_formatters(
         yield partial(f, module, method_name)
 
 
+def get_bytes_representation(module: "Module") -> BytesRepresentation:
+    """
+    The ``bytes_representation`` of the ``Web3`` instance of ``module``.
+    """
+    return getattr(
+        getattr(module, "w3", None),
+        "bytes_representation",
+        BytesRepresentation.HEXBYTES,
+    )
+
+
 def get_result_formatters(
     method_name: RPCEndpoint,
     module: "Module",
 ) -> Callable[[RPCResponse], Any]:
-    formatters = combine_formatters((PYTHONIC_RESULT_FORMATTERS,), method_name)
+    result_formatters = PYTHONIC_RESULT_FORMATTERS_BY_BYTES_REPRESENTATION[
+        get_bytes_representation(module)
+    ]
+    formatters = combine_formatters((result_formatters,), method_name)
     formatters_requiring_module = combine_formatters(
         (FILTER_RESULT_FORMATTERS,), method_name
     )
@@ -1256,6 +1583,16 @@ def get_result_formatters(
     return compose(*partial_formatters, *formatters)
 
 
+def get_raw_result_formatters(
+    method_name: RPCEndpoint,
+    module: "Module",
+) -> Callable[[RPCResponse], Any]:
+    """
+    No result formatters, for methods whose callers decode the raw JSON-RPC result.
+    """
+    return identity
+
+
 def get_error_formatters(method_name: RPCEndpoint) -> Callable[[RPCResponse], Any]:
     #  Note error formatters work on the full response dict
     error_formatter_maps = (ERROR_FORMATTERS,)
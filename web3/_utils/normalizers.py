@@ -23,7 +23,6 @@ from eth_typing import (
 )
 from eth_utils import (
     to_bytes,
-    to_checksum_address,
     to_hex,
     to_text,
 )
@@ -41,6 +40,9 @@ from ens import (
     ENS,
     AsyncENS,
 )
+from web3._utils.checksum import (
+    checksum_address,
+)
 from web3._utils.encoding import (
     hexstr_if_str,
     text_if_str,
@@ -92,7 +94,7 @@ def addresses_checksummed(
     type_str: TypeStr, data: Any
 ) -> tuple[TypeStr, ChecksumAddress]:
     if type_str == "address":
-        return type_str, to_checksum_address(data)
+        return type_str, checksum_address(data)
     return None
 
 
@@ -198,7 +200,7 @@ def abi_address_to_hex(
     if type_str == "address":
         validate_address(data)
         if is_binary_address(data):
-            return type_str, to_checksum_address(data)
+            return type_str, checksum_address(data)
     return None
 
 
@@ -0,0 +1,166 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Hashable,
+    Sequence,
+    cast,
+)
+
+from web3._utils.batching import (
+    DEFAULT_BATCH_SIZE,
+    batched,
+)
+from web3._utils.validation import (
+    validate_rpc_response_and_raise_if_error,
+)
+from web3.types import (
+    RPCEndpoint,
+    RPCResponse,
+)
+from web3.utils.subscriptions import (
+    EthSubscription,
+    LogsSubscription,
+    NewHeadsSubscription,
+)
+
+if TYPE_CHECKING:
+    from web3.providers.persistent import (  # noqa: F401
+        PersistentConnectionProvider,
+    )
+
+
+def get_result_key(result: Any) -> Hashable:
+    """
+    The key used to drop duplicate raw ``logs`` and ``newHeads`` subscription
+    results: ``(blockHash, logIndex)`` for logs and the block hash for headers.
+    """
+    if "logIndex" in result:
+        return (result["blockHash"], result["logIndex"])
+    return result.get("hash")
+
+
+def record_subscription_result(subscription: EthSubscription[Any], result: Any) -> None:
+    """
+    Record the block of a raw result received for ``subscription``, so missed
+    results can be backfilled after a reconnect.
+    """
+    if isinstance(subscription, LogsSubscription):
+        block_number = result.get("blockNumber")
+        if block_number is None:
+            return
+        block_number = int(block_number, 16)
+        if block_number != subscription.last_block_number:
+            subscription.last_block_number = block_number
+            subscription._last_block_log_keys = set()
+        subscription._last_block_log_keys.add(get_result_key(result))
+    elif isinstance(subscription, NewHeadsSubscription):
+        subscription.last_block_number = int(result["number"], 16)
+
+
+def get_backfill_start_block(
+    subscriptions: Sequence[EthSubscription[Any]],
+) -> int | None:
+    """
+    The first block to backfill for subscriptions sharing one upstream subscription,
+    or ``None`` if none of them has received a result yet. Logs are backfilled from
+    the last block received, since only some of its logs may have arrived, and
+    headers from the block after it.
+    """
+    start_blocks = []
+    for sub in subscriptions:
+        if isinstance(sub, LogsSubscription) and sub.last_block_number is not None:
+            start_blocks.append(sub.last_block_number)
+        elif (
+            isinstance(sub, NewHeadsSubscription) and sub.last_block_number is not None
+        ):
+            start_blocks.append(sub.last_block_number + 1)
+    return min(start_blocks) if start_blocks else None
+
+
+def get_received_result_keys(
+    subscriptions: Sequence[EthSubscription[Any]],
+) -> set[Hashable]:
+    """
+    The keys of the logs already received for the last block, which are backfilled
+    again.
+    """
+    keys: set[Hashable] = set()
+    for sub in subscriptions:
+        if isinstance(sub, LogsSubscription):
+            keys.update(sub._last_block_log_keys)
+    return keys
+
+
+async def _make_backfill_request(
+    provider: "PersistentConnectionProvider", method: str, params: Any
+) -> Any:
+    response = await provider.make_request(RPCEndpoint(method), params)
+    validate_rpc_response_and_raise_if_error(response, None, logger=provider.logger)
+    return response["result"]
+
+
+async def _make_backfill_batch_request(
+    provider: "PersistentConnectionProvider", requests: list[tuple[RPCEndpoint, Any]]
+) -> list[Any]:
+    # batch responses share one cache key, so only one backfill batch is in flight
+    async with provider._backfill_batch_lock:
+        responses: Any = await provider.make_batch_request(requests)
+    if isinstance(responses, dict):
+        # the whole batch was rejected with a single error response
+        validate_rpc_response_and_raise_if_error(
+            cast(RPCResponse, responses), None, logger=provider.logger
+        )
+    for response in responses:
+        validate_rpc_response_and_raise_if_error(response, None, logger=provider.logger)
+    return [response["result"] for response in responses]
+
+
+async def fetch_subscription_backfill(
+    provider: "PersistentConnectionProvider",
+    subscription_params: Sequence[Any],
+    from_block: int,
+    chunk_size: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[Any]:
+    """
+    Fetch the raw results a ``logs`` or ``newHeads`` subscription would have
+    received from ``from_block`` up to the latest block, in block order. Logs are
+    fetched with ``eth_getLogs`` over ranges of at most ``chunk_size`` blocks and
+    headers with batches of at most ``batch_size`` ``eth_getBlockByNumber``
+    requests.
+    """
+    to_block = int(await _make_backfill_request(provider, "eth_blockNumber", []), 16)
+
+    results: list[Any] = []
+    if subscription_params[0] == "logs":
+        logs_filter = (
+            subscription_params[1]
+            if len(subscription_params) > 1 and subscription_params[1]
+            else {}
+        )
+        for chunk_start in range(from_block, to_block + 1, chunk_size):
+            chunk_end = min(chunk_start + chunk_size - 1, to_block)
+            results.extend(
+                await _make_backfill_request(
+                    provider,
+                    "eth_getLogs",
+                    [
+                        {
+                            **logs_filter,
+                            "fromBlock": hex(chunk_start),
+                            "toBlock": hex(chunk_end),
+                        }
+                    ],
+                )
+            )
+    elif subscription_params[0] == "newHeads":
+        for block_numbers in batched(range(from_block, to_block + 1), batch_size):
+            blocks = await _make_backfill_batch_request(
+                provider,
+                [
+                    (RPCEndpoint("eth_getBlockByNumber"), [hex(block_number), False])
+                    for block_number in block_numbers
+                ],
+            )
+            results.extend(block for block in blocks if block is not None)
+    return results
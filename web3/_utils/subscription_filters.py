@@ -0,0 +1,123 @@
+from typing import (
+    Any,
+    Sequence,
+    cast,
+)
+
+from eth_utils import (
+    to_normalized_address,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3.types import (
+    FilterParams,
+    TopicFilter,
+    _Hash32,
+)
+
+# logs filters made up of only these keys can be merged and matched locally
+MERGEABLE_LOGS_FILTER_KEYS = {"address", "topics"}
+
+
+def is_mergeable_logs_filter(logs_filter: FilterParams) -> bool:
+    return set(logs_filter).issubset(MERGEABLE_LOGS_FILTER_KEYS)
+
+
+def _normalize_addresses(address: Any) -> set[str] | None:
+    """``None`` matches any address."""
+    if not address:
+        return None
+    if isinstance(address, (list, tuple)):
+        return {to_normalized_address(a) for a in address}
+    return {to_normalized_address(address)}
+
+
+def _normalize_topic(topic: TopicFilter) -> set[HexBytes] | None:
+    """``None`` matches any topic."""
+    if topic is None:
+        return None
+    if isinstance(topic, (list, tuple)):
+        return {HexBytes(t) for t in topic}
+    return {HexBytes(cast(_Hash32, topic))}
+
+
+def _topic_at(topics: Sequence[TopicFilter] | None, index: int) -> TopicFilter:
+    if not topics or index >= len(topics):
+        return None
+    return topics[index]
+
+
+def merge_logs_filters(logs_filters: Sequence[FilterParams]) -> FilterParams:
+    """
+    Merge logs filters that share the same ``topics`` into a single filter matching
+    the logs of every contract address in any of them.
+    """
+    merged: FilterParams = {}
+    addresses: list[Any] = []
+    seen: set[str] = set()
+    for logs_filter in logs_filters:
+        address = logs_filter.get("address")
+        if not address:
+            # one of the filters matches any address, so the merged filter does too
+            addresses = []
+            break
+        for a in address if isinstance(address, (list, tuple)) else [address]:
+            if to_normalized_address(a) not in seen:
+                seen.add(to_normalized_address(a))
+                addresses.append(a)
+
+    if addresses:
+        merged["address"] = addresses
+    topics = logs_filters[0].get("topics")
+    if topics:
+        merged["topics"] = topics
+    return merged
+
+
+def logs_filter_covers(
+    upstream_filter: FilterParams, logs_filter: FilterParams
+) -> bool:
+    """
+    Whether every log matching ``logs_filter`` also matches ``upstream_filter``.
+    """
+    if not (
+        is_mergeable_logs_filter(upstream_filter)
+        and is_mergeable_logs_filter(logs_filter)
+    ):
+        return False
+
+    upstream_addresses = _normalize_addresses(upstream_filter.get("address"))
+    if upstream_addresses is not None:
+        addresses = _normalize_addresses(logs_filter.get("address"))
+        if addresses is None or not addresses.issubset(upstream_addresses):
+            return False
+
+    upstream_topics = upstream_filter.get("topics") or []
+    for i, upstream_topic in enumerate(upstream_topics):
+        upstream_options = _normalize_topic(upstream_topic)
+        if upstream_options is None:
+            continue
+        options = _normalize_topic(_topic_at(logs_filter.get("topics"), i))
+        if options is None or not options.issubset(upstream_options):
+            return False
+    return True
+
+
+def log_matches_filter(log: dict[str, Any], logs_filter: FilterParams) -> bool:
+    """
+    Whether the raw, unformatted ``log`` matches ``logs_filter``.
+    """
+    addresses = _normalize_addresses(logs_filter.get("address"))
+    if addresses is not None and to_normalized_address(log["address"]) not in addresses:
+        return False
+
+    log_topics = log.get("topics", [])
+    for i, topic in enumerate(logs_filter.get("topics") or []):
+        options = _normalize_topic(topic)
+        if options is None:
+            continue
+        if i >= len(log_topics) or HexBytes(log_topics[i]) not in options:
+            return False
+    return True
@@ -5,6 +5,7 @@ from collections.abc import (
     MutableMapping,
     ValuesView,
 )
+import functools
 from typing import (
     Any,
     Callable,
@@ -22,6 +23,7 @@ from eth_utils import (
 
 from web3.exceptions import (
     Web3AssertionError,
+    Web3AttributeError,
     Web3TypeError,
     Web3ValueError,
 )
@@ -79,6 +81,8 @@ class ReadableAttributeDict(Mapping[TKey, TValue]):
         process nested collections (e.g., lists, sets, and dictionaries).
         """
         if isinstance(value, Mapping):
+            if isinstance(value, AttributeRecord):
+                return value
             return cls({k: cls.recursive(v) for k, v in value.items()})
         elif isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
             return type(value)([cls.recursive(v) for v in value])  # type: ignore
@@ -102,6 +106,9 @@ class AttributeDict(ReadableAttributeDict[TKey, TValue], Hashable):
     Provides superficial immutability, someone could hack around it
     """
 
+    # the hash is computed once, on first use
+    __slots__ = ("_hash",)
+
     def __setattr__(self, attr: str, val: TValue) -> None:
         if attr == "__dict__":
             super().__setattr__(attr, val)
@@ -115,18 +122,271 @@ class AttributeDict(ReadableAttributeDict[TKey, TValue], Hashable):
             "This data is immutable -- create a copy instead of modifying"
         )
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self.__class__, (self.__dict__,))
+
     def __hash__(self) -> int:
-        return hash(tuple(sorted(tupleize_lists_nested(self).items())))
+        try:
+            return cast(int, object.__getattribute__(self, "_hash"))
+        except AttributeError:
+            value = hash(tuple(sorted(tupleize_lists_nested(self).items())))
+            object.__setattr__(self, "_hash", value)
+            return value
 
     def __eq__(self, other: Any) -> bool:
-        if isinstance(other, AttributeDict):
-            return hash(self) == hash(other)
+        if self is other:
+            return True
+        elif isinstance(other, AttributeDict):
+            return len(self) == len(other) and hash(self) == hash(other)
         elif isinstance(other, Mapping):
             return self.__dict__ == dict(other)
         else:
             return False
 
 
+class LazyAttributeDict(AttributeDict[TKey, TValue]):
+    """
+    An ``AttributeDict`` that converts the mappings and collections nested in it
+    the first time each of its values is read, rather than when it is created.
+    It is shown as an ``AttributeDict``.
+    """
+
+    # the keys whose values are nested mappings or collections not yet converted
+    __slots__ = ("_pending",)
+
+    def __init__(
+        self, dictionary: dict[TKey, TValue], *args: Any, **kwargs: Any
+    ) -> None:
+        object.__setattr__(self, "_pending", set())
+        super().__init__(dictionary, *args, **kwargs)
+        object.__setattr__(
+            self,
+            "_pending",
+            {key for key, value in self.__dict__.items() if _is_nested(value)},
+        )
+
+    def __getitem__(self, key: TKey) -> TValue:
+        values = object.__getattribute__(self, "__dict__")
+        pending = object.__getattribute__(self, "_pending")
+        if key in pending:
+            values[key] = type(self).recursive(values[key])
+            pending.discard(key)
+        return values[key]
+
+    def __getattribute__(self, attr: str) -> Any:
+        # only values that still need converting are looked up through the keys
+        pending = object.__getattribute__(self, "_pending")
+        if pending and attr in pending:
+            return self[attr]  # type: ignore
+        return object.__getattribute__(self, attr)
+
+    def _convert_all(self) -> None:
+        for key in tuple(object.__getattribute__(self, "_pending")):
+            self[key]
+
+    def __repr__(self) -> str:
+        # show nested values as they are read
+        self._convert_all()
+        return AttributeDict.__name__ + f"({self.__dict__!r})"
+
+    def _repr_pretty_(self, builder: Any, cycle: bool) -> None:
+        self._convert_all()
+        builder.text(AttributeDict.__name__ + "(")
+        if cycle:
+            builder.text("<cycle>")
+        else:
+            builder.pretty(self.__dict__)
+        builder.text(")")
+
+    @classmethod
+    def recursive(cls, value: TValue) -> Any:
+        """
+        Convert a mapping to a ``LazyAttributeDict``, leaving the values nested in it
+        to be converted when they are read, and process nested collections.
+        """
+        if isinstance(value, Mapping):
+            if isinstance(value, (AttributeDict, AttributeRecord)):
+                return value
+            return cls(value)  # type: ignore
+        elif isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+            return type(value)([cls.recursive(v) for v in value])  # type: ignore
+        elif isinstance(value, set):
+            return {cls.recursive(v) for v in value}
+        return value
+
+
+def _is_nested(value: Any) -> bool:
+    return isinstance(value, (Mapping, set)) or (
+        isinstance(value, Sequence) and not isinstance(value, (str, bytes))
+    )
+
+
+_MISSING = object()
+
+# The number of distinct field values shared between records. Results repeat the same
+# block and transaction hashes, addresses and topics far more often than this.
+_INTERNED_VALUES_CACHE_SIZE = 8192
+
+
+@functools.lru_cache(maxsize=_INTERNED_VALUES_CACHE_SIZE, typed=True)
+def _intern(value: Any) -> Any:
+    # the first of the equal values seen, by type, so ``bytes`` and ``HexBytes`` are
+    # never swapped for one another
+    return value
+
+
+def _intern_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_intern_value(item) for item in value]
+    try:
+        return _intern(value)
+    except TypeError:
+        # unhashable
+        return AttributeDict.recursive(value)
+
+
+class AttributeRecord(Mapping[str, Any], Hashable):
+    """
+    A compact, read-only alternative to ``AttributeDict`` for results with a known
+    set of fields. Subclasses list the fields in ``__slots__`` and ``_fields``, so
+    instances have no per-instance ``__dict__``. Any other fields are kept in a
+    separate dict that is only created when needed.
+    """
+
+    # the hash is computed once, on first use
+    __slots__ = ("_extra", "_hash")
+
+    _fields: tuple[str, ...] = ()
+    _field_set: frozenset[str] = frozenset()
+    # record types for the mappings nested in a field
+    _nested: dict[str, type["AttributeRecord"]] = {}
+    # fields whose values, or list items, are often equal across records, such as
+    # block hashes, and are shared between records rather than held by each one
+    _interned: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls._fields)
+
+    def __init__(self, dictionary: Mapping[str, Any]) -> None:
+        field_set = self._field_set
+        extra = None
+        for key, value in dictionary.items():
+            if key in field_set:
+                object.__setattr__(self, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        object.__setattr__(self, "_extra", extra)
+
+    def _items(self) -> Iterator[tuple[str, Any]]:
+        for field in self._fields:
+            value = getattr(self, field, _MISSING)
+            if value is not _MISSING:
+                yield field, value
+        if self._extra is not None:
+            yield from self._extra.items()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __getattr__(self, attr: str) -> Any:
+        # only called for fields that are not set and fields outside ``_fields``
+        extra = object.__getattribute__(self, "_extra") if attr != "_extra" else None
+        if extra is not None and attr in extra:
+            return extra[attr]
+        raise Web3AttributeError(
+            f"{self.__class__.__name__!r} object has no attribute {attr!r}"
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key, _value in self._items())
+
+    def __len__(self) -> int:
+        return sum(1 for _item in self._items())
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__ + f"({dict(self._items())!r})"
+
+    def _repr_pretty_(self, builder: Any, cycle: bool) -> None:
+        builder.text(self.__class__.__name__ + "(")
+        if cycle:
+            builder.text("<cycle>")
+        else:
+            builder.pretty(dict(self._items()))
+        builder.text(")")
+
+    def __setattr__(self, attr: str, val: Any) -> None:
+        raise Web3TypeError(
+            "This data is immutable -- create a copy instead of modifying"
+        )
+
+    def __delattr__(self, key: str) -> None:
+        raise Web3TypeError(
+            "This data is immutable -- create a copy instead of modifying"
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self.__class__, (dict(self._items()),))
+
+    def __hash__(self) -> int:
+        try:
+            return cast(int, object.__getattribute__(self, "_hash"))
+        except AttributeError:
+            value = hash(tuple(sorted(tupleize_lists_nested(self).items())))
+            object.__setattr__(self, "_hash", value)
+            return value
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        elif isinstance(other, AttributeRecord):
+            return len(self) == len(other) and hash(self) == hash(other)
+        elif isinstance(other, Mapping):
+            return dict(self._items()) == dict(other)
+        else:
+            return False
+
+    @classmethod
+    def recursive(cls, value: Any) -> Any:
+        """
+        Convert a mapping, or each mapping in a list, to this record type. Mappings
+        nested in the fields listed in ``_nested`` are converted to their record
+        type and any other nested mappings to ``AttributeDict``. The values of the
+        fields listed in ``_interned`` are shared with earlier records holding
+        equal values.
+        """
+        if isinstance(value, Mapping):
+            if isinstance(value, cls):
+                return value
+            nested = cls._nested
+            interned = cls._interned
+            return cls(
+                {
+                    k: (
+                        nested[k].recursive(v)
+                        if k in nested
+                        else (
+                            _intern_value(v)
+                            if k in interned
+                            else AttributeDict.recursive(v)
+                        )
+                    )
+                    for k, v in value.items()
+                }
+            )
+        elif isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+            return type(value)([cls.recursive(v) for v in value])  # type: ignore
+        return value
+
+
 def tupleize_lists_nested(d: Mapping[TKey, TValue]) -> AttributeDict[TKey, TValue]:
     """
     Unhashable types inside dicts will throw an error if attempted to be hashed.
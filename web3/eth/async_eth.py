@@ -1,9 +1,15 @@
 import asyncio
+import functools
+import itertools
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    AsyncIterator,
     Awaitable,
     Callable,
+    Iterable,
+    Literal,
     Sequence,
     cast,
     overload,
@@ -27,9 +33,22 @@ from web3._utils.async_transactions import (
     async_get_required_transaction,
     async_replace_transaction,
 )
+from web3._utils.batching import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_CONCURRENT_BATCHES,
+    async_iter_concurrent_batches,
+    batched,
+    validate_batch_arguments,
+)
 from web3._utils.blocks import (
     select_method_for_block_identifier,
 )
+from web3._utils.columnar import (
+    BLOCK_COLUMNS,
+    LOG_COLUMNS,
+    ColumnarResults,
+    split_filter_params,
+)
 from web3._utils.compat import (
     Unpack,
 )
@@ -43,6 +62,9 @@ from web3._utils.filters import (
     AsyncFilter,
     select_filter_method,
 )
+from web3._utils.method_formatters import (
+    get_raw_result_formatters,
+)
 from web3._utils.rpc_abi import (
     RPC,
 )
@@ -101,6 +123,7 @@ from web3.types import (
 from web3.utils import (
     EthSubscription,
     async_handle_offchain_lookup,
+    fee_history_to_arrays,
 )
 from web3.utils.subscriptions import (
     EthSubscriptionHandler,
@@ -218,13 +241,54 @@ class AsyncEth(BaseEth):
         ]
     ] = Method(RPC.eth_feeHistory, mungers=[default_root_munger])
 
+    _fee_history_raw: Method[
+        Callable[
+            [int, BlockParams | BlockNumber, list[float]], Awaitable[dict[str, Any]]
+        ]
+    ] = Method(
+        RPC.eth_feeHistory,
+        mungers=[default_root_munger],
+        result_formatters=get_raw_result_formatters,
+    )
+
+    @overload
     async def fee_history(
         self,
         block_count: int,
         newest_block: BlockParams | BlockNumber,
         reward_percentiles: list[float] | None = None,
+        *,
+        as_arrays: Literal[False] = False,
     ) -> FeeHistory:
+        ...
+
+    @overload
+    async def fee_history(
+        self,
+        block_count: int,
+        newest_block: BlockParams | BlockNumber,
+        reward_percentiles: list[float] | None = None,
+        *,
+        as_arrays: Literal[True],
+    ) -> dict[str, Any]:
+        ...
+
+    async def fee_history(
+        self,
+        block_count: int,
+        newest_block: BlockParams | BlockNumber,
+        reward_percentiles: list[float] | None = None,
+        *,
+        as_arrays: bool = False,
+    ) -> FeeHistory | dict[str, Any]:
         reward_percentiles = reward_percentiles or []
+        if as_arrays:
+            # decode the hex quantities of the raw result straight into NumPy arrays
+            return fee_history_to_arrays(
+                await self._fee_history_raw(
+                    block_count, newest_block, reward_percentiles
+                )
+            )
         return await self._fee_history(block_count, newest_block, reward_percentiles)
 
     # eth_call
@@ -447,6 +511,59 @@ class AsyncEth(BaseEth):
     ) -> BlockData:
         return await self._get_block(block_identifier, full_transactions)
 
+    def get_blocks(
+        self,
+        start: BlockNumber,
+        end: BlockNumber,
+        full_transactions: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+    ) -> AsyncIterator[BlockData]:
+        return async_iter_concurrent_batches(
+            functools.partial(
+                self._get_block_batch, full_transactions=full_transactions
+            ),
+            range(start, end + 1),
+            batch_size,
+            self._limit_concurrent_batches(max_concurrent_batches),
+        )
+
+    def _limit_concurrent_batches(self, max_concurrent_batches: int) -> int:
+        if self.w3.provider.has_persistent_connection:
+            # persistent connection providers handle one batch request at a time
+            return min(max_concurrent_batches, 1)
+        return max_concurrent_batches
+
+    async def _get_block_batch(
+        self, block_numbers: Sequence[BlockNumber], full_transactions: bool
+    ) -> list[BlockData]:
+        async with self.w3.batch_requests() as batch:
+            for block_number in block_numbers:
+                batch.add(self._get_block(block_number, full_transactions))
+            return cast(list[BlockData], await batch.async_execute())
+
+    _get_raw_block: Method[
+        Callable[[BlockNumber, bool], Awaitable[dict[str, Any]]]
+    ] = Method(
+        RPC.eth_getBlockByNumber,
+        mungers=[BaseEth.get_block_munger],
+        result_formatters=get_raw_result_formatters,
+    )
+
+    async def get_blocks_columnar(
+        self,
+        block_numbers: Iterable[BlockNumber],
+        fields: Sequence[str] | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> dict[str, Any]:
+        columns = ColumnarResults(BLOCK_COLUMNS, fields)
+        for batch_block_numbers in batched(block_numbers, batch_size):
+            async with self.w3.batch_requests() as batch:
+                for block_number in batch_block_numbers:
+                    batch.add(self._get_raw_block(block_number, False))
+                columns.add(await batch.async_execute())
+        return columns.to_columns()
+
     # eth_getBlockReceipts
 
     _get_block_receipts: Method[
@@ -461,6 +578,109 @@ class AsyncEth(BaseEth):
     ) -> BlockReceipts:
         return await self._get_block_receipts(block_identifier)
 
+    def get_blocks_receipts(
+        self,
+        start: BlockNumber,
+        end: BlockNumber,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+    ) -> AsyncIterator[BlockReceipts]:
+        validate_batch_arguments(batch_size, max_concurrent_batches)
+        return self._iter_blocks_receipts(
+            cast(Sequence[BlockNumber], range(start, end + 1)),
+            batch_size,
+            self._limit_concurrent_batches(max_concurrent_batches),
+        )
+
+    async def _iter_blocks_receipts(
+        self,
+        block_numbers: Sequence[BlockNumber],
+        batch_size: int,
+        max_concurrent_batches: int,
+    ) -> AsyncGenerator[BlockReceipts, None]:
+        if not block_numbers:
+            return
+
+        is_supported, probed_receipts = await self._supports_block_receipts(
+            block_numbers[0]
+        )
+        get_receipts_batch: Callable[
+            [Sequence[BlockNumber]], Awaitable[list[BlockReceipts]]
+        ]
+        if is_supported:
+            get_receipts_batch = self._get_block_receipts_batch
+        else:
+            get_receipts_batch = functools.partial(
+                self._get_transaction_receipts_batch, batch_size=batch_size
+            )
+        # the receipts fetched to detect support are not fetched again
+        for block_receipts in probed_receipts:
+            yield block_receipts
+        blocks_receipts = async_iter_concurrent_batches(
+            get_receipts_batch,
+            block_numbers[len(probed_receipts) :],
+            batch_size,
+            max_concurrent_batches,
+        )
+        try:
+            async for block_receipts in blocks_receipts:
+                yield block_receipts
+        finally:
+            await blocks_receipts.aclose()
+
+    async def _supports_block_receipts(
+        self, block_number: BlockNumber
+    ) -> tuple[bool, list[BlockReceipts]]:
+        """
+        Whether the provider supports ``eth_getBlockReceipts``, and the receipts of
+        ``block_number`` if they were fetched to find out.
+        """
+        is_supported = self._cached_block_receipts_support()
+        if is_supported is not None:
+            return is_supported, []
+
+        probed_receipts = []
+        try:
+            probed_receipts.append(await self._get_block_receipts(block_number))
+            is_supported = True
+        except Web3RPCError as e:
+            if not self._is_unsupported_method_error(e):
+                raise
+            is_supported = False
+        self._block_receipts_support = (self.w3.provider, is_supported)
+        return is_supported, probed_receipts
+
+    async def _get_block_receipts_batch(
+        self, block_numbers: Sequence[BlockNumber]
+    ) -> list[BlockReceipts]:
+        async with self.w3.batch_requests() as batch:
+            for block_number in block_numbers:
+                batch.add(self._get_block_receipts(block_number))
+            return cast(list[BlockReceipts], await batch.async_execute())
+
+    async def _get_transaction_receipts_batch(
+        self, block_numbers: Sequence[BlockNumber], batch_size: int
+    ) -> list[BlockReceipts]:
+        # without ``eth_getBlockReceipts``, get the receipt of each transaction
+        blocks = await self._get_block_batch(block_numbers, full_transactions=False)
+        receipts: list[TxReceipt] = []
+        for transaction_hashes in batched(
+            (tx_hash for block in blocks for tx_hash in block["transactions"]),
+            batch_size,
+        ):
+            async with self.w3.batch_requests() as batch:
+                for transaction_hash in transaction_hashes:
+                    batch.add(
+                        self._transaction_receipt(cast(HexBytes, transaction_hash))
+                    )
+                receipts.extend(cast(list[TxReceipt], await batch.async_execute()))
+
+        receipts_iterator = iter(receipts)
+        return [
+            list(itertools.islice(receipts_iterator, len(block["transactions"])))
+            for block in blocks
+        ]
+
     # eth_getBalance
 
     _get_balance: Method[
@@ -508,6 +728,32 @@ class AsyncEth(BaseEth):
     ) -> list[LogReceipt]:
         return await self._get_logs(filter_params)
 
+    _get_raw_logs: Method[
+        Callable[[FilterParams], Awaitable[list[dict[str, Any]]]]
+    ] = Method(
+        RPC.eth_getLogs,
+        mungers=[default_root_munger],
+        result_formatters=get_raw_result_formatters,
+    )
+
+    async def get_logs_columnar(
+        self,
+        filter_params: FilterParams,
+        fields: Sequence[str] | None = None,
+        blocks_per_request: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> dict[str, Any]:
+        columns = ColumnarResults(LOG_COLUMNS, fields)
+        for batch_filter_params in batched(
+            split_filter_params(filter_params, blocks_per_request), batch_size
+        ):
+            async with self.w3.batch_requests() as batch:
+                for params in batch_filter_params:
+                    batch.add(self._get_raw_logs(params))
+                logs = cast(list[list[dict[str, Any]]], await batch.async_execute())
+                columns.add(list(itertools.chain.from_iterable(logs)))
+        return columns.to_columns()
+
     # eth_getTransactionCount
 
     _get_transaction_count: Method[
@@ -727,6 +973,7 @@ class AsyncEth(BaseEth):
         handler_context: dict[str, Any] | None = None,
         label: str | None = None,
         parallelize: bool | None = None,
+        raw: bool = False,
     ) -> HexStr:
         if not isinstance(self.w3.provider, PersistentConnectionProvider):
             raise MethodNotSupported(
@@ -740,6 +987,7 @@ class AsyncEth(BaseEth):
             handler_context=handler_context or {},
             label=label,
             parallelize=parallelize,
+            raw=raw,
         )
         return await self.w3.subscription_manager.subscribe(sub)
 
@@ -27,6 +27,8 @@ from web3._utils.encoding import (
     to_hex,
 )
 from web3.exceptions import (
+    MethodUnavailable,
+    Web3RPCError,
     Web3TypeError,
     Web3ValueError,
 )
@@ -43,16 +45,55 @@ from web3.types import (
     Wei,
 )
 
+# phrases in the error messages of nodes which reject a method they do not support
+# without the JSON-RPC "method not found" error code
+UNSUPPORTED_METHOD_ERROR_PHRASES = (
+    "not found",
+    "does not exist",
+    "not available",
+    "not supported",
+    "unsupported",
+    "not implemented",
+    "unknown",
+)
+
 
 class BaseEth(Module):
     _default_account: ChecksumAddress | Empty = empty
     _default_block: BlockIdentifier = "latest"
     _default_contract_factory: Any = None
     _gas_price_strategy = None
+    # the provider and whether it supports ``eth_getBlockReceipts``, once detected
+    _block_receipts_support: tuple[Any, bool] | None = None
 
     is_async = False
     account = Account()
 
+    def _cached_block_receipts_support(self) -> bool | None:
+        """
+        Whether the current provider supports ``eth_getBlockReceipts``, or ``None``
+        if that has not been detected yet.
+        """
+        if (
+            self._block_receipts_support is None
+            or self._block_receipts_support[0] is not self.w3.provider
+        ):
+            return None
+        return self._block_receipts_support[1]
+
+    @staticmethod
+    def _is_unsupported_method_error(error: Web3RPCError) -> bool:
+        """
+        Whether ``error`` rejects the requested method as not supported, either with
+        the "method not found" error code or with an error message that says so.
+        """
+        if isinstance(error, MethodUnavailable):
+            return True
+        message = error.message.lower()
+        return "method" in message and any(
+            phrase in message for phrase in UNSUPPORTED_METHOD_ERROR_PHRASES
+        )
+
     def namereg(self) -> NoReturn:
         raise NotImplementedError()
 
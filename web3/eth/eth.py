@@ -1,7 +1,12 @@
+import functools
+import itertools
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Iterable,
+    Iterator,
+    Literal,
     Sequence,
     cast,
     overload,
@@ -21,9 +26,22 @@ from hexbytes import (
     HexBytes,
 )
 
+from web3._utils.batching import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_CONCURRENT_BATCHES,
+    batched,
+    iter_concurrent_batches,
+    validate_batch_arguments,
+)
 from web3._utils.blocks import (
     select_method_for_block_identifier,
 )
+from web3._utils.columnar import (
+    BLOCK_COLUMNS,
+    LOG_COLUMNS,
+    ColumnarResults,
+    split_filter_params,
+)
 from web3._utils.compat import (
     Unpack,
 )
@@ -34,6 +52,9 @@ from web3._utils.filters import (
     Filter,
     select_filter_method,
 )
+from web3._utils.method_formatters import (
+    get_raw_result_formatters,
+)
 from web3._utils.rpc_abi import (
     RPC,
 )
@@ -92,6 +113,7 @@ from web3.types import (
     _Hash32,
 )
 from web3.utils import (
+    fee_history_to_arrays,
     handle_offchain_lookup,
 )
 
@@ -201,13 +223,50 @@ class Eth(BaseEth):
         Callable[[int, BlockParams | BlockNumber, list[float] | None], FeeHistory]
     ] = Method(RPC.eth_feeHistory, mungers=[default_root_munger])
 
+    _fee_history_raw: Method[
+        Callable[[int, BlockParams | BlockNumber, list[float]], dict[str, Any]]
+    ] = Method(
+        RPC.eth_feeHistory,
+        mungers=[default_root_munger],
+        result_formatters=get_raw_result_formatters,
+    )
+
+    @overload
     def fee_history(
         self,
         block_count: int,
         newest_block: BlockParams | BlockNumber,
         reward_percentiles: list[float] | None = None,
+        *,
+        as_arrays: Literal[False] = False,
     ) -> FeeHistory:
+        ...
+
+    @overload
+    def fee_history(
+        self,
+        block_count: int,
+        newest_block: BlockParams | BlockNumber,
+        reward_percentiles: list[float] | None = None,
+        *,
+        as_arrays: Literal[True],
+    ) -> dict[str, Any]:
+        ...
+
+    def fee_history(
+        self,
+        block_count: int,
+        newest_block: BlockParams | BlockNumber,
+        reward_percentiles: list[float] | None = None,
+        *,
+        as_arrays: bool = False,
+    ) -> FeeHistory | dict[str, Any]:
         reward_percentiles = reward_percentiles or []
+        if as_arrays:
+            # decode the hex quantities of the raw result straight into NumPy arrays
+            return fee_history_to_arrays(
+                self._fee_history_raw(block_count, newest_block, reward_percentiles)
+            )
         return self._fee_history(block_count, newest_block, reward_percentiles)
 
     # eth_call
@@ -405,6 +464,51 @@ class Eth(BaseEth):
     ) -> BlockData:
         return self._get_block(block_identifier, full_transactions)
 
+    def get_blocks(
+        self,
+        start: BlockNumber,
+        end: BlockNumber,
+        full_transactions: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+    ) -> Iterator[BlockData]:
+        return iter_concurrent_batches(
+            functools.partial(
+                self._get_block_batch, full_transactions=full_transactions
+            ),
+            range(start, end + 1),
+            batch_size,
+            max_concurrent_batches,
+        )
+
+    def _get_block_batch(
+        self, block_numbers: Sequence[BlockNumber], full_transactions: bool
+    ) -> list[BlockData]:
+        with self.w3.batch_requests() as batch:
+            for block_number in block_numbers:
+                batch.add(self._get_block(block_number, full_transactions))
+            return cast(list[BlockData], batch.execute())
+
+    _get_raw_block: Method[Callable[[BlockNumber, bool], dict[str, Any]]] = Method(
+        RPC.eth_getBlockByNumber,
+        mungers=[BaseEth.get_block_munger],
+        result_formatters=get_raw_result_formatters,
+    )
+
+    def get_blocks_columnar(
+        self,
+        block_numbers: Iterable[BlockNumber],
+        fields: Sequence[str] | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> dict[str, Any]:
+        columns = ColumnarResults(BLOCK_COLUMNS, fields)
+        for batch_block_numbers in batched(block_numbers, batch_size):
+            with self.w3.batch_requests() as batch:
+                for block_number in batch_block_numbers:
+                    batch.add(self._get_raw_block(block_number, False))
+                columns.add(batch.execute())
+        return columns.to_columns()
+
     # eth_getBlockReceipts
 
     _get_block_receipts: Method[Callable[[BlockIdentifier], BlockReceipts]] = Method(
@@ -415,6 +519,99 @@ class Eth(BaseEth):
     def get_block_receipts(self, block_identifier: BlockIdentifier) -> BlockReceipts:
         return self._get_block_receipts(block_identifier)
 
+    def get_blocks_receipts(
+        self,
+        start: BlockNumber,
+        end: BlockNumber,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+    ) -> Iterator[BlockReceipts]:
+        validate_batch_arguments(batch_size, max_concurrent_batches)
+        return self._iter_blocks_receipts(
+            cast(Sequence[BlockNumber], range(start, end + 1)),
+            batch_size,
+            max_concurrent_batches,
+        )
+
+    def _iter_blocks_receipts(
+        self,
+        block_numbers: Sequence[BlockNumber],
+        batch_size: int,
+        max_concurrent_batches: int,
+    ) -> Iterator[BlockReceipts]:
+        if not block_numbers:
+            return
+
+        is_supported, probed_receipts = self._supports_block_receipts(block_numbers[0])
+        get_receipts_batch: Callable[[Sequence[BlockNumber]], list[BlockReceipts]]
+        if is_supported:
+            get_receipts_batch = self._get_block_receipts_batch
+        else:
+            get_receipts_batch = functools.partial(
+                self._get_transaction_receipts_batch, batch_size=batch_size
+            )
+        # the receipts fetched to detect support are not fetched again
+        yield from probed_receipts
+        yield from iter_concurrent_batches(
+            get_receipts_batch,
+            block_numbers[len(probed_receipts) :],
+            batch_size,
+            max_concurrent_batches,
+        )
+
+    def _supports_block_receipts(
+        self, block_number: BlockNumber
+    ) -> tuple[bool, list[BlockReceipts]]:
+        """
+        Whether the provider supports ``eth_getBlockReceipts``, and the receipts of
+        ``block_number`` if they were fetched to find out.
+        """
+        is_supported = self._cached_block_receipts_support()
+        if is_supported is not None:
+            return is_supported, []
+
+        probed_receipts = []
+        try:
+            probed_receipts.append(self._get_block_receipts(block_number))
+            is_supported = True
+        except Web3RPCError as e:
+            if not self._is_unsupported_method_error(e):
+                raise
+            is_supported = False
+        self._block_receipts_support = (self.w3.provider, is_supported)
+        return is_supported, probed_receipts
+
+    def _get_block_receipts_batch(
+        self, block_numbers: Sequence[BlockNumber]
+    ) -> list[BlockReceipts]:
+        with self.w3.batch_requests() as batch:
+            for block_number in block_numbers:
+                batch.add(self._get_block_receipts(block_number))
+            return cast(list[BlockReceipts], batch.execute())
+
+    def _get_transaction_receipts_batch(
+        self, block_numbers: Sequence[BlockNumber], batch_size: int
+    ) -> list[BlockReceipts]:
+        # without ``eth_getBlockReceipts``, get the receipt of each transaction
+        blocks = self._get_block_batch(block_numbers, full_transactions=False)
+        receipts: list[TxReceipt] = []
+        for transaction_hashes in batched(
+            (tx_hash for block in blocks for tx_hash in block["transactions"]),
+            batch_size,
+        ):
+            with self.w3.batch_requests() as batch:
+                for transaction_hash in transaction_hashes:
+                    batch.add(
+                        self._transaction_receipt(cast(HexBytes, transaction_hash))
+                    )
+                receipts.extend(cast(list[TxReceipt], batch.execute()))
+
+        receipts_iterator = iter(receipts)
+        return [
+            list(itertools.islice(receipts_iterator, len(block["transactions"])))
+            for block in blocks
+        ]
+
     # eth_getBalance
 
     _get_balance: Method[
@@ -456,6 +653,30 @@ class Eth(BaseEth):
     ) -> list[LogReceipt]:
         return self._get_logs(filter_params)
 
+    _get_raw_logs: Method[Callable[[FilterParams], list[dict[str, Any]]]] = Method(
+        RPC.eth_getLogs,
+        mungers=[default_root_munger],
+        result_formatters=get_raw_result_formatters,
+    )
+
+    def get_logs_columnar(
+        self,
+        filter_params: FilterParams,
+        fields: Sequence[str] | None = None,
+        blocks_per_request: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> dict[str, Any]:
+        columns = ColumnarResults(LOG_COLUMNS, fields)
+        for batch_filter_params in batched(
+            split_filter_params(filter_params, blocks_per_request), batch_size
+        ):
+            with self.w3.batch_requests() as batch:
+                for params in batch_filter_params:
+                    batch.add(self._get_raw_logs(params))
+                logs = cast(list[list[dict[str, Any]]], batch.execute())
+                columns.add(list(itertools.chain.from_iterable(logs)))
+        return columns.to_columns()
+
     # eth_getTransactionCount
 
     _get_transaction_count: Method[
@@ -148,6 +148,9 @@ from web3.tracing import (
 from web3.types import (
     Wei,
 )
+from web3.utils.formatting import (
+    BytesRepresentation,
+)
 from web3.providers.persistent.subscription_manager import (
     SubscriptionManager,
 )
@@ -192,6 +195,7 @@ def get_default_modules() -> dict[str, type[Module] | Sequence[Any]]:
 
 class BaseWeb3:
     _strict_bytes_type_checking = True
+    _bytes_representation = BytesRepresentation.HEXBYTES
 
     # Managers
     RequestManager = DefaultRequestManager
@@ -294,6 +298,22 @@ class BaseWeb3:
         )
         self._strict_bytes_type_checking = strict_bytes_type_check
 
+    @property
+    def bytes_representation(self) -> BytesRepresentation:
+        return self._bytes_representation
+
+    @bytes_representation.setter
+    def bytes_representation(
+        self, bytes_representation: BytesRepresentation | str
+    ) -> None:
+        try:
+            self._bytes_representation = BytesRepresentation(bytes_representation)
+        except ValueError:
+            raise Web3ValueError(
+                f"Invalid bytes representation: {bytes_representation!r}. Expected "
+                f"one of: {', '.join(repr(r.value) for r in BytesRepresentation)}"
+            )
+
     @staticmethod
     @apply_to_return_value(HexBytes)
     def keccak(
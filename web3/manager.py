@@ -538,7 +538,17 @@ class RequestManager:
                 sub_id = response.get(
                     "subscription", response.get("params", {}).get("subscription")
                 )
-                if async_w3.subscription_manager.get_by_id(sub_id):
+                subs = async_w3.subscription_manager._get_subscribers_for_message(
+                    response
+                )
+                if subs and all(sub.raw for sub in subs):
+                    # if active raw subscription, yield the unformatted result
+                    raw_result = response["params"]["result"]
+                    yield cast(
+                        FormattedEthSubscriptionResponse,
+                        {"subscription": sub_id, "result": raw_result},
+                    )
+                elif subs:
                     # if active subscription, process and yield the formatted response
                     formatted_sub_response = cast(
                         FormattedEthSubscriptionResponse,
@@ -4,8 +4,10 @@ from typing import (
     Any,
     Callable,
     Generic,
+    NoReturn,
     Optional,
     Sequence,
+    cast,
 )
 import warnings
 
@@ -20,6 +22,7 @@ from web3._utils.batching import (
     RPC_METHODS_UNSUPPORTED_DURING_BATCH,
 )
 from web3._utils.method_formatters import (
+    get_bytes_representation,
     get_error_formatters,
     get_null_result_formatters,
     get_request_formatters,
@@ -150,7 +153,6 @@ class Method(Generic[TFunc]):
         module: Optional["Module"] = None,
         _type: type["Module"] | None = None,
     ) -> TFunc:
-        self._module = module
         if module is None:
             raise Web3TypeError(
                 "Direct calls to methods are not supported. "
@@ -158,18 +160,56 @@ class Method(Generic[TFunc]):
                 "usually attached to a web3 instance."
             )
 
-        if module.w3.provider._is_batching:
-            if self.json_rpc_method in RPC_METHODS_UNSUPPORTED_DURING_BATCH:
-                raise MethodNotSupported(
-                    f"Method `{self.json_rpc_method}` is not supported within a batch "
-                    "request."
-                )
-            return module.retrieve_request_information(self)
-        else:
-            return module.retrieve_caller_fn(self)
+        # bind once per module, modules not initialized via ``Module.__init__`` have
+        # no bound methods
+        bound_methods = getattr(module, "_bound_methods", None)
+        if bound_methods is None:
+            return self.bind(module)
+        try:
+            return cast(TFunc, bound_methods[self])
+        except KeyError:
+            return cast(TFunc, bound_methods.setdefault(self, self.bind(module)))
+
+    def __call__(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise Web3TypeError(
+            "A Method cannot be called on its own. Call it through the module it is "
+            "attached to, e.g. ``w3.eth.get_balance(...)``."
+        )
 
-    def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        return self.__get__(self._module)(*args, **kwargs)
+    def bind(self, module: "Module") -> TFunc:
+        """
+        Returns a caller for this method bound to ``module``. The caller makes the
+        request or, while the provider is batching, returns the request information
+        to batch. It holds no state shared with other modules, so it is safe to
+        call from any thread. Callers bound to async modules are coroutine functions.
+        """
+        caller = module.retrieve_caller_fn(self)
+        batch_request_information = module.retrieve_request_information(self)
+
+        if module.is_async:
+
+            async def async_bound_caller(*args: Any, **kwargs: Any) -> Any:
+                if module.w3.provider._is_batching:
+                    self._validate_supported_during_batch()
+                    return await batch_request_information(*args, **kwargs)
+                return await caller(*args, **kwargs)
+
+            return cast(TFunc, async_bound_caller)
+
+        def bound_caller(*args: Any, **kwargs: Any) -> Any:
+            if module.w3.provider._is_batching:
+                self._validate_supported_during_batch()
+                return batch_request_information(*args, **kwargs)
+            return caller(*args, **kwargs)
+
+        return cast(TFunc, bound_caller)
+
+    def _validate_supported_during_batch(self) -> None:
+        if self.json_rpc_method in RPC_METHODS_UNSUPPORTED_DURING_BATCH:
+            raise MethodNotSupported(
+                f"Method `{self.json_rpc_method}` is not supported within a batch "
+                "request."
+            )
 
     @property
     def method_selector_fn(
@@ -208,29 +248,50 @@ class Method(Generic[TFunc]):
         if self.method_choice_depends_on_args:
             # If the method choice depends on the args that get passed in,
             # the first parameter determines which method needs to be called
-            self.json_rpc_method = self.method_choice_depends_on_args(value=params[0])
+            method = self.method_choice_depends_on_args(value=params[0])
 
             pending_or_latest_filter_methods = [
                 RPC.eth_newPendingTransactionFilter,
                 RPC.eth_newBlockFilter,
             ]
-            if self.json_rpc_method in pending_or_latest_filter_methods:
+            if method in pending_or_latest_filter_methods:
                 # For pending or latest filter methods, use params to determine
                 # which method to call, but don't pass them through with the request
                 params = []
-
-        method = self.method_selector_fn()
-        response_formatters = (
-            self.result_formatters(method, module),
-            get_error_formatters(method),
-            self.null_result_formatters(method),
-        )
+        else:
+            method = self.method_selector_fn()
+        request_formatters, response_formatters = self._get_formatters(method, module)
         request = (
             method,
-            _apply_request_formatters(params, self.request_formatters(method)),
+            _apply_request_formatters(params, request_formatters),
         )
         return request, response_formatters
 
+    def _get_formatters(
+        self, method: RPCEndpoint, module: "Module"
+    ) -> tuple[Any, tuple[Any, Callable[..., Any], Any]]:
+        """
+        The request formatters and response formatters for ``method``, composed once
+        per method, module and ``bytes_representation`` and cached on the module.
+        """
+        # modules not initialized via ``Module.__init__`` have no cache
+        cache = getattr(module, "_method_formatters_cache", None)
+        cache_key = (self, method, get_bytes_representation(module))
+        if cache is not None and cache_key in cache:
+            return cache[cache_key]
+
+        formatters = (
+            self.request_formatters(method),
+            (
+                self.result_formatters(method, module),
+                get_error_formatters(method),
+                self.null_result_formatters(method),
+            ),
+        )
+        if cache is not None:
+            cache[cache_key] = formatters
+        return formatters
+
 
 class DeprecatedMethod:
     def __init__(
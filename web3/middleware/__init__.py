@@ -9,6 +9,9 @@ from typing import (
 from .attrdict import (
     AttributeDictMiddleware,
 )
+from .attrrecord import (
+    AttributeRecordMiddleware,
+)
 from .base import (
     Middleware,
     Web3Middleware,
@@ -55,6 +58,7 @@ if TYPE_CHECKING:
         Web3,
     )
     from web3.types import (
+        RPCEndpoint,
         RPCResponse,
     )
 
@@ -68,12 +72,42 @@ def combine_middleware(
     Returns a callable function which takes method and params as positional arguments
     and passes these args through the request processors, makes the request, and passes
     the response through the response processors.
+
+    The pipeline for each method is built the first time the method is requested and
+    only wraps the middleware that handle it. If a middleware changes the method, the
+    rest of the pipeline is looked up for the new method.
     """
-    accumulator_fn = provider_request_fn
-    for mw in reversed(middleware):
-        # initialize the middleware and wrap the accumulator function down the stack
-        accumulator_fn = mw(w3).wrap_make_request(accumulator_fn)
-    return accumulator_fn
+    initialized = [mw(w3) for mw in middleware]
+    # pipelines[i][method] passes a request through the middleware from layer i down
+    pipelines: list[dict["RPCEndpoint", MakeRequestFn]] = [
+        {} for _ in range(len(initialized) + 1)
+    ]
+
+    def get_pipeline(index: int, method: "RPCEndpoint") -> MakeRequestFn:
+        try:
+            return pipelines[index][method]
+        except KeyError:
+            pass
+
+        pipeline = provider_request_fn
+        for i in range(index, len(initialized)):
+            if initialized[i].handles_method(method):
+
+                def make_request(
+                    method: "RPCEndpoint", params: Any, _next: int = i + 1
+                ) -> "RPCResponse":
+                    return get_pipeline(_next, method)(method, params)
+
+                pipeline = initialized[i].wrap_make_request(make_request)
+                break
+
+        pipelines[index][method] = pipeline
+        return pipeline
+
+    def request_fn(method: "RPCEndpoint", params: Any) -> "RPCResponse":
+        return get_pipeline(0, method)(method, params)
+
+    return request_fn
 
 
 async def async_combine_middleware(
@@ -85,17 +119,47 @@ async def async_combine_middleware(
     Returns a callable function which takes method and params as positional arguments
     and passes these args through the request processors, makes the request, and passes
     the response through the response processors.
+
+    The pipeline for each method is built the first time the method is requested and
+    only wraps the middleware that handle it. If a middleware changes the method, the
+    rest of the pipeline is looked up for the new method.
     """
-    accumulator_fn = provider_request_fn
-    for mw in reversed(middleware):
-        # initialize the middleware and wrap the accumulator function down the stack
-        initialized = mw(async_w3)
-        accumulator_fn = await initialized.async_wrap_make_request(accumulator_fn)
-    return accumulator_fn
+    initialized = [mw(async_w3) for mw in middleware]
+    # pipelines[i][method] passes a request through the middleware from layer i down
+    pipelines: list[dict["RPCEndpoint", AsyncMakeRequestFn]] = [
+        {} for _ in range(len(initialized) + 1)
+    ]
+
+    async def get_pipeline(index: int, method: "RPCEndpoint") -> AsyncMakeRequestFn:
+        try:
+            return pipelines[index][method]
+        except KeyError:
+            pass
+
+        pipeline = provider_request_fn
+        for i in range(index, len(initialized)):
+            if initialized[i].handles_method(method):
+
+                async def make_request(
+                    method: "RPCEndpoint", params: Any, _next: int = i + 1
+                ) -> "RPCResponse":
+                    return await (await get_pipeline(_next, method))(method, params)
+
+                pipeline = await initialized[i].async_wrap_make_request(make_request)
+                break
+
+        pipelines[index][method] = pipeline
+        return pipeline
+
+    async def request_fn(method: "RPCEndpoint", params: Any) -> "RPCResponse":
+        return await (await get_pipeline(0, method))(method, params)
+
+    return request_fn
 
 
 __all__ = [
     "AttributeDictMiddleware",
+    "AttributeRecordMiddleware",
     "Middleware",
     "Web3Middleware",
     "BufferedGasEstimateMiddleware",
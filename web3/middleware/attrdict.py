@@ -8,7 +8,7 @@ from typing import (
 )
 
 from web3.datastructures import (
-    AttributeDict,
+    LazyAttributeDict,
 )
 from web3.middleware.base import (
     Web3Middleware,
@@ -33,10 +33,10 @@ def _handle_async_response(response: "RPCResponse") -> "RPCResponse":
     Process the RPC response by converting nested dictionaries into AttributeDict.
     """
     if "result" in response:
-        response["result"] = AttributeDict.recursive(response["result"])
+        response["result"] = LazyAttributeDict.recursive(response["result"])
     elif "params" in response and "result" in response["params"]:
         # subscription response
-        response["params"]["result"] = AttributeDict.recursive(
+        response["params"]["result"] = LazyAttributeDict.recursive(
             response["params"]["result"]
         )
 
@@ -45,7 +45,8 @@ def _handle_async_response(response: "RPCResponse") -> "RPCResponse":
 
 class AttributeDictMiddleware(Web3Middleware, ABC):
     """
-    Converts any result which is a dictionary into an `AttributeDict`.
+    Converts any result which is a dictionary into an `AttributeDict`. Dictionaries
+    nested in the result are converted when they are first read.
 
     Note: Accessing `AttributeDict` properties via attribute
         (e.g. my_attribute_dict.property1) will not preserve typing.
@@ -53,7 +54,7 @@ class AttributeDictMiddleware(Web3Middleware, ABC):
 
     def response_processor(self, method: "RPCEndpoint", response: "RPCResponse") -> Any:
         if "result" in response:
-            new_result = AttributeDict.recursive(response["result"])
+            new_result = LazyAttributeDict.recursive(response["result"])
             response = {**response, "result": new_result}
         return response
 
@@ -0,0 +1,167 @@
+from abc import (
+    ABC,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Mapping,
+    cast,
+)
+
+from eth_utils.toolz import (
+    curry,
+)
+
+from web3._utils.rpc_abi import (
+    RPC,
+)
+from web3.datastructures import (
+    AttributeDict,
+    AttributeRecord,
+)
+from web3.middleware.base import (
+    Web3Middleware,
+)
+from web3.types import (
+    BlockData,
+    LogReceipt,
+    RPCEndpoint,
+    TxData,
+    TxReceipt,
+)
+
+if TYPE_CHECKING:
+    from web3 import (  # noqa: F401
+        AsyncWeb3,
+        Web3,
+    )
+    from web3.providers import (  # noqa: F401
+        PersistentConnectionProvider,
+    )
+    from web3.types import (  # noqa: F401
+        RPCResponse,
+    )
+
+
+class LogReceiptRecord(AttributeRecord):
+    __slots__ = _fields = tuple(LogReceipt.__annotations__)
+    _interned = frozenset(
+        {
+            "address",
+            "blockHash",
+            "blockNumber",
+            "blockTimestamp",
+            "topics",
+            "transactionHash",
+        }
+    )
+
+
+class TxDataRecord(AttributeRecord):
+    __slots__ = _fields = tuple(TxData.__annotations__)
+    _interned = frozenset({"blockHash", "blockNumber", "from", "to"})
+
+
+class TxReceiptRecord(AttributeRecord):
+    __slots__ = _fields = tuple(TxReceipt.__annotations__)
+    _nested = {"logs": LogReceiptRecord}
+    _interned = frozenset(
+        {"blockHash", "blockNumber", "contractAddress", "from", "to", "type"}
+    )
+
+
+class BlockDataRecord(AttributeRecord):
+    # ``ExtraDataToPOAMiddleware`` adds ``proofOfAuthorityData``, which is a field
+    __slots__ = _fields = tuple(BlockData.__annotations__)
+    _nested = {"transactions": TxDataRecord}
+
+
+RESULT_RECORD_TYPES: dict[RPCEndpoint, type[AttributeRecord]] = {
+    RPC.eth_getBlockByHash: BlockDataRecord,
+    RPC.eth_getBlockByNumber: BlockDataRecord,
+    RPC.eth_getUncleByBlockHashAndIndex: BlockDataRecord,
+    RPC.eth_getUncleByBlockNumberAndIndex: BlockDataRecord,
+    RPC.eth_getTransactionByHash: TxDataRecord,
+    RPC.eth_getTransactionByBlockHashAndIndex: TxDataRecord,
+    RPC.eth_getTransactionByBlockNumberAndIndex: TxDataRecord,
+    RPC.eth_getTransactionReceipt: TxReceiptRecord,
+    RPC.eth_getBlockReceipts: TxReceiptRecord,
+    RPC.eth_getLogs: LogReceiptRecord,
+    RPC.eth_getFilterLogs: LogReceiptRecord,
+    RPC.eth_getFilterChanges: LogReceiptRecord,
+}
+
+
+def _get_subscription_record_type(result: Any) -> type[AttributeRecord] | None:
+    """
+    The record type for a ``logs``, ``newHeads`` or full ``newPendingTransactions``
+    subscription result, or ``None`` for any other result.
+    """
+    if not isinstance(result, Mapping):
+        return None
+    elif "logIndex" in result:
+        return LogReceiptRecord
+    elif "parentHash" in result:
+        return BlockDataRecord
+    elif "input" in result:
+        return TxDataRecord
+    return None
+
+
+def _to_records(record_type: type[AttributeRecord] | None, result: Any) -> Any:
+    if record_type is None:
+        return AttributeDict.recursive(result)
+    return record_type.recursive(result)
+
+
+@curry
+def _handle_async_response(
+    method: "RPCEndpoint", response: "RPCResponse"
+) -> "RPCResponse":
+    """
+    Process the RPC response by converting known result types into records and any
+    other dictionaries into AttributeDict.
+    """
+    if "result" in response:
+        response["result"] = _to_records(
+            RESULT_RECORD_TYPES.get(method), response["result"]
+        )
+    elif "params" in response and "result" in response["params"]:
+        # subscription response
+        result = response["params"]["result"]
+        response["params"]["result"] = _to_records(
+            _get_subscription_record_type(result), result
+        )
+
+    return response
+
+
+class AttributeRecordMiddleware(Web3Middleware, ABC):
+    """
+    A drop-in replacement for ``AttributeDictMiddleware`` that converts blocks,
+    transactions, receipts and logs into compact ``AttributeRecord`` types, with the
+    same read API as ``AttributeDict``. Any other result which is a dictionary is
+    converted into an ``AttributeDict``.
+    """
+
+    def response_processor(self, method: "RPCEndpoint", response: "RPCResponse") -> Any:
+        if "result" in response:
+            new_result = _to_records(
+                RESULT_RECORD_TYPES.get(method), response["result"]
+            )
+            response = {**response, "result": new_result}
+        return response
+
+    # -- async -- #
+
+    async def async_response_processor(
+        self, method: "RPCEndpoint", response: "RPCResponse"
+    ) -> Any:
+        if self._w3.provider.has_persistent_connection:
+            provider = cast("PersistentConnectionProvider", self._w3.provider)
+            provider._request_processor.append_middleware_response_processor(
+                response, _handle_async_response(method)
+            )
+            return response
+        else:
+            return _handle_async_response(method, response)
@@ -4,6 +4,7 @@ from abc import (
 from typing import (
     TYPE_CHECKING,
     Any,
+    Collection,
     Union,
 )
 
@@ -34,6 +35,10 @@ class Web3Middleware:
 
     _w3: Union["AsyncWeb3[Any]", "Web3"]
 
+    # The RPC methods this middleware processes, or ``None`` for all methods. When
+    # set, the middleware is left out of the request pipeline for any other method.
+    handled_methods: Collection[str] | None = None
+
     def __init__(self, w3: Union["AsyncWeb3[Any]", "Web3"]) -> None:
         self._w3 = w3
 
@@ -60,9 +65,11 @@ class Web3Middleware:
         def middleware(
             requests_info: list[tuple["RPCEndpoint", Any]],
         ) -> Union[list["RPCResponse"], "RPCResponse"]:
+            # requests for methods this middleware does not handle pass through
+            handled = [self.handles_method(method) for method, _ in requests_info]
             req_processed = [
-                self.request_processor(method, params)
-                for (method, params) in requests_info
+                self.request_processor(method, params) if h else (method, params)
+                for h, (method, params) in zip(handled, requests_info)
             ]
             response = make_batch_request(req_processed)
             if not isinstance(response, list):
@@ -71,12 +78,16 @@ class Web3Middleware:
 
             methods, _params = zip(*req_processed)
             formatted_responses = [
-                self.response_processor(m, r) for m, r in zip(methods, response)
+                self.response_processor(m, r) if h else r
+                for h, m, r in zip(handled, methods, response)
             ]
             return formatted_responses
 
         return middleware
 
+    def handles_method(self, method: "RPCEndpoint") -> bool:
+        return self.handled_methods is None or method in self.handled_methods
+
     def request_processor(self, method: "RPCEndpoint", params: Any) -> Any:
         return method, params
 
@@ -105,9 +116,15 @@ class Web3Middleware:
         async def middleware(
             requests_info: list[tuple["RPCEndpoint", Any]],
         ) -> Union[list["RPCResponse"], "RPCResponse"]:
+            # requests for methods this middleware does not handle pass through
+            handled = [self.handles_method(method) for method, _ in requests_info]
             req_processed = [
-                await self.async_request_processor(method, params)
-                for (method, params) in requests_info
+                (
+                    await self.async_request_processor(method, params)
+                    if h
+                    else (method, params)
+                )
+                for h, (method, params) in zip(handled, requests_info)
             ]
             response = await make_batch_request(req_processed)
             if not isinstance(response, list):
@@ -116,8 +133,8 @@ class Web3Middleware:
 
             methods, _params = zip(*req_processed)
             formatted_responses = [
-                await self.async_response_processor(m, r)
-                for m, r in zip(methods, response)
+                await self.async_response_processor(m, r) if h else r
+                for h, m, r in zip(handled, methods, response)
             ]
             return formatted_responses
 
@@ -590,6 +590,8 @@ def _simulate_rpc_response_with_result(filter_id: str) -> "RPCResponse":
 
 
 class LocalFilterMiddleware(Web3Middleware):
+    handled_methods = NEW_FILTER_METHODS | FILTER_CHANGES_METHODS
+
     def __init__(self, w3: Union["Web3", "AsyncWeb3[Any]"]):
         self.filters: dict[str, SyncFilter] = {}
         self.async_filters: dict[str, AsyncFilter] = {}
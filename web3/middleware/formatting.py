@@ -2,6 +2,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Collection,
     Coroutine,
     Literal,
     Union,
@@ -121,6 +122,8 @@ class FormattingMiddlewareBuilder(Web3MiddlewareBuilder):
         # formatters builder option:
         sync_formatters_builder: SYNC_FORMATTERS_BUILDER | None = None,
         async_formatters_builder: ASYNC_FORMATTERS_BUILDER | None = None,
+        # methods the middleware formats, if known:
+        handled_methods: Collection[str] | None = None,
     ) -> "FormattingMiddlewareBuilder":
         # if not both sync and async formatters are specified, raise error
         if (
@@ -146,6 +149,9 @@ class FormattingMiddlewareBuilder(Web3MiddlewareBuilder):
         middleware.error_formatters = error_formatters or {}
         middleware.sync_formatters_builder = sync_formatters_builder
         middleware.async_formatters_builder = async_formatters_builder
+        # responses to every other method are still checked to be well-formed, so
+        # only skip methods when they are given explicitly
+        middleware.handled_methods = handled_methods
         return middleware
 
     def request_processor(self, method: "RPCEndpoint", params: Any) -> Any:
@@ -101,6 +101,7 @@ async def async_apply_ens_to_address_conversion(
 
 class ENSNameToAddressMiddleware(Web3Middleware):
     _formatting_middleware = None
+    handled_methods = set(RPC_ABIS)
 
     def request_processor(self, method: "RPCEndpoint", params: Any) -> Any:
         if self._formatting_middleware is None:
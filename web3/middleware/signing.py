@@ -152,6 +152,7 @@ def format_transaction(transaction: TxParams) -> TxParams:
 class SignAndSendRawMiddlewareBuilder(Web3MiddlewareBuilder):
     _accounts = None
     format_and_fill_tx = None
+    handled_methods = {"eth_sendTransaction"}
 
     @staticmethod
     @curry
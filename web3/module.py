@@ -33,6 +33,9 @@ from web3.types import (
     RPCEndpoint,
     RPCResponse,
 )
+from web3.utils.formatting import (
+    BytesRepresentation,
+)
 
 if TYPE_CHECKING:
     from web3.main import (  # noqa: F401
@@ -173,6 +176,13 @@ class Module:
             w3, self
         )
         self.w3 = w3
+        # composed request and response formatters, keyed by method, RPC method and
+        # bytes representation, see ``Method._get_formatters``
+        self._method_formatters_cache: dict[
+            tuple[Method[Callable[..., Any]], RPCEndpoint, BytesRepresentation], Any
+        ] = {}
+        # callers bound to this module, keyed by method, see ``Method.__get__``
+        self._bound_methods: dict[Method[Callable[..., Any]], Callable[..., Any]] = {}
 
     @property
     def codec(self) -> ABICodec:
@@ -185,8 +195,8 @@ class Module:
     ) -> None:
         for method_name, method_class in methods.items():
             klass = (
-                method_class.__get__(module=self)()
+                method_class.bind(self)()
                 if method_class.is_property
-                else method_class.__get__(module=self)
+                else method_class.bind(self)
             )
             setattr(self, method_name, klass)
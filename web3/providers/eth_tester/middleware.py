@@ -401,13 +401,15 @@ async def async_fill_default(
 
 
 class DefaultTransactionFieldsMiddleware(Web3Middleware):
+    handled_methods = {
+        "eth_call",
+        "eth_estimateGas",
+        "eth_sendTransaction",
+        "eth_createAccessList",
+    }
+
     def request_processor(self, method: "RPCEndpoint", params: Any) -> Any:
-        if method in (
-            "eth_call",
-            "eth_estimateGas",
-            "eth_sendTransaction",
-            "eth_createAccessList",
-        ):
+        if method in self.handled_methods:
             fill_default_from = fill_default("from", guess_from, self._w3)
             filled_transaction = pipe(
                 params[0],
@@ -419,12 +421,7 @@ class DefaultTransactionFieldsMiddleware(Web3Middleware):
     # --- async --- #
 
     async def async_request_processor(self, method: "RPCEndpoint", params: Any) -> Any:
-        if method in (
-            "eth_call",
-            "eth_estimateGas",
-            "eth_sendTransaction",
-            "eth_createAccessList",
-        ):
+        if method in self.handled_methods:
             filled_transaction = await async_fill_default(
                 "from", async_guess_from, self._w3, params[0]
             )
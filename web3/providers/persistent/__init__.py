@@ -6,6 +6,11 @@ from .persistent_connection import (
 )
 from .request_processor import (
     RequestProcessor,
+    SubscriptionQueueOverflowPolicy,
+)
+from .request_scheduler import (
+    RequestPriority,
+    RequestSchedulingConfiguration,
 )
 from .async_ipc import (
     AsyncIPCProvider,
@@ -17,6 +22,9 @@ from .websocket import (
 __all__ = [
     "PersistentConnectionProvider",
     "PersistentConnection",
+    "RequestPriority",
+    "RequestSchedulingConfiguration",
+    "SubscriptionQueueOverflowPolicy",
     "AsyncIPCProvider",
     "WebSocketProvider",
 ]
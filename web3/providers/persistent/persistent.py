@@ -10,10 +10,14 @@ from typing import (
     Any,
     Callable,
     Coroutine,
+    Hashable,
     Optional,
     cast,
 )
 
+from eth_typing import (
+    HexStr,
+)
 from websockets import (
     ConnectionClosed,
     WebSocketException,
@@ -21,15 +25,22 @@ from websockets import (
 
 from web3._utils.batching import (
     BATCH_REQUEST_ID,
+    DEFAULT_BATCH_SIZE,
     sort_batch_response_by_response_ids,
 )
 from web3._utils.caching import (
+    RequestInformation,
     generate_cache_key,
 )
 from web3._utils.caching.caching_utils import (
     async_handle_recv_caching,
     async_handle_send_caching,
 )
+from web3._utils.subscription_backfill import (
+    fetch_subscription_backfill,
+    get_backfill_start_block,
+    get_received_result_keys,
+)
 from web3._utils.validation import (
     validate_rpc_response_and_raise_if_error,
 )
@@ -45,6 +56,12 @@ from web3.providers.async_base import (
 )
 from web3.providers.persistent.request_processor import (
     RequestProcessor,
+    SubscriptionQueueOverflowPolicy,
+)
+from web3.providers.persistent.request_scheduler import (
+    RequestPriority,
+    RequestScheduler,
+    RequestSchedulingConfiguration,
 )
 from web3.types import (
     RPCEndpoint,
@@ -60,6 +77,56 @@ if TYPE_CHECKING:
 
 DEFAULT_PERSISTENT_CONNECTION_TIMEOUT = 30.0
 
+# read-only methods whose in-flight requests are re-sent after a reconnect; sending
+# any other request twice could, e.g., broadcast a transaction or create a filter again
+REPLAYABLE_METHODS = frozenset(
+    (
+        "web3_clientVersion",
+        "net_version",
+        "net_listening",
+        "net_peerCount",
+        "eth_protocolVersion",
+        "eth_syncing",
+        "eth_chainId",
+        "eth_coinbase",
+        "eth_mining",
+        "eth_hashrate",
+        "eth_gasPrice",
+        "eth_maxPriorityFeePerGas",
+        "eth_blobBaseFee",
+        "eth_feeHistory",
+        "eth_accounts",
+        "eth_blockNumber",
+        "eth_getBalance",
+        "eth_getStorageAt",
+        "eth_getProof",
+        "eth_getCode",
+        "eth_getBlockByNumber",
+        "eth_getBlockByHash",
+        "eth_getBlockReceipts",
+        "eth_getBlockTransactionCountByNumber",
+        "eth_getBlockTransactionCountByHash",
+        "eth_getUncleCountByBlockNumber",
+        "eth_getUncleCountByBlockHash",
+        "eth_getUncleByBlockHashAndIndex",
+        "eth_getUncleByBlockNumberAndIndex",
+        "eth_getTransactionByHash",
+        "eth_getTransactionByBlockHashAndIndex",
+        "eth_getTransactionByBlockNumberAndIndex",
+        "eth_getRawTransactionByHash",
+        "eth_getTransactionReceipt",
+        "eth_getTransactionCount",
+        "eth_getLogs",
+        "eth_call",
+        "eth_simulateV1",
+        "eth_estimateGas",
+        "eth_createAccessList",
+        "txpool_content",
+        "txpool_inspect",
+        "txpool_status",
+    )
+)
+
 
 class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
     logger = logging.getLogger("web3.providers.PersistentConnectionProvider")
@@ -85,6 +152,13 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
         silence_listener_task_exceptions: bool = False,
         max_connection_retries: int = 5,
         request_information_cache_size: int = 500,
+        request_scheduling_configuration: RequestSchedulingConfiguration | None = None,
+        request_timeouts: dict[RPCEndpoint, float] | None = None,
+        auto_reconnect: bool = False,
+        subscription_queue_overflow_policy: SubscriptionQueueOverflowPolicy = (
+            SubscriptionQueueOverflowPolicy.DROP_OLDEST
+        ),
+        backfill_subscriptions: bool = True,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -92,14 +166,36 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
             self,
             subscription_response_queue_size=subscription_response_queue_size,
             request_information_cache_size=request_information_cache_size,
+            subscription_queue_overflow_policy=subscription_queue_overflow_policy,
         )
         self._message_listener_task: Optional["asyncio.Task[None]"] = None
         self._listen_event: asyncio.Event = asyncio.Event()
         self._max_connection_retries = max_connection_retries
 
         self.request_timeout = request_timeout
+        self.request_timeouts = request_timeouts or {}
+        self.auto_reconnect = auto_reconnect
+        self.backfill_subscriptions = backfill_subscriptions
+        # max blocks per ``eth_getLogs`` request when backfilling logs subscriptions
+        self.subscription_backfill_chunk_size = 1000
+        # max ``eth_getBlockByNumber`` requests per batch when backfilling headers
+        self.subscription_backfill_batch_size = DEFAULT_BATCH_SIZE
+        self._backfill_batch_lock: asyncio.Lock = asyncio.Lock()
+        # idempotent requests awaiting a response, replayed after a reconnect
+        self._in_flight_requests: dict[str, RPCRequest] = {}
+        self._connection_restore_task: Optional["asyncio.Task[None]"] = None
         self.silence_listener_task_exceptions = silence_listener_task_exceptions
 
+        self._request_scheduler: RequestScheduler | None = (
+            # late-bind ``socket_send`` so the implementation class method is used
+            RequestScheduler(
+                lambda request_data: self.socket_send(request_data),
+                request_scheduling_configuration,
+            )
+            if request_scheduling_configuration is not None
+            else None
+        )
+
     # -- cached middleware request/response functions -- #
 
     async def send_func(
@@ -116,9 +212,10 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
             async def send_function(method: RPCEndpoint, params: Any) -> RPCRequest:
                 for mw in middleware:
                     initialized = mw(async_w3)
-                    method, params = await initialized.async_request_processor(
-                        method, params
-                    )
+                    if initialized.handles_method(method):
+                        method, params = await initialized.async_request_processor(
+                            method, params
+                        )
 
                 return await self.send_request(method, params)
 
@@ -143,9 +240,10 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
                 method = rpc_request["method"]
                 for mw in reversed(middleware):
                     initialized = mw(async_w3)
-                    response = await initialized.async_response_processor(
-                        method, response
-                    )
+                    if initialized.handles_method(method):
+                        response = await initialized.async_response_processor(
+                            method, response
+                        )
                 return response
 
             self._recv_func_cache = (cache_key, recv_function)
@@ -166,7 +264,11 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
                 for mw in middleware:
                     initialized = mw(async_w3)
                     requests = [
-                        await initialized.async_request_processor(method, params)
+                        (
+                            await initialized.async_request_processor(method, params)
+                            if initialized.handles_method(method)
+                            else (method, params)
+                        )
                         for (method, params) in requests
                     ]
                 return await self.send_batch_request(requests)
@@ -195,7 +297,11 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
 
                     initialized = mw(async_w3)
                     responses = [
-                        await initialized.async_response_processor(m, r)
+                        (
+                            await initialized.async_response_processor(m, r)
+                            if initialized.handles_method(m)
+                            else r
+                        )
                         for m, r in zip(methods, responses)
                     ]
                 return responses
@@ -218,6 +324,11 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
             )
 
     async def connect(self) -> None:
+        await self._connect_with_retries()
+        self._message_listener_task = asyncio.create_task(self._message_listener())
+        self._message_listener_task.add_done_callback(self._message_listener_callback)
+
+    async def _connect_with_retries(self) -> None:
         endpoint = self.get_endpoint_uri_or_ipc_path()
         _connection_attempts = 0
         _backoff_rate_change = 1.75
@@ -228,12 +339,6 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
                 _connection_attempts += 1
                 self.logger.info("Connecting to: %s", endpoint)
                 await self._provider_specific_connect()
-                self._message_listener_task = asyncio.create_task(
-                    self._message_listener()
-                )
-                self._message_listener_task.add_done_callback(
-                    self._message_listener_callback
-                )
                 self.logger.info("Successfully connected to: %s", endpoint)
                 break
             except (WebSocketException, OSError) as e:
@@ -263,6 +368,14 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
             self._message_listener_task = None
             self.logger.info("Message listener background task successfully shut down.")
 
+        if self._connection_restore_task is not None:
+            self._connection_restore_task.cancel()
+            self._connection_restore_task = None
+        self._in_flight_requests.clear()
+
+        if self._request_scheduler is not None:
+            self._request_scheduler.clear()
+
         await self._provider_specific_disconnect()
         self._request_processor.clear_caches()
         self.logger.info(
@@ -270,17 +383,56 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
             self.get_endpoint_uri_or_ipc_path(),
         )
 
+    def subscription_queue_metrics(self) -> dict[str, dict[str, int]]:
+        """
+        Depth and overflow counters for the subscription response queues, keyed by
+        queue name.
+        """
+        return self._request_processor.subscription_queue_metrics()
+
     # -- request methods -- #
 
+    def get_request_timeout(self, method: RPCEndpoint) -> float:
+        """
+        The time to wait for a response to a request for ``method``. Falls back to
+        ``request_timeout`` if no timeout is configured for the method.
+        """
+        return self.request_timeouts.get(method, self.request_timeout)
+
     @async_handle_send_caching
     async def send_request(self, method: RPCEndpoint, params: Any) -> RPCRequest:
         request_dict = self.form_request(method, params)
-        await self.socket_send(self.encode_rpc_dict(request_dict))
+        if self.auto_reconnect and method in REPLAYABLE_METHODS:
+            # record before sending so a connection lost mid-send is still replayed
+            request_key = generate_cache_key(request_dict["id"])
+            self._in_flight_requests[request_key] = request_dict
+            try:
+                await self._scheduled_socket_send(
+                    self.encode_rpc_dict(request_dict), [method]
+                )
+            except (ConnectionClosed, OSError) as e:
+                # the listener reconnects and replays the request, so wait for its
+                # response as if it had been sent
+                self.logger.debug(
+                    "Connection lost while sending request, awaiting its replay: "
+                    "%s: %s",
+                    e.__class__.__name__,
+                    e,
+                )
+            except Exception:
+                self._in_flight_requests.pop(request_key, None)
+                raise
+        else:
+            await self._scheduled_socket_send(
+                self.encode_rpc_dict(request_dict), [method]
+            )
         return request_dict
 
     @async_handle_recv_caching
     async def recv_for_request(self, rpc_request: RPCRequest) -> RPCResponse:
-        return await self._get_response_for_request_id(rpc_request["id"])
+        return await self._get_response_for_request_id(
+            rpc_request["id"], timeout=self.get_request_timeout(rpc_request["method"])
+        )
 
     async def make_request(
         self,
@@ -299,16 +451,33 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
             self.form_request(method, params) for (method, params) in requests
         ]
         request_data = self.encode_batch_request_dicts(request_dicts)
-        await self.socket_send(request_data)
+        await self._scheduled_socket_send(
+            request_data, [method for (method, _params) in requests]
+        )
         return request_dicts
 
     async def recv_for_batch_request(
-        self, _request_dicts: list[RPCRequest]
+        self, request_dicts: list[RPCRequest]
     ) -> list[RPCResponse]:
-        response = cast(
-            list[RPCResponse],
-            await self._get_response_for_request_id(BATCH_REQUEST_ID),
+        timeout = max(
+            (self.get_request_timeout(d["method"]) for d in request_dicts),
+            default=self.request_timeout,
         )
+        try:
+            response = cast(
+                list[RPCResponse],
+                await self._get_response_for_request_id(
+                    BATCH_REQUEST_ID, timeout=timeout
+                ),
+            )
+        except (TimeExhausted, asyncio.CancelledError):
+            # The batch cache key is shared by all batches, so only the request
+            # information for the individual requests is deregistered here.
+            for request_dict in request_dicts:
+                self._request_processor.pop_cached_request_information(
+                    generate_cache_key(request_dict["id"])
+                )
+            raise
         return response
 
     async def make_batch_request(
@@ -336,6 +505,25 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
 
     # -- private methods -- #
 
+    async def _scheduled_socket_send(
+        self, request_data: bytes, methods: list[RPCEndpoint]
+    ) -> None:
+        """
+        Send the request data directly over the socket or, if request scheduling is
+        configured, through the priority scheduler.
+        """
+        if self._request_scheduler is None:
+            await self.socket_send(request_data)
+            return
+
+        config = self._request_scheduler.configuration
+        priority: RequestPriority = (
+            config.get_priority(methods[0])
+            if len(methods) == 1
+            else config.get_batch_priority(methods)
+        )
+        await self._request_scheduler.send(request_data, priority)
+
     async def _provider_specific_connect(self) -> None:
         raise NotImplementedError("Must be implemented by subclasses")
 
@@ -435,7 +623,14 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
                 # trigger a return to end the listener task and initiate the callback fn
                 return
             except Exception as e:
-                if not self.silence_listener_task_exceptions:
+                if self.auto_reconnect and isinstance(e, (ConnectionClosed, OSError)):
+                    self.logger.warning(
+                        "Connection lost, reconnecting: %s: %s",
+                        e.__class__.__name__,
+                        e,
+                    )
+                    await self._reconnect()
+                elif not self.silence_listener_task_exceptions:
                     raise e
                 else:
                     self._error_log_listener_task_exception(e)
@@ -467,6 +662,148 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
         ):
             raise msg_listener_task.exception()
 
+    async def _reconnect(self) -> None:
+        """
+        Re-establish the connection from within the listener task. Idempotent
+        in-flight requests are re-sent with their original ids so their waiters
+        receive the response, and active subscriptions are re-created in a separate
+        task, since their responses must be read by this listener.
+        """
+        try:
+            await self._provider_specific_disconnect()
+        except Exception:
+            self.logger.debug("Error closing lost connection.", exc_info=True)
+
+        await self._connect_with_retries()
+
+        for request_dict in list(self._in_flight_requests.values()):
+            self.logger.debug("Replaying in-flight request: %s", request_dict)
+            await self.socket_send(self.encode_rpc_dict(request_dict))
+
+        if self._connection_restore_task is not None:
+            self._connection_restore_task.cancel()
+        self._connection_restore_task = asyncio.create_task(self._resubscribe())
+
+    async def _resubscribe(self) -> None:
+        request_processor = self._request_processor
+        request_info_cache = request_processor._request_information_cache
+        subscription_infos = [
+            request_info
+            for key, request_info in request_info_cache.items()
+            if request_info.method == "eth_subscribe"
+            and request_info.subscription_id is not None
+            and key == generate_cache_key(request_info.subscription_id)
+        ]
+
+        async def _resubscribe_one(request_info: RequestInformation) -> bool:
+            subscribers = (
+                request_processor._subscription_container.get_subscribers_by_id(
+                    HexStr(request_info.subscription_id)
+                )
+                if request_processor._subscription_container is not None
+                else []
+            )
+            backfill_from_block = (
+                get_backfill_start_block(subscribers)
+                if self.backfill_subscriptions
+                else None
+            )
+            received_keys = get_received_result_keys(subscribers)
+
+            request_dict = self.form_request(
+                RPCEndpoint("eth_subscribe"), request_info.params
+            )
+            # register the request so an error response is not treated as stray
+            request_key = request_processor.cache_request_information(
+                request_dict["id"],
+                request_dict["method"],
+                request_dict["params"],
+                request_info.response_formatters,
+            )
+            # the listener moves the subscription to its new id, pausing it while it
+            # is backfilled, as soon as the response is read
+            resubscription_key = generate_cache_key(request_dict["id"])
+            request_processor._resubscription_requests[resubscription_key] = (
+                HexStr(request_info.subscription_id),
+                backfill_from_block is not None,
+            )
+            try:
+                await self.socket_send(self.encode_rpc_dict(request_dict))
+                response = await self._get_response_for_request_id(request_dict["id"])
+            finally:
+                request_processor._resubscription_requests.pop(resubscription_key, None)
+                if request_key is not None:
+                    request_processor.pop_cached_request_information(request_key)
+
+            if "result" not in response:
+                self.logger.error(
+                    "Failed to re-establish subscription after reconnect:\n"
+                    "    subscription_id=%s,\n    response=%s",
+                    request_info.subscription_id,
+                    response,
+                )
+                return False
+
+            if backfill_from_block is not None:
+                await self._backfill_subscription(
+                    response["result"],
+                    request_info.params,
+                    backfill_from_block,
+                    received_keys,
+                )
+            return True
+
+        # one subscription failing to be re-established does not stop the others
+        results = await asyncio.gather(
+            *(_resubscribe_one(request_info) for request_info in subscription_infos),
+            return_exceptions=True,
+        )
+        for request_info, result in zip(subscription_infos, results):
+            if isinstance(result, BaseException):
+                self.logger.error(
+                    "Failed to re-establish subscription after reconnect:\n"
+                    "    subscription_id=%s",
+                    request_info.subscription_id,
+                    exc_info=result,
+                )
+        self.logger.info(
+            "Re-established %s of %s subscription(s) after reconnect.",
+            sum(result is True for result in results),
+            len(subscription_infos),
+        )
+
+    async def _backfill_subscription(
+        self,
+        subscription_id: HexStr,
+        subscription_params: Any,
+        from_block: int,
+        received_keys: set[Hashable],
+    ) -> None:
+        """
+        Queue the results a re-established subscription missed while disconnected,
+        from ``from_block`` to the latest block, before resuming its live responses.
+        """
+        backfilled_results: list[Any] = []
+        try:
+            backfilled_results = await fetch_subscription_backfill(
+                self,
+                subscription_params,
+                from_block,
+                self.subscription_backfill_chunk_size,
+                self.subscription_backfill_batch_size,
+            )
+        except Exception as e:
+            self.logger.error(
+                "Failed to backfill subscription after reconnect:\n"
+                "    subscription_id=%s,\n    error=%s",
+                subscription_id,
+                e,
+            )
+        finally:
+            await self._request_processor.resume_subscription(
+                subscription_id, backfilled_results, received_keys
+            )
+
     async def _get_response_for_request_id(
         self, request_id: RPCId | list[RPCId], timeout: float | None = None
     ) -> RPCResponse:
@@ -498,11 +835,20 @@ class PersistentConnectionProvider(AsyncJSONBaseProvider, ABC):
             # cache. If the request is not in the cache within the request_timeout,
             # raise ``TimeExhausted``.
             return await asyncio.wait_for(_match_response_id_to_request_id(), timeout)
+        except asyncio.CancelledError:
+            if request_id != BATCH_REQUEST_ID:
+                self._request_processor.cancel_request(request_id)
+            raise
         except asyncio.TimeoutError:
+            if request_id != BATCH_REQUEST_ID:
+                self._request_processor.cancel_request(request_id)
             raise TimeExhausted(
                 f"Timed out waiting for response with request id `{request_id}` after "
-                f"{self.request_timeout} second(s). This may be due to the provider "
+                f"{timeout} second(s). This may be due to the provider "
                 "not returning a response with the same id that was sent in the "
                 "request or an exception raised during the request was caught and "
                 "allowed to continue."
             )
+        finally:
+            if self._in_flight_requests:
+                self._in_flight_requests.pop(generate_cache_key(request_id), None)
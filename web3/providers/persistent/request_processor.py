@@ -1,9 +1,19 @@
 import asyncio
+from enum import (
+    Enum,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Hashable,
+    Sequence,
     TypeVar,
+    cast,
+)
+
+from eth_typing import (
+    HexStr,
 )
 
 from web3._utils.batching import (
@@ -12,6 +22,11 @@ from web3._utils.batching import (
 from web3._utils.caching import (
     RequestInformation,
     generate_cache_key,
+    generate_request_cache_key,
+)
+from web3._utils.subscription_backfill import (
+    get_result_key,
+    record_subscription_result,
 )
 from web3.exceptions import (
     SubscriptionProcessingFinished,
@@ -51,6 +66,57 @@ class TaskReliantQueue(asyncio.Queue[T]):
             raise item
         return item
 
+    def drop_oldest(self, predicate: Callable[[T], bool]) -> bool:
+        """
+        Remove the oldest queued item that matches ``predicate``, accounting for it
+        as a finished task. Returns ``True`` if an item was removed.
+        """
+        queued = self._queue  # type: ignore[attr-defined]
+        for i, item in enumerate(queued):
+            if predicate(item):
+                del queued[i]
+                self._wakeup_next(self._putters)  # type: ignore[attr-defined]
+                self.task_done()
+                return True
+        return False
+
+    def coalesce(self, item: T, predicate: Callable[[T], bool]) -> bool:
+        """
+        Replace the most recently queued item that matches ``predicate`` with
+        ``item``. The queue size and unfinished tasks are unchanged. Returns ``True``
+        if an item was replaced.
+        """
+        queued = self._queue  # type: ignore[attr-defined]
+        for i in range(len(queued) - 1, -1, -1):
+            if predicate(queued[i]):
+                queued[i] = item
+                return True
+        return False
+
+
+class SubscriptionQueueOverflowPolicy(str, Enum):
+    """
+    What the request processor does with a subscription response that arrives while
+    its subscription queue is full.
+    """
+
+    # wait for the consumer to make room, pausing the socket reader
+    BLOCK = "block"
+    # discard the oldest queued subscription response to make room
+    DROP_OLDEST = "drop_oldest"
+    # discard the subscription response that just arrived
+    DROP_NEWEST = "drop_newest"
+    # replace the latest queued response for the same subscription, if there is one,
+    # otherwise discard the oldest queued subscription response
+    COALESCE = "coalesce"
+
+
+class SubscriptionQueueMetrics:
+    def __init__(self) -> None:
+        self.max_depth = 0
+        self.dropped = 0
+        self.coalesced = 0
+
 
 class RequestProcessor:
     _subscription_queue_synced_with_ws_stream: bool = False
@@ -63,18 +129,34 @@ class RequestProcessor:
         provider: "PersistentConnectionProvider",
         subscription_response_queue_size: int = 500,
         request_information_cache_size: int = 500,
+        subscription_queue_overflow_policy: SubscriptionQueueOverflowPolicy = (
+            SubscriptionQueueOverflowPolicy.DROP_OLDEST
+        ),
     ) -> None:
         self._provider = provider
         self._request_information_cache: SimpleCache = SimpleCache(
             request_information_cache_size
         )
         self._request_response_cache: SimpleCache = SimpleCache(500)
+        # ids of requests that are no longer being waited on (e.g. timed out), so that
+        # any late responses for them can be dropped as soon as they arrive
+        self._cancelled_request_cache: SimpleCache = SimpleCache(
+            request_information_cache_size
+        )
         self._subscription_response_queue: TaskReliantQueue[
             RPCResponse | TaskNotRunning
         ] = TaskReliantQueue(maxsize=subscription_response_queue_size)
         self._handler_subscription_queue: TaskReliantQueue[
             RPCResponse | TaskNotRunning | SubscriptionProcessingFinished
         ] = TaskReliantQueue(maxsize=subscription_response_queue_size)
+        self._subscription_queue_overflow_policy = subscription_queue_overflow_policy
+        self._subscription_response_queue_metrics = SubscriptionQueueMetrics()
+        self._handler_subscription_queue_metrics = SubscriptionQueueMetrics()
+        # ``eth_subscribe`` requests re-establishing a subscription after a reconnect,
+        # mapped to the id of the subscription and whether to pause it for backfill
+        self._resubscription_requests: dict[str, tuple[HexStr, bool]] = {}
+        # responses held back for subscriptions being backfilled
+        self._paused_subscription_responses: dict[HexStr, list[RPCResponse]] = {}
 
     @property
     def active_subscriptions(self) -> dict[str, Any]:
@@ -97,9 +179,10 @@ class RequestProcessor:
             Callable[..., Any],
         ],
     ) -> str | None:
-        cached_requests_key = generate_cache_key((method, params))
-        if cached_requests_key in self._provider._request_cache._data:
-            cached_response = self._provider._request_cache._data[cached_requests_key]
+        cached_response = self._provider._request_cache.get_cache_entry(
+            generate_request_cache_key(method, params)
+        )
+        if cached_response is not None:
             cached_response_id = cached_response.get("id")
             cache_key = generate_cache_key(cached_response_id)
             if cache_key in self._request_information_cache:
@@ -155,6 +238,38 @@ class RequestProcessor:
             )
         return request_info
 
+    def cancel_request(self, request_id: RPCId | list[RPCId]) -> None:
+        """
+        Deregister a request that is no longer being waited on, i.e. its waiter
+        timed out or was cancelled. The request information is removed so it doesn't
+        take up a cache slot, and a response that arrives later is dropped.
+        """
+        cache_key = generate_cache_key(request_id)
+        self.pop_cached_request_information(cache_key)
+        if self._request_response_cache.pop(cache_key) is None:
+            self._cancelled_request_cache.cache(cache_key, request_id)
+        self._provider.logger.debug(
+            "Request cancelled, late responses will be dropped:\n"
+            "    request_id=%s,\n    cache_key=%s",
+            request_id,
+            cache_key,
+        )
+
+    def _is_cached_provider_response(
+        self, request_info: RequestInformation, response: RPCResponse
+    ) -> bool:
+        """
+        Whether the response is the one stored in the provider request cache for the
+        request. Looked up by the request's cache key so the cost does not depend on
+        the size of the request cache.
+        """
+        cached_response = self._provider._request_cache.get_cache_entry(
+            generate_request_cache_key(request_info.method, request_info.params)
+        )
+        return cached_response is not None and (
+            cached_response is response or cached_response == response
+        )
+
     def get_request_information_for_response(
         self,
         response: RPCResponse,
@@ -178,19 +293,15 @@ class RequestProcessor:
         else:
             # retrieve the request info from the cache using the response id
             cache_key = generate_cache_key(response["id"])
-            if response in self._provider._request_cache._data.values():
-                request_info = (
-                    # don't pop the request info from the cache, since we need to keep
-                    # it to process future responses
-                    # i.e. request information remains in the cache
-                    self._request_information_cache.get_cache_entry(cache_key)
-                )
-            else:
-                request_info = (
-                    # pop the request info from the cache since we don't need to keep it
-                    # this keeps the cache size bounded
-                    self.pop_cached_request_information(cache_key)
-                )
+            request_info = self._request_information_cache.get_cache_entry(cache_key)
+            if request_info is not None and not self._is_cached_provider_response(
+                request_info, response
+            ):
+                # pop the request info from the cache since we don't need to keep it,
+                # this keeps the cache size bounded. Request info for responses served
+                # from the provider request cache remains in the cache to process
+                # future responses.
+                request_info = self.pop_cached_request_information(cache_key)
 
             if (
                 request_info is not None
@@ -205,6 +316,34 @@ class RequestProcessor:
 
         return request_info
 
+    def update_subscription_id(
+        self, old_subscription_id: str, new_subscription_id: str
+    ) -> None:
+        """
+        Point an active subscription at the id it was given when re-subscribing,
+        e.g. after a reconnect. The cached subscription request information and the
+        managed ``EthSubscription``, if any, are moved over to the new id.
+        """
+        request_info = self.pop_cached_request_information(
+            generate_cache_key(old_subscription_id)
+        )
+        if request_info is not None:
+            request_info.subscription_id = new_subscription_id
+            self._request_information_cache.cache(
+                generate_cache_key(new_subscription_id), request_info
+            )
+
+        if self._subscription_container is not None:
+            self._subscription_container.update_subscription_id(
+                HexStr(old_subscription_id), HexStr(new_subscription_id)
+            )
+
+        self._provider.logger.debug(
+            "Subscription id updated:\n    old_id=%s,\n    new_id=%s",
+            old_subscription_id,
+            new_subscription_id,
+        )
+
     def append_middleware_response_processor(
         self,
         response: RPCResponse,
@@ -244,11 +383,182 @@ class RequestProcessor:
             and self._provider._is_batching
         )
 
+    # subscription queues
+
+    def subscription_queue_metrics(self) -> dict[str, dict[str, int]]:
+        """
+        Current depth, maximum depth seen, and the number of subscription responses
+        dropped or coalesced for each subscription queue.
+        """
+        queues: tuple[
+            tuple[str, TaskReliantQueue[Any], SubscriptionQueueMetrics], ...
+        ] = (
+            (
+                "subscription_response_queue",
+                self._subscription_response_queue,
+                self._subscription_response_queue_metrics,
+            ),
+            (
+                "handler_subscription_queue",
+                self._handler_subscription_queue,
+                self._handler_subscription_queue_metrics,
+            ),
+        )
+        return {
+            name: {
+                "depth": queue.qsize(),
+                "max_depth": metrics.max_depth,
+                "dropped": metrics.dropped,
+                "coalesced": metrics.coalesced,
+            }
+            for name, queue, metrics in queues
+        }
+
+    def _make_room_in_subscription_queue(
+        self,
+        queue: TaskReliantQueue[Any],
+        metrics: SubscriptionQueueMetrics,
+        raw_response: RPCResponse,
+    ) -> bool:
+        """
+        Apply the overflow policy to a full subscription queue. Returns ``True`` if
+        ``raw_response`` should still be put in the queue.
+        """
+        policy = self._subscription_queue_overflow_policy
+
+        # only subscription responses are ever removed or replaced, never the
+        # exceptions used to signal the consumer
+        if policy == SubscriptionQueueOverflowPolicy.COALESCE:
+            subscription_id = raw_response["params"]["subscription"]
+            if queue.coalesce(
+                raw_response,
+                lambda item: isinstance(item, dict)
+                and item.get("params", {}).get("subscription") == subscription_id,
+            ):
+                metrics.coalesced += 1
+                return False
+
+        metrics.dropped += 1
+        return policy != SubscriptionQueueOverflowPolicy.DROP_NEWEST and (
+            queue.drop_oldest(lambda item: isinstance(item, dict))
+        )
+
+    async def _put_subscription_response(
+        self,
+        queue: TaskReliantQueue[Any],
+        metrics: SubscriptionQueueMetrics,
+        raw_response: RPCResponse,
+    ) -> None:
+        if self._subscription_queue_overflow_policy == (
+            SubscriptionQueueOverflowPolicy.BLOCK
+        ):
+            await queue.put(raw_response)
+        elif not queue.full() or self._make_room_in_subscription_queue(
+            queue, metrics, raw_response
+        ):
+            queue.put_nowait(raw_response)
+        else:
+            self._provider.logger.debug(
+                "Subscription queue is full, response not queued:\n"
+                "    policy=%s,\n    response=%s",
+                self._subscription_queue_overflow_policy.value,
+                raw_response,
+            )
+
+        metrics.max_depth = max(metrics.max_depth, queue.qsize())
+
+    async def _queue_subscription_response(self, raw_response: RPCResponse) -> None:
+        params: dict[str, Any] = cast(dict[str, Any], raw_response.get("params", {}))
+        subscription_id = params.get("subscription")
+        subscribers = (
+            self._subscription_container.get_subscribers_by_id(subscription_id)
+            if self._subscription_container is not None
+            else []
+        )
+        if self._provider.auto_reconnect and self._provider.backfill_subscriptions:
+            for sub in subscribers:
+                record_subscription_result(sub, raw_response["params"]["result"])
+
+        if any(sub._handler for sub in subscribers):
+            # if the subscription has a handler, put it in the handler queue
+            await self._put_subscription_response(
+                self._handler_subscription_queue,
+                self._handler_subscription_queue_metrics,
+                raw_response,
+            )
+        if not subscribers or not all(sub._handler for sub in subscribers):
+            # otherwise, put it in the subscription response queue so a response
+            # can be yielded by the message stream. A subscription shared by
+            # subscribers with and without handlers is put in both queues.
+            await self._put_subscription_response(
+                self._subscription_response_queue,
+                self._subscription_response_queue_metrics,
+                raw_response,
+            )
+
+    async def resume_subscription(
+        self,
+        subscription_id: HexStr,
+        backfilled_results: Sequence[Any],
+        received_keys: set[Hashable],
+    ) -> None:
+        """
+        Queue the results backfilled for a paused subscription, then the responses
+        held back while it was paused, dropping any result already received, and
+        resume queueing its responses as they arrive.
+        """
+        held = self._paused_subscription_responses.get(subscription_id, [])
+        seen = set(received_keys)
+        for result in backfilled_results:
+            key = get_result_key(result)
+            if key not in seen:
+                seen.add(key)
+                await self._queue_subscription_response(
+                    cast(
+                        RPCResponse,
+                        {
+                            "jsonrpc": "2.0",
+                            "method": "eth_subscription",
+                            "params": {
+                                "subscription": subscription_id,
+                                "result": result,
+                            },
+                        },
+                    )
+                )
+
+        # responses may still be held while queueing, so drain until none are left
+        while held:
+            raw_response = held.pop(0)
+            key = get_result_key(raw_response["params"]["result"])
+            if key not in seen:
+                seen.add(key)
+                await self._queue_subscription_response(raw_response)
+        self._paused_subscription_responses.pop(subscription_id, None)
+
+        self._provider.logger.debug(
+            "Subscription resumed:\n    subscription_id=%s,\n    backfilled=%s",
+            subscription_id,
+            len(backfilled_results),
+        )
+
     async def cache_raw_response(
         self, raw_response: Any, subscription: bool = False
     ) -> None:
         if subscription:
-            if self._subscription_response_queue.full():
+            held = self._paused_subscription_responses.get(
+                raw_response.get("params", {}).get("subscription")
+            )
+            if held is not None:
+                # the subscription is being backfilled, queue the response after
+                held.append(raw_response)
+                return
+
+            block = (
+                self._subscription_queue_overflow_policy
+                == SubscriptionQueueOverflowPolicy.BLOCK
+            )
+            if block and self._subscription_response_queue.full():
                 self._provider.logger.debug(
                     "Subscription queue is full. Waiting for provider to consume "
                     "messages before caching."
@@ -259,17 +569,7 @@ class RequestProcessor:
             self._provider.logger.debug(
                 "Caching subscription response:\n    response=%s", raw_response
             )
-            subscription_id = raw_response.get("params", {}).get("subscription")
-            sub_container = self._subscription_container
-            if sub_container and sub_container.get_handler_subscription_by_id(
-                subscription_id
-            ):
-                # if the subscription has a handler, put it in the handler queue
-                await self._handler_subscription_queue.put(raw_response)
-            else:
-                # otherwise, put it in the subscription response queue so a response
-                # can be yielded by the message stream
-                await self._subscription_response_queue.put(raw_response)
+            await self._queue_subscription_response(raw_response)
         elif self._is_batch_response(raw_response):
             # Since only one batch should be in the cache at all times, we use a
             # constant cache key for the batch response.
@@ -283,6 +583,24 @@ class RequestProcessor:
         else:
             response_id = raw_response.get("id")
             cache_key = generate_cache_key(response_id)
+            if self._cancelled_request_cache.pop(cache_key) is not None:
+                self._provider.logger.debug(
+                    "Dropping late response for cancelled request:\n"
+                    "    response_id=%s,\n    response=%s",
+                    response_id,
+                    raw_response,
+                )
+                return
+
+            resubscription = self._resubscription_requests.pop(cache_key, None)
+            if resubscription is not None and "result" in raw_response:
+                # move the subscription to its new id before any of its messages are
+                # read from the socket
+                subscription_id, pause = resubscription
+                self.update_subscription_id(subscription_id, raw_response["result"])
+                if pause:
+                    self._paused_subscription_responses[raw_response["result"]] = []
+
             self._provider.logger.debug(
                 "Caching response:\n    response_id=%s,\n"
                 "    cache_key=%s,\n    response=%s",
@@ -351,6 +669,7 @@ class RequestProcessor:
         """Clear the request processor caches."""
         self._request_information_cache.clear()
         self._request_response_cache.clear()
+        self._cancelled_request_cache.clear()
         self._subscription_response_queue = TaskReliantQueue(
             maxsize=self._subscription_response_queue.maxsize
         )
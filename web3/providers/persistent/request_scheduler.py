@@ -0,0 +1,187 @@
+import asyncio
+from collections import (
+    deque,
+)
+from enum import (
+    IntEnum,
+)
+import logging
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Sequence,
+)
+
+from pydantic import (
+    BaseModel,
+)
+
+from web3._utils.rpc_abi import (
+    RPC,
+)
+from web3.exceptions import (
+    Web3ValidationError,
+)
+from web3.types import (
+    RPCEndpoint,
+)
+
+
+class RequestPriority(IntEnum):
+    """
+    Priority lanes for requests sent over a persistent connection. Lower values are
+    sent first.
+    """
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+DEFAULT_REQUEST_PRIORITIES: dict[str, RequestPriority] = {
+    RPC.eth_sendRawTransaction: RequestPriority.HIGH,
+    RPC.eth_sendTransaction: RequestPriority.HIGH,
+    RPC.eth_call: RequestPriority.HIGH,
+    RPC.eth_estimateGas: RequestPriority.HIGH,
+    RPC.eth_getLogs: RequestPriority.LOW,
+}
+
+
+class RequestSchedulingConfiguration(BaseModel):
+    priorities: dict[str, RequestPriority]
+    default_priority: RequestPriority
+    weights: dict[RequestPriority, int] | None
+
+    def __init__(
+        self,
+        priorities: dict[str, RequestPriority] | None = None,
+        default_priority: RequestPriority = RequestPriority.NORMAL,
+        weights: dict[RequestPriority, int] | None = None,
+    ):
+        if weights is not None:
+            if set(weights) != set(RequestPriority):
+                raise Web3ValidationError(
+                    "Weights must be provided for every request priority: "
+                    f"{[priority.name for priority in RequestPriority]}"
+                )
+            if any(weight < 1 for weight in weights.values()):
+                raise Web3ValidationError("Request priority weights must be >= 1.")
+
+        super().__init__(
+            priorities=(
+                priorities if priorities is not None else DEFAULT_REQUEST_PRIORITIES
+            ),
+            default_priority=default_priority,
+            weights=weights,
+        )
+
+    def get_priority(self, method: RPCEndpoint) -> RequestPriority:
+        return self.priorities.get(method, self.default_priority)
+
+    def get_batch_priority(self, methods: Sequence[RPCEndpoint]) -> RequestPriority:
+        # a batch is only as urgent as its most urgent request
+        return min(
+            (self.get_priority(method) for method in methods),
+            default=self.default_priority,
+        )
+
+
+class RequestScheduler:
+    """
+    Orders outgoing request data by priority before it is written to the socket.
+
+    Requests are queued in one lane per ``RequestPriority``. A single sender task
+    drains the lanes, either strictly by priority or, if ``weights`` are configured,
+    by weighted round-robin so that lower priority lanes are never starved. Higher
+    priority requests overtake any lower priority requests still waiting in the
+    queue.
+    """
+
+    logger = logging.getLogger("web3.providers.persistent.RequestScheduler")
+
+    def __init__(
+        self,
+        socket_send: Callable[[bytes], Coroutine[Any, Any, None]],
+        configuration: RequestSchedulingConfiguration,
+    ) -> None:
+        self._socket_send = socket_send
+        self.configuration = configuration
+        self._lanes: dict[
+            RequestPriority, deque[tuple[bytes, "asyncio.Future[None]"]]
+        ] = {priority: deque() for priority in RequestPriority}
+        self._credits: dict[RequestPriority, int] = {}
+        self._sender_task: asyncio.Task[None] | None = None
+        self._reset_credits()
+
+    def __len__(self) -> int:
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def queue_depths(self) -> dict[RequestPriority, int]:
+        return {priority: len(lane) for priority, lane in self._lanes.items()}
+
+    async def send(self, request_data: bytes, priority: RequestPriority) -> None:
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._lanes[priority].append((request_data, future))
+
+        if self._sender_task is None or self._sender_task.done():
+            self._sender_task = asyncio.create_task(self._sender())
+
+        await future
+
+    def clear(self) -> None:
+        """Cancel the sender task and any requests still waiting to be sent."""
+        if self._sender_task is not None and not self._sender_task.done():
+            self._sender_task.cancel()
+        self._sender_task = None
+
+        for lane in self._lanes.values():
+            while lane:
+                _data, future = lane.popleft()
+                if not future.done():
+                    future.cancel()
+        self._reset_credits()
+
+    # -- private methods -- #
+
+    def _reset_credits(self) -> None:
+        weights = self.configuration.weights
+        if weights is not None:
+            self._credits = dict(weights)
+
+    def _next_priority(self) -> RequestPriority | None:
+        non_empty = [priority for priority in RequestPriority if self._lanes[priority]]
+        if not non_empty:
+            return None
+
+        if self.configuration.weights is None:
+            # strict priority
+            return non_empty[0]
+
+        # weighted round-robin: serve lanes in priority order while they have credit,
+        # refilling all credits once every non-empty lane has used up its share
+        for priority in non_empty:
+            if self._credits[priority] > 0:
+                self._credits[priority] -= 1
+                return priority
+
+        self._reset_credits()
+        self._credits[non_empty[0]] -= 1
+        return non_empty[0]
+
+    async def _sender(self) -> None:
+        while (priority := self._next_priority()) is not None:
+            request_data, future = self._lanes[priority].popleft()
+            if future.done():
+                # the waiter was cancelled before the request was sent
+                continue
+
+            try:
+                await self._socket_send(request_data)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(None)
@@ -1,6 +1,7 @@
 from typing import (
     Any,
     Iterator,
+    Sequence,
 )
 
 from eth_typing import (
@@ -17,6 +18,10 @@ class SubscriptionContainer:
         self.subscriptions: list[EthSubscription[Any]] = []
         self.subscriptions_by_id: dict[HexStr, EthSubscription[Any]] = {}
         self.subscriptions_by_label: dict[str, EthSubscription[Any]] = {}
+        # every local subscription served by an upstream subscription id, and the
+        # params that upstream subscription was created with
+        self.subscribers_by_id: dict[HexStr, list[EthSubscription[Any]]] = {}
+        self.upstream_params_by_id: dict[HexStr, Sequence[Any]] = {}
 
     def __len__(self) -> int:
         return len(self.subscriptions)
@@ -24,16 +29,49 @@ class SubscriptionContainer:
     def __iter__(self) -> Iterator[EthSubscription[Any]]:
         return iter(self.subscriptions)
 
-    def add_subscription(self, subscription: EthSubscription[Any]) -> None:
+    def add_subscription(
+        self,
+        subscription: EthSubscription[Any],
+        upstream_params: Sequence[Any] | None = None,
+    ) -> None:
         self.subscriptions.append(subscription)
-        self.subscriptions_by_id[subscription.id] = subscription
+        self.subscriptions_by_id.setdefault(subscription.id, subscription)
         self.subscriptions_by_label[subscription.label] = subscription
+        self.subscribers_by_id.setdefault(subscription.id, []).append(subscription)
+        self.upstream_params_by_id.setdefault(
+            subscription.id,
+            (
+                upstream_params
+                if upstream_params is not None
+                else subscription.subscription_params
+            ),
+        )
 
     def remove_subscription(self, subscription: EthSubscription[Any]) -> None:
         self.subscriptions.remove(subscription)
-        self.subscriptions_by_id.pop(subscription.id)
         self.subscriptions_by_label.pop(subscription.label)
 
+        subscribers = self.subscribers_by_id[subscription.id]
+        subscribers.remove(subscription)
+        if subscribers:
+            self.subscriptions_by_id[subscription.id] = subscribers[0]
+        else:
+            self.subscriptions_by_id.pop(subscription.id)
+            self.subscribers_by_id.pop(subscription.id)
+            self.upstream_params_by_id.pop(subscription.id)
+
+    def update_subscription_id(self, old_id: HexStr, new_id: HexStr) -> None:
+        subscribers = self.subscribers_by_id.pop(old_id, None)
+        if subscribers is not None:
+            for subscription in subscribers:
+                subscription._id = new_id
+            self.subscribers_by_id[new_id] = subscribers
+            self.subscriptions_by_id[new_id] = self.subscriptions_by_id.pop(old_id)
+            self.upstream_params_by_id[new_id] = self.upstream_params_by_id.pop(old_id)
+
+    def get_subscribers_by_id(self, sub_id: HexStr) -> list[EthSubscription[Any]]:
+        return self.subscribers_by_id.get(sub_id, [])
+
     def get_by_id(self, sub_id: HexStr) -> EthSubscription[Any]:
         return self.subscriptions_by_id.get(sub_id)
 
@@ -47,7 +85,7 @@ class SubscriptionContainer:
     def get_handler_subscription_by_id(
         self, sub_id: HexStr
     ) -> EthSubscription[Any] | None:
-        sub = self.get_by_id(sub_id)
-        if sub and sub._handler:
-            return sub
+        for sub in self.get_subscribers_by_id(sub_id):
+            if sub._handler:
+                return sub
         return None
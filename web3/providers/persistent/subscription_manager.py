@@ -1,8 +1,14 @@
 import asyncio
+from collections import (
+    deque,
+)
+import inspect
 import logging
 from typing import (
     TYPE_CHECKING,
     Any,
+    Collection,
+    Hashable,
     Sequence,
     cast,
     overload,
@@ -12,10 +18,23 @@ from eth_typing import (
     HexStr,
 )
 
+from web3._utils.caching import (
+    generate_cache_key,
+)
+from web3._utils.subscription_filters import (
+    is_mergeable_logs_filter,
+    log_matches_filter,
+    logs_filter_covers,
+    merge_logs_filters,
+)
+from web3._utils.validation import (
+    raise_error_for_batch_response,
+)
 from web3.exceptions import (
     SubscriptionHandlerTaskException,
     SubscriptionProcessingFinished,
     TaskNotRunning,
+    Web3RPCError,
     Web3TypeError,
     Web3ValueError,
 )
@@ -23,16 +42,21 @@ from web3.providers.persistent.subscription_container import (
     SubscriptionContainer,
 )
 from web3.types import (
+    FilterParams,
     FormattedEthSubscriptionResponse,
+    RPCEndpoint,
     RPCResponse,
 )
 from web3.utils.subscriptions import (
     EthSubscription,
     EthSubscriptionContext,
+    HandlerBackpressurePolicy,
+    HandlerOrderingKey,
 )
 
 if TYPE_CHECKING:
     from web3 import AsyncWeb3  # noqa: F401
+    from web3.method import Method  # noqa: F401
     from web3.providers.persistent import (  # noqa: F401
         PersistentConnectionProvider,
         RequestProcessor,
@@ -60,6 +84,16 @@ class SubscriptionManager:
         self.task_timeout = 1
         self._tasks: set[asyncio.Task[None]] = set()
 
+        # bound the number of parallelized handler calls in flight at any time
+        self.max_parallel_handlers = 1000
+        self.handler_backpressure = HandlerBackpressurePolicy.BLOCK
+        # parallelized handler calls that share an ordering key run sequentially
+        self.handler_ordering_key: HandlerOrderingKey | None = None
+        self._handler_slots = asyncio.Semaphore(self.max_parallel_handlers)
+        self._ordered_handler_calls: dict[
+            Hashable, deque[EthSubscriptionContext[Any, Any]]
+        ] = {}
+
         # share the subscription container with the request processor so it can separate
         # subscriptions into different queues based on ``sub._handler`` presence
         self._provider._request_processor._subscription_container = (
@@ -67,24 +101,45 @@ class SubscriptionManager:
         )
 
         self.total_handler_calls: int = 0
+        self.dropped_handler_calls: int = 0
+
+        # max number of requests per eth_subscribe / eth_unsubscribe batch when
+        # subscribing to or unsubscribing from many subscriptions at once
+        self.batch_size = 100
 
-    def _add_subscription(self, subscription: EthSubscription[Any]) -> None:
-        self._subscription_container.add_subscription(subscription)
+        # serve subscriptions with identical or overlapping params from one upstream
+        # subscription, fanning each message out to every matching subscription
+        self.share_subscriptions = False
+
+    def _add_subscription(
+        self,
+        subscription: EthSubscription[Any],
+        upstream_params: Sequence[Any] | None = None,
+    ) -> None:
+        self._subscription_container.add_subscription(subscription, upstream_params)
 
     def _remove_subscription(self, subscription: EthSubscription[Any]) -> None:
         self._subscription_container.remove_subscription(subscription)
 
-    def _validate_and_normalize_label(self, subscription: EthSubscription[Any]) -> None:
+    def _validate_and_normalize_label(
+        self,
+        subscription: EthSubscription[Any],
+        reserved_labels: Collection[str] = (),
+    ) -> None:
         if subscription.label == subscription._default_label:
             # if no custom label was provided, generate a unique label
             i = 2
-            while self.get_by_label(subscription._label) is not None:
+            while (
+                self.get_by_label(subscription._label) is not None
+                or subscription._label in reserved_labels
+            ):
                 subscription._label = f"{subscription._default_label}#{i}"
                 i += 1
         else:
             if (
                 subscription._label
                 in self._subscription_container.subscriptions_by_label
+                or subscription._label in reserved_labels
             ):
                 raise Web3ValueError(
                     "Subscription label already exists. Subscriptions must have unique "
@@ -107,8 +162,71 @@ class SubscriptionManager:
                     SubscriptionHandlerTaskException(task, message=str(e))
                 )
 
+    async def _dispatch_parallel_handler_call(
+        self, sub_context: EthSubscriptionContext[Any, Any]
+    ) -> None:
+        """
+        Run the handler call in a task, holding one of ``max_parallel_handlers``
+        slots until it completes. Calls that share an ordering key are queued behind
+        the task already running for that key rather than getting their own task.
+        """
+        key = (
+            self.handler_ordering_key(sub_context)
+            if self.handler_ordering_key is not None
+            else None
+        )
+        if (
+            self._handler_slots.locked()
+            and self.handler_backpressure == HandlerBackpressurePolicy.DROP
+        ):
+            self.dropped_handler_calls += 1
+            self.logger.debug(
+                "Handler call limit reached, dropping notification.\n"
+                "    label: %s\n    dropped handler calls: %s",
+                sub_context.subscription.label,
+                self.dropped_handler_calls,
+            )
+            return
+
+        await self._handler_slots.acquire()
+
+        if key is not None:
+            if key in self._ordered_handler_calls:
+                self._ordered_handler_calls[key].append(sub_context)
+                return
+            self._ordered_handler_calls[key] = deque()
+
+        task = asyncio.create_task(self._run_handler_calls(sub_context, key))
+        self._tasks.add(task)
+        task.add_done_callback(self._handler_task_callback)
+
+    async def _run_handler_calls(
+        self, sub_context: EthSubscriptionContext[Any, Any], key: Hashable | None
+    ) -> None:
+        pending = self._ordered_handler_calls[key] if key is not None else None
+        try:
+            await self._run_handler_call(sub_context)
+            while pending:
+                await self._run_handler_call(pending.popleft())
+        finally:
+            if pending is not None:
+                self._ordered_handler_calls.pop(key, None)
+                # calls that will no longer run give back the slots they hold
+                for _ in range(len(pending)):
+                    self._handler_slots.release()
+                pending.clear()
+
+    async def _run_handler_call(
+        self, sub_context: EthSubscriptionContext[Any, Any]
+    ) -> None:
+        try:
+            await sub_context.subscription._handler(sub_context)
+        finally:
+            self._handler_slots.release()
+
     async def _cleanup_remaining_tasks(self) -> None:
         """Cancel and clean up all remaining tasks."""
+        self._ordered_handler_calls.clear()
         if not self._tasks:
             return
 
@@ -119,6 +237,251 @@ class SubscriptionManager:
 
         self._tasks.clear()
 
+    # -- shared subscriptions -- #
+
+    @staticmethod
+    def _get_logs_filter(subscription: EthSubscription[Any]) -> FilterParams | None:
+        """The logs filter of ``subscription``, if it can be merged and matched."""
+        return SubscriptionManager._get_logs_filter_from_params(
+            subscription.subscription_params
+        )
+
+    @staticmethod
+    def _get_logs_filter_from_params(params: Sequence[Any]) -> FilterParams | None:
+        """
+        The logs filter of ``logs`` subscription params, with or without a filter,
+        if it can be merged and matched.
+        """
+        if params[0] != "logs":
+            return None
+        logs_filter = cast(
+            FilterParams, params[1] if len(params) > 1 and params[1] else {}
+        )
+        return logs_filter if is_mergeable_logs_filter(logs_filter) else None
+
+    def _find_shared_subscription_id(
+        self, subscription: EthSubscription[Any]
+    ) -> HexStr | None:
+        """
+        The id of an active upstream subscription whose messages include all those
+        for ``subscription``, if there is one.
+        """
+        params = subscription.subscription_params
+        logs_filter = self._get_logs_filter(subscription)
+        for (
+            sub_id,
+            upstream_params,
+        ) in self._subscription_container.upstream_params_by_id.items():
+            if upstream_params == params:
+                return sub_id
+            if logs_filter is not None and (
+                (upstream_filter := self._get_logs_filter_from_params(upstream_params))
+                is not None
+                and logs_filter_covers(upstream_filter, logs_filter)
+            ):
+                return sub_id
+        return None
+
+    def _group_subscriptions(
+        self, subscriptions: Sequence[EthSubscription[Any]]
+    ) -> list[tuple[Sequence[Any], list[EthSubscription[Any]]]]:
+        """
+        Group subscriptions that can share one upstream subscription, returning the
+        params to subscribe with for each group. Subscriptions with identical params
+        are grouped, as are logs subscriptions with the same ``topics``, whose
+        addresses are merged into one filter.
+        """
+        groups: dict[str, list[EthSubscription[Any]]] = {}
+        for sub in subscriptions:
+            logs_filter = self._get_logs_filter(sub)
+            key = (
+                generate_cache_key(("logs", logs_filter.get("topics") or []))
+                if logs_filter is not None
+                else generate_cache_key(sub.subscription_params)
+            )
+            groups.setdefault(key, []).append(sub)
+
+        return [
+            (
+                ("logs", merge_logs_filters([self._get_logs_filter(s) for s in subs]))
+                if len(subs) > 1 and self._get_logs_filter(subs[0]) is not None
+                else subs[0].subscription_params,
+                subs,
+            )
+            for subs in groups.values()
+        ]
+
+    def _get_subscribers_for_message(
+        self, response: RPCResponse
+    ) -> list[EthSubscription[Any]]:
+        """
+        The subscriptions a subscription message should be delivered to. Messages for
+        a merged logs subscription are only delivered to the subscriptions whose
+        filter matches the log.
+        """
+        params: dict[str, Any] = cast(dict[str, Any], response.get("params", {}))
+        sub_id = params.get("subscription")
+        upstream_params = self._subscription_container.upstream_params_by_id.get(sub_id)
+        return [
+            sub
+            for sub in self._subscription_container.get_subscribers_by_id(sub_id)
+            if sub.subscription_params == upstream_params
+            or (logs_filter := self._get_logs_filter(sub)) is None
+            or log_matches_filter(params["result"], logs_filter)
+        ]
+
+    async def _make_batch_request(
+        self, method_name: str, params_list: Sequence[Sequence[Any]]
+    ) -> list[Any]:
+        """
+        Make one request per item in ``params_list`` using the ``AsyncEth`` method
+        ``method_name``, sent together as a single JSON-RPC batch. Returns the
+        formatted result, or the ``Web3RPCError`` raised for the response, for each
+        request in order.
+        """
+        eth = self._w3.eth
+        method = cast("Method[Any]", inspect.getattr_static(type(eth), method_name))
+        request_manager = self._w3.manager
+
+        requests_info = [method.process_params(eth, *params) for params in params_list]
+        requests = await request_manager._async_send_batch(
+            cast(
+                list[tuple[RPCEndpoint, Any]],
+                [request for request, _response_formatters in requests_info],
+            )
+        )
+        for request, (_request, response_formatters) in zip(requests, requests_info):
+            self._provider._request_processor.cache_request_information(
+                request["id"],
+                request["method"],
+                request["params"],
+                response_formatters=response_formatters,
+            )
+
+        responses = await request_manager._async_recv_batch(requests)
+        if not isinstance(responses, list):
+            # expect a single response with an error
+            raise_error_for_batch_response(responses, self.logger)
+
+        results: list[Any] = []
+        for response in responses:
+            try:
+                results.append(await request_manager._process_response(response))
+            except Web3RPCError as e:
+                results.append(e)
+        return results
+
+    async def _subscribe_batch(
+        self, groups: Sequence[tuple[Sequence[Any], list[EthSubscription[Any]]]]
+    ) -> None:
+        """
+        Make one upstream subscription per group of subscriptions, in batches of
+        ``batch_size`` requests. If any request fails, the other subscriptions remain
+        subscribed and the first error is raised once all batches have been sent.
+        """
+        errors: list[Web3RPCError] = []
+        for i in range(0, len(groups), self.batch_size):
+            batch = groups[i : i + self.batch_size]
+            results = await self._make_batch_request(
+                "_subscribe", [params for params, _subs in batch]
+            )
+            for (params, subs), result in zip(batch, results):
+                for sub in subs:
+                    if isinstance(result, Web3RPCError):
+                        self.logger.error(
+                            "Failed to subscribe to subscription:\n"
+                            "    label: %s\n    error: %s",
+                            sub.label,
+                            result,
+                        )
+                        continue
+
+                    sub._id = result
+                    self._add_subscription(sub, params)
+                    self.logger.info(
+                        "Successfully subscribed to subscription:\n"
+                        "    label: %s\n    id: %s",
+                        sub.label,
+                        result,
+                    )
+                if isinstance(result, Web3RPCError):
+                    errors.append(result)
+
+        if errors:
+            raise errors[0]
+
+    async def _unsubscribe_batch(
+        self, subscriptions: Sequence[EthSubscription[Any]]
+    ) -> bool:
+        """
+        Unsubscribe from ``subscriptions`` in batches of ``batch_size`` requests. An
+        upstream subscription that other subscriptions still share is kept, and
+        only the local subscriptions are removed. If any request errors, the first
+        error is raised once all batches have been sent.
+        """
+        removing = set(subscriptions)
+        by_upstream_id: dict[HexStr, list[EthSubscription[Any]]] = {}
+        local_only: list[EthSubscription[Any]] = []
+        for sub in subscriptions:
+            if all(
+                subscriber in removing
+                for subscriber in self._subscription_container.get_subscribers_by_id(
+                    sub.id
+                )
+            ):
+                by_upstream_id.setdefault(sub.id, []).append(sub)
+            else:
+                local_only.append(sub)
+
+        unsubscribed: list[bool] = []
+        for sub in local_only:
+            self._remove_subscription(sub)
+            unsubscribed.append(True)
+            self.logger.info(
+                "Successfully unsubscribed from subscription:\n"
+                "    label: %s\n    id: %s",
+                sub.label,
+                sub.id,
+            )
+
+        upstream_ids = list(by_upstream_id)
+        errors: list[Web3RPCError] = []
+        for i in range(0, len(upstream_ids), self.batch_size):
+            batch = upstream_ids[i : i + self.batch_size]
+            results = await self._make_batch_request(
+                "_unsubscribe", [(sub_id,) for sub_id in batch]
+            )
+            for sub_id, result in zip(batch, results):
+                for sub in by_upstream_id[sub_id]:
+                    if isinstance(result, Web3RPCError):
+                        unsubscribed.append(False)
+                    elif result:
+                        self._remove_subscription(sub)
+                        unsubscribed.append(True)
+                        self.logger.info(
+                            "Successfully unsubscribed from subscription:\n"
+                            "    label: %s\n    id: %s",
+                            sub.label,
+                            sub.id,
+                        )
+                    else:
+                        unsubscribed.append(False)
+                        self.logger.warning(
+                            "Failed to unsubscribe from subscription\n"
+                            "    subscription=%s",
+                            sub,
+                        )
+                if isinstance(result, Web3RPCError):
+                    errors.append(result)
+
+        if any(unsubscribed) and not self._subscription_container.handler_subscriptions:
+            queue = self._provider._request_processor._handler_subscription_queue
+            await queue.put(SubscriptionProcessingFinished())
+
+        if errors:
+            raise errors[0]
+        return all(unsubscribed)
+
     @property
     def subscriptions(self) -> list[EthSubscription[Any]]:
         return self._subscription_container.subscriptions
@@ -153,7 +516,15 @@ class SubscriptionManager:
         if isinstance(subscriptions, EthSubscription):
             subscriptions.manager = self
             self._validate_and_normalize_label(subscriptions)
-            sub_id = await self._w3.eth._subscribe(*subscriptions.subscription_params)
+            sub_id = (
+                self._find_shared_subscription_id(subscriptions)
+                if self.share_subscriptions
+                else None
+            )
+            if sub_id is None:
+                sub_id = await self._w3.eth._subscribe(
+                    *subscriptions.subscription_params
+                )
             subscriptions._id = sub_id
             self._add_subscription(subscriptions)
             self.logger.info(
@@ -166,10 +537,55 @@ class SubscriptionManager:
             if len(subscriptions) == 0:
                 raise Web3ValueError("No subscriptions provided.")
 
-            sub_ids: list[HexStr] = []
+            # validate in order and subscribe to every subscription up to the first
+            # invalid one in batches, rather than one request at a time
+            valid_subs: list[EthSubscription[Any]] = []
+            labels: set[str] = set()
+            validation_error: Exception | None = None
             for sub in subscriptions:
-                sub_ids.append(await self.subscribe(sub))
-            return sub_ids
+                if not isinstance(sub, EthSubscription):
+                    validation_error = Web3TypeError(
+                        "Expected a Subscription or a sequence of Subscriptions."
+                    )
+                    break
+                sub.manager = self
+                try:
+                    self._validate_and_normalize_label(sub, labels)
+                except Web3ValueError as e:
+                    validation_error = e
+                    break
+                valid_subs.append(sub)
+                labels.add(sub.label)
+
+            new_subs: list[EthSubscription[Any]] = []
+            for sub in valid_subs:
+                shared_sub_id = (
+                    self._find_shared_subscription_id(sub)
+                    if self.share_subscriptions
+                    else None
+                )
+                if shared_sub_id is None:
+                    new_subs.append(sub)
+                    continue
+
+                sub._id = shared_sub_id
+                self._add_subscription(sub)
+                self.logger.info(
+                    "Successfully subscribed to subscription:\n"
+                    "    label: %s\n    id: %s",
+                    sub.label,
+                    shared_sub_id,
+                )
+
+            if new_subs:
+                await self._subscribe_batch(
+                    self._group_subscriptions(new_subs)
+                    if self.share_subscriptions
+                    else [(sub.subscription_params, [sub]) for sub in new_subs]
+                )
+            if validation_error is not None:
+                raise validation_error
+            return [sub.id for sub in valid_subs]
         raise Web3TypeError("Expected a Subscription or a sequence of Subscriptions.")
 
     @overload
@@ -212,6 +628,12 @@ class SubscriptionManager:
                         "Subscription not found or is not being managed by the "
                         f"subscription manager.\n    id: {subscription_id}"
                     )
+                subscribers = self._subscription_container.get_subscribers_by_id(
+                    subscription_id
+                )
+                if len(subscribers) > 1:
+                    # unsubscribe every subscription sharing the subscription id
+                    return await self.unsubscribe(list(subscribers))
 
             if subscriptions not in self.subscriptions:
                 raise Web3ValueError(
@@ -220,7 +642,13 @@ class SubscriptionManager:
                     f"label: {subscriptions.label}\n    id: {subscriptions._id}"
                 )
 
-            if await self._w3.eth._unsubscribe(subscriptions.id):
+            subscribers = self._subscription_container.get_subscribers_by_id(
+                subscriptions.id
+            )
+            # other subscriptions may still share the upstream subscription
+            if len(subscribers) > 1 or await self._w3.eth._unsubscribe(
+                subscriptions.id
+            ):
                 self._remove_subscription(subscriptions)
                 self.logger.info(
                     "Successfully unsubscribed from subscription:\n"
@@ -240,15 +668,32 @@ class SubscriptionManager:
             if len(subscriptions) == 0:
                 raise Web3ValueError("No subscriptions provided.")
 
-            unsubscribed: list[bool] = []
             # re-create the subscription list to prevent modifying the original list
             # in case ``subscription_manager.subscriptions`` was passed in directly
-            subs = list(subscriptions)
-            for sub in subs:
+            # an ordered set, since subscriptions may be given more than once by id
+            subs: dict[EthSubscription[Any], None] = {}
+            managed_subs = set(self.subscriptions)
+            for sub in list(subscriptions):
                 if isinstance(sub, str):
-                    sub = HexStr(sub)
-                unsubscribed.append(await self.unsubscribe(sub))
-            return all(unsubscribed)
+                    sub_id = HexStr(sub)
+                    subscribers = self._subscription_container.get_subscribers_by_id(
+                        sub_id
+                    )
+                    if not subscribers:
+                        raise Web3ValueError(
+                            "Subscription not found or is not being managed by the "
+                            f"subscription manager.\n    id: {sub_id}"
+                        )
+                    subs.update(dict.fromkeys(subscribers))
+                    continue
+                if sub not in managed_subs:
+                    raise Web3ValueError(
+                        "Subscription not found or is not being managed by the "
+                        "subscription manager.\n    "
+                        f"label: {sub.label}\n    id: {sub._id}"
+                    )
+                subs[sub] = None
+            return await self._unsubscribe_batch(list(subs))
 
         self.logger.warning(
             "Failed to unsubscribe from subscription\n    subscription=%s",
@@ -264,12 +709,10 @@ class SubscriptionManager:
         :return: ``True`` if unsubscribing was successful, ``False`` otherwise.
         :rtype: bool
         """
-        unsubscribed = [
-            await self.unsubscribe(sub)
-            # use copy to prevent modifying the list while iterating over it
-            for sub in self.subscriptions.copy()
-        ]
-        if all(unsubscribed):
+        unsubscribed = (
+            await self.unsubscribe(self.subscriptions) if self.subscriptions else True
+        )
+        if unsubscribed:
             self.logger.info("Successfully unsubscribed from all subscriptions.")
             return True
         else:
@@ -297,35 +740,46 @@ class SubscriptionManager:
             )
             return
 
+        if self.max_parallel_handlers < 1:
+            raise Web3ValueError("``max_parallel_handlers`` must be at least 1.")
+        self._handler_slots = asyncio.Semaphore(self.max_parallel_handlers)
+
         queue = self._provider._request_processor._handler_subscription_queue
         while run_forever or self._subscription_container.handler_subscriptions:
             try:
                 response = cast(RPCResponse, await queue.get())
-                formatted_sub_response = cast(
-                    FormattedEthSubscriptionResponse,
-                    await self._w3.manager._process_response(response),
-                )
 
-                # if the subscription was unsubscribed from, the response won't be
-                # formatted because we lost the request information
-                sub_id = formatted_sub_response.get("subscription")
-                sub = self._subscription_container.get_handler_subscription_by_id(
-                    sub_id
-                )
-                if sub:
+                # responses for subscriptions that were unsubscribed from have no
+                # subscribers and are skipped
+                formatted_result = None
+                for sub in self._get_subscribers_for_message(response):
+                    if sub._handler is None:
+                        continue
+
+                    if sub.raw:
+                        # skip middleware and result formatting
+                        result: Any = response["params"]["result"]
+                    else:
+                        if formatted_result is None:
+                            # format once for all subscribers
+                            formatted_sub_response = cast(
+                                FormattedEthSubscriptionResponse,
+                                await self._w3.manager._process_response(response),
+                            )
+                            formatted_result = formatted_sub_response["result"]
+                        result = formatted_result
+
                     sub_context = EthSubscriptionContext(
                         self._w3,
                         sub,
-                        formatted_sub_response["result"],
+                        result,
                         **sub._handler_context,
                     )
                     if sub.parallelize is True or (
                         sub.parallelize is None and self.parallelize
                     ):
                         # run the handler in a task to allow parallel processing
-                        task = asyncio.create_task(sub._handler(sub_context))
-                        self._tasks.add(task)
-                        task.add_done_callback(self._handler_task_callback)
+                        await self._dispatch_parallel_handler_call(sub_context)
                     else:
                         # await the handler in the main loop to ensure order
                         await sub._handler(sub_context)
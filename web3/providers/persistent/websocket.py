@@ -9,6 +9,9 @@ from typing import (
 from eth_typing import (
     URI,
 )
+from pydantic import (
+    BaseModel,
+)
 from toolz import (
     merge,
 )
@@ -20,10 +23,17 @@ from websockets.exceptions import (
     ConnectionClosedOK,
     WebSocketException,
 )
+from websockets.extensions.permessage_deflate import (
+    ClientPerMessageDeflateFactory,
+)
 from websockets.protocol import (
     State,
 )
 
+from web3._utils.empty import (
+    Empty,
+    empty,
+)
 from web3.exceptions import (
     PersistentConnectionClosedOK,
     ProviderConnectionError,
@@ -41,6 +51,7 @@ DEFAULT_PING_TIMEOUT = 300  # 5 minutes
 
 VALID_WEBSOCKET_URI_PREFIXES = {"ws://", "wss://"}
 RESTRICTED_WEBSOCKET_KWARGS = {"uri", "loop"}
+COMPRESSION_WEBSOCKET_KWARGS = {"compression", "extensions"}
 DEFAULT_WEBSOCKET_KWARGS = {
     # set how long to wait between pings from the server
     "ping_interval": DEFAULT_PING_INTERVAL,
@@ -53,6 +64,48 @@ def get_default_endpoint() -> URI:
     return URI(os.environ.get("WEB3_WS_PROVIDER_URI", "ws://127.0.0.1:8546"))
 
 
+class WebSocketCompressionConfiguration(BaseModel):
+    """
+    Settings for the permessage-deflate extension (RFC 7692) negotiated with the
+    server when opening the websocket connection.
+    """
+
+    server_no_context_takeover: bool
+    client_no_context_takeover: bool
+    server_max_window_bits: int | None
+    client_max_window_bits: int | bool | None
+    compress_settings: dict[str, Any] | None
+
+    def __init__(
+        self,
+        server_no_context_takeover: bool = False,
+        client_no_context_takeover: bool = False,
+        server_max_window_bits: int | None = None,
+        client_max_window_bits: int | bool | None = True,
+        compress_settings: dict[str, Any] | None = None,
+    ):
+        super().__init__(
+            server_no_context_takeover=server_no_context_takeover,
+            client_no_context_takeover=client_no_context_takeover,
+            server_max_window_bits=server_max_window_bits,
+            client_max_window_bits=client_max_window_bits,
+            compress_settings=compress_settings,
+        )
+
+
+def get_compression_websocket_kwargs(
+    compression_configuration: WebSocketCompressionConfiguration | None,
+) -> dict[str, Any]:
+    if compression_configuration is None:
+        return {"compression": None}
+
+    return {
+        "extensions": [
+            ClientPerMessageDeflateFactory(**compression_configuration.model_dump())
+        ]
+    }
+
+
 class WebSocketProvider(PersistentConnectionProvider):
     logger = logging.getLogger("web3.providers.WebSocketProvider")
     is_async: bool = True
@@ -63,6 +116,8 @@ class WebSocketProvider(PersistentConnectionProvider):
         websocket_kwargs: dict[str, Any] | None = None,
         # uses binary frames by default
         use_text_frames: bool | None = False,
+        compression_configuration: None
+        | (WebSocketCompressionConfiguration | Empty) = empty,
         # `PersistentConnectionProvider` kwargs can be passed through
         **kwargs: Any,
     ) -> None:
@@ -95,6 +150,24 @@ class WebSocketProvider(PersistentConnectionProvider):
 
         self.websocket_kwargs = merge(DEFAULT_WEBSOCKET_KWARGS, websocket_kwargs or {})
 
+        # if not configured, leave the ``websockets`` library defaults untouched,
+        # which negotiate permessage-deflate with default settings
+        self.compression_configuration = compression_configuration
+        if not isinstance(compression_configuration, Empty):
+            found_compression_keys = set(self.websocket_kwargs).intersection(
+                COMPRESSION_WEBSOCKET_KWARGS
+            )
+            if found_compression_keys:
+                raise Web3ValidationError(
+                    "Found compression keys in websocket_kwargs while also setting "
+                    f"compression_configuration: {found_compression_keys}. Use "
+                    "only one of the two to configure compression."
+                )
+            self.websocket_kwargs = merge(
+                self.websocket_kwargs,
+                get_compression_websocket_kwargs(compression_configuration),
+            )
+
     def __str__(self) -> str:
         return f"WebSocket connection: {self.endpoint_uri}"
 
@@ -17,6 +17,9 @@ from eth_utils import (
     combomethod,
     to_dict,
 )
+from eth_utils.toolz import (
+    merge,
+)
 
 from web3._utils.empty import (
     Empty,
@@ -43,8 +46,11 @@ from ..async_base import (
     AsyncJSONBaseProvider,
 )
 from .utils import (
+    CompressionConfiguration,
     ExceptionRetryConfiguration,
     check_if_retry_on_failure,
+    compress_request_data,
+    get_compression_headers,
 )
 
 
@@ -59,6 +65,7 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
         request_kwargs: Any | None = None,
         exception_retry_configuration: None
         | (ExceptionRetryConfiguration | Empty) = empty,
+        compression_configuration: None | (CompressionConfiguration | Empty) = empty,
         **kwargs: Any,
     ) -> None:
         self._request_session_manager = HTTPSessionManager()
@@ -72,6 +79,7 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
 
         self._request_kwargs = request_kwargs or {}
         self._exception_retry_configuration = exception_retry_configuration
+        self._compression_configuration = compression_configuration
 
         super().__init__(**kwargs)
 
@@ -97,11 +105,43 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
     ) -> None:
         self._exception_retry_configuration = value
 
+    @property
+    def compression_configuration(self) -> CompressionConfiguration | None:
+        if isinstance(self._compression_configuration, Empty):
+            self._compression_configuration = CompressionConfiguration()
+        return self._compression_configuration
+
+    @compression_configuration.setter
+    def compression_configuration(
+        self, value: CompressionConfiguration | Empty | None
+    ) -> None:
+        self._compression_configuration = value
+
     @to_dict
     def get_request_kwargs(self) -> Iterable[tuple[str, Any]]:
-        if "headers" not in self._request_kwargs:
-            yield "headers", self.get_request_headers()
-        yield from self._request_kwargs.items()
+        # user-provided headers take precedence over the compression headers
+        headers = self._request_kwargs.get("headers", self.get_request_headers())
+        yield "headers", merge(
+            get_compression_headers(self.compression_configuration), headers
+        )
+        yield from (
+            (key, value)
+            for key, value in self._request_kwargs.items()
+            if key != "headers"
+        )
+
+    def _get_post_request_data_and_kwargs(
+        self, request_data: bytes
+    ) -> tuple[bytes, dict[str, Any]]:
+        request_kwargs = self.get_request_kwargs()
+        request_data, encoding_headers = compress_request_data(
+            request_data, self.compression_configuration
+        )
+        if encoding_headers:
+            request_kwargs["headers"] = merge(
+                request_kwargs["headers"], encoding_headers
+            )
+        return request_data, request_kwargs
 
     @combomethod
     def get_request_headers(cls) -> dict[str, str]:
@@ -121,6 +161,9 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
         If exception_retry_configuration is set, retry on failure; otherwise, make
         the request without retrying.
         """
+        request_data, request_kwargs = self._get_post_request_data_and_kwargs(
+            request_data
+        )
         if (
             self.exception_retry_configuration is not None
             and check_if_retry_on_failure(
@@ -130,7 +173,7 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
             for i in range(self.exception_retry_configuration.retries):
                 try:
                     return await self._request_session_manager.async_make_post_request(
-                        self.endpoint_uri, request_data, **self.get_request_kwargs()
+                        self.endpoint_uri, request_data, **request_kwargs
                     )
                 except tuple(self.exception_retry_configuration.errors):
                     if i < self.exception_retry_configuration.retries - 1:
@@ -143,7 +186,7 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
             return None
         else:
             return await self._request_session_manager.async_make_post_request(
-                self.endpoint_uri, request_data, **self.get_request_kwargs()
+                self.endpoint_uri, request_data, **request_kwargs
             )
 
     @async_handle_request_caching
@@ -166,9 +209,11 @@ class AsyncHTTPProvider(AsyncJSONBaseProvider):
         self, batch_requests: list[tuple[RPCEndpoint, Any]]
     ) -> list[RPCResponse] | RPCResponse:
         self.logger.debug("Making batch request HTTP - uri: `%s`", self.endpoint_uri)
-        request_data = self.encode_batch_rpc_request(batch_requests)
+        request_data, request_kwargs = self._get_post_request_data_and_kwargs(
+            self.encode_batch_rpc_request(batch_requests)
+        )
         raw_response = await self._request_session_manager.async_make_post_request(
-            self.endpoint_uri, request_data, **self.get_request_kwargs()
+            self.endpoint_uri, request_data, **request_kwargs
         )
         self.logger.debug("Received batch response HTTP.")
         response = self.decode_rpc_response(raw_response)
@@ -14,6 +14,9 @@ from eth_utils import (
     combomethod,
     to_dict,
 )
+from eth_utils.toolz import (
+    merge,
+)
 import requests
 
 from web3._utils.empty import (
@@ -41,8 +44,11 @@ from ..base import (
     JSONBaseProvider,
 )
 from .utils import (
+    CompressionConfiguration,
     ExceptionRetryConfiguration,
     check_if_retry_on_failure,
+    compress_request_data,
+    get_compression_headers,
 )
 
 if TYPE_CHECKING:
@@ -63,6 +69,7 @@ class HTTPProvider(JSONBaseProvider):
         session: Any | None = None,
         exception_retry_configuration: None
         | (ExceptionRetryConfiguration | Empty) = empty,
+        compression_configuration: None | (CompressionConfiguration | Empty) = empty,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -77,6 +84,7 @@ class HTTPProvider(JSONBaseProvider):
 
         self._request_kwargs = request_kwargs or {}
         self._exception_retry_configuration = exception_retry_configuration
+        self._compression_configuration = compression_configuration
 
         if session:
             self._request_session_manager.cache_and_return_session(
@@ -104,11 +112,43 @@ class HTTPProvider(JSONBaseProvider):
     ) -> None:
         self._exception_retry_configuration = value
 
+    @property
+    def compression_configuration(self) -> CompressionConfiguration | None:
+        if isinstance(self._compression_configuration, Empty):
+            self._compression_configuration = CompressionConfiguration()
+        return self._compression_configuration
+
+    @compression_configuration.setter
+    def compression_configuration(
+        self, value: CompressionConfiguration | Empty | None
+    ) -> None:
+        self._compression_configuration = value
+
     @to_dict
     def get_request_kwargs(self) -> Iterable[tuple[str, Any]]:
-        if "headers" not in self._request_kwargs:
-            yield "headers", self.get_request_headers()
-        yield from self._request_kwargs.items()
+        # user-provided headers take precedence over the compression headers
+        headers = self._request_kwargs.get("headers", self.get_request_headers())
+        yield "headers", merge(
+            get_compression_headers(self.compression_configuration), headers
+        )
+        yield from (
+            (key, value)
+            for key, value in self._request_kwargs.items()
+            if key != "headers"
+        )
+
+    def _get_post_request_data_and_kwargs(
+        self, request_data: bytes
+    ) -> tuple[bytes, dict[str, Any]]:
+        request_kwargs = self.get_request_kwargs()
+        request_data, encoding_headers = compress_request_data(
+            request_data, self.compression_configuration
+        )
+        if encoding_headers:
+            request_kwargs["headers"] = merge(
+                request_kwargs["headers"], encoding_headers
+            )
+        return request_data, request_kwargs
 
     @combomethod
     def get_request_headers(cls) -> dict[str, str]:
@@ -129,6 +169,9 @@ class HTTPProvider(JSONBaseProvider):
         If exception_retry_configuration is set, retry on failure; otherwise, make
         the request without retrying.
         """
+        request_data, request_kwargs = self._get_post_request_data_and_kwargs(
+            request_data
+        )
         if (
             self.exception_retry_configuration is not None
             and check_if_retry_on_failure(
@@ -138,7 +181,7 @@ class HTTPProvider(JSONBaseProvider):
             for i in range(self.exception_retry_configuration.retries):
                 try:
                     return self._request_session_manager.make_post_request(
-                        self.endpoint_uri, request_data, **self.get_request_kwargs()
+                        self.endpoint_uri, request_data, **request_kwargs
                     )
                 except tuple(self.exception_retry_configuration.errors) as e:
                     if i < self.exception_retry_configuration.retries - 1:
@@ -151,7 +194,7 @@ class HTTPProvider(JSONBaseProvider):
             return None
         else:
             return self._request_session_manager.make_post_request(
-                self.endpoint_uri, request_data, **self.get_request_kwargs()
+                self.endpoint_uri, request_data, **request_kwargs
             )
 
     @handle_request_caching
@@ -174,9 +217,11 @@ class HTTPProvider(JSONBaseProvider):
         self, batch_requests: list[tuple[RPCEndpoint, Any]]
     ) -> list[RPCResponse] | RPCResponse:
         self.logger.debug("Making batch request HTTP, uri: `%s`", self.endpoint_uri)
-        request_data = self.encode_batch_rpc_request(batch_requests)
+        request_data, request_kwargs = self._get_post_request_data_and_kwargs(
+            self.encode_batch_rpc_request(batch_requests)
+        )
         raw_response = self._request_session_manager.make_post_request(
-            self.endpoint_uri, request_data, **self.get_request_kwargs()
+            self.endpoint_uri, request_data, **request_kwargs
         )
         self.logger.debug("Received batch response HTTP.")
         response = self.decode_rpc_response(raw_response)
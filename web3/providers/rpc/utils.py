@@ -1,11 +1,16 @@
+import gzip
 from typing import (
     Sequence,
 )
+import zlib
 
 from pydantic import (
     BaseModel,
 )
 
+from web3.exceptions import (
+    Web3ValidationError,
+)
 from web3.types import (
     RPCEndpoint,
 )
@@ -89,3 +94,79 @@ class ExceptionRetryConfiguration(BaseModel):
             backoff_factor=backoff_factor,
             method_allowlist=method_allowlist or REQUEST_RETRY_ALLOWLIST,
         )
+
+
+# Encodings the underlying HTTP clients can decode. ``br`` and ``zstd`` also require
+# the optional decoder packages for ``requests`` / ``aiohttp`` to be installed.
+SUPPORTED_RESPONSE_ENCODINGS = ("gzip", "deflate", "br", "zstd")
+SUPPORTED_REQUEST_ENCODINGS = ("gzip", "deflate")
+
+
+class CompressionConfiguration(BaseModel):
+    accept_encodings: Sequence[str]
+    request_encoding: str | None
+    request_min_size: int
+
+    def __init__(
+        self,
+        accept_encodings: Sequence[str] = ("gzip", "deflate"),
+        request_encoding: str | None = None,
+        request_min_size: int = 1024,
+    ):
+        unsupported = set(accept_encodings) - set(SUPPORTED_RESPONSE_ENCODINGS)
+        if unsupported:
+            raise Web3ValidationError(
+                f"Unsupported response encoding(s): {sorted(unsupported)}. "
+                f"Supported encodings: {SUPPORTED_RESPONSE_ENCODINGS}."
+            )
+        if (
+            request_encoding is not None
+            and request_encoding not in SUPPORTED_REQUEST_ENCODINGS
+        ):
+            raise Web3ValidationError(
+                f"Unsupported request encoding: {request_encoding}. "
+                f"Supported encodings: {SUPPORTED_REQUEST_ENCODINGS}."
+            )
+        super().__init__(
+            accept_encodings=accept_encodings,
+            request_encoding=request_encoding,
+            request_min_size=request_min_size,
+        )
+
+
+def get_compression_headers(
+    compression_configuration: CompressionConfiguration | None,
+) -> dict[str, str]:
+    """
+    Headers advertising which response encodings the provider accepts. Without a
+    configuration, compression is disabled and the server is asked for ``identity``.
+    """
+    if compression_configuration is None or not (
+        compression_configuration.accept_encodings
+    ):
+        return {"Accept-Encoding": "identity"}
+    return {"Accept-Encoding": ", ".join(compression_configuration.accept_encodings)}
+
+
+def compress_request_data(
+    request_data: bytes,
+    compression_configuration: CompressionConfiguration | None,
+) -> tuple[bytes, dict[str, str]]:
+    """
+    Compress the request body if configured to and if it is large enough to be worth
+    compressing. Returns the request body along with any headers that must be sent
+    with it.
+    """
+    if (
+        compression_configuration is None
+        or compression_configuration.request_encoding is None
+        or len(request_data) < compression_configuration.request_min_size
+    ):
+        return request_data, {}
+
+    encoding = compression_configuration.request_encoding
+    if encoding == "gzip":
+        compressed = gzip.compress(request_data)
+    else:
+        compressed = zlib.compress(request_data)
+    return compressed, {"Content-Encoding": encoding}
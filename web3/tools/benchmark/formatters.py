@@ -0,0 +1,440 @@
+"""
+Benchmark the result formatters for blocks, transactions, receipts and logs on
+synthetic results, without a node. Each compiled formatter is compared with the same
+schema applied through the generic ``type_aware_apply_formatters_to_dict`` path of
+curried ``eth_utils`` applicators, as the formatters were built before they were
+compiled.
+"""
+
+import argparse
+import logging
+import sys
+import timeit
+from typing import (
+    Any,
+    Callable,
+)
+
+from eth_utils.curried import (
+    apply_formatter_if,
+    apply_formatter_to_array,
+    apply_one_of_formatters,
+    is_address,
+    is_null,
+    is_string,
+    to_checksum_address,
+)
+from eth_utils.toolz import (
+    complement,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from web3._utils.checksum import (
+    _checksum_unprefixed_hex_address,
+)
+from web3._utils.formatters import (
+    hex_to_integer,
+    is_array_of_dicts,
+    is_array_of_strings,
+)
+from web3._utils.method_formatters import (
+    apply_list_to_array_formatter,
+    block_result_formatter,
+    build_result_schemas,
+    compile_dict_formatter,
+    log_entry_formatter,
+    receipt_formatter,
+    storage_key_to_hexstr,
+    to_hexbytes,
+    transaction_result_formatter,
+    type_aware_apply_formatters_to_dict,
+)
+from web3.utils.formatting import (
+    BytesRepresentation,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-transactions",
+    type=int,
+    default=500,
+    help="The number of full transactions in the formatted block",
+)
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=20,
+    help="The number of times each result is formatted",
+)
+parser.add_argument(
+    "--num-addresses",
+    type=int,
+    default=100,
+    help="The number of distinct sender, recipient and contract addresses",
+)
+
+
+def _hex(value: int, num_bytes: int) -> str:
+    return "0x" + format(value, "x").rjust(num_bytes * 2, "0")
+
+
+def build_log(index: int, num_addresses: int = 100) -> dict[str, Any]:
+    return {
+        "address": _hex(0xC0FFEE + index % num_addresses, 20),
+        "topics": [_hex(index, 32), _hex(index + 1, 32), _hex(index + 2, 32)],
+        "data": _hex(index, 64),
+        "blockNumber": "0x112a880",
+        "transactionHash": _hex(index, 32),
+        "transactionIndex": hex(index),
+        "blockHash": _hex(1, 32),
+        "logIndex": hex(index),
+        "removed": False,
+    }
+
+
+def build_transaction(index: int, num_addresses: int = 100) -> dict[str, Any]:
+    return {
+        "blockHash": _hex(1, 32),
+        "blockNumber": "0x112a880",
+        "from": _hex(0xA11CE + index % num_addresses, 20),
+        "gas": "0x5208",
+        "gasPrice": "0x3b9aca00",
+        "maxFeePerGas": "0x77359400",
+        "maxPriorityFeePerGas": "0x3b9aca00",
+        "hash": _hex(index, 32),
+        "input": _hex(index, 68),
+        "nonce": hex(index),
+        "to": _hex(0xB0B + index % num_addresses, 20),
+        "transactionIndex": hex(index),
+        "value": hex(10**18 + index),
+        "type": "0x2",
+        "accessList": [
+            {
+                "address": _hex(0xC0FFEE, 20),
+                "storageKeys": [_hex(index, 32), _hex(index + 1, 32)],
+            }
+        ],
+        "chainId": "0x1",
+        "v": "0x1",
+        "r": _hex(index + 2, 32),
+        "s": _hex(index + 3, 32),
+        "yParity": "0x1",
+    }
+
+
+def build_receipt(index: int, num_addresses: int = 100) -> dict[str, Any]:
+    return {
+        "blockHash": _hex(1, 32),
+        "blockNumber": "0x112a880",
+        "contractAddress": None,
+        "cumulativeGasUsed": hex(21000 * (index + 1)),
+        "effectiveGasPrice": "0x3b9aca00",
+        "from": _hex(0xA11CE + index % num_addresses, 20),
+        "gasUsed": "0x5208",
+        "logs": [build_log(index * 3 + i, num_addresses) for i in range(3)],
+        "logsBloom": _hex(0, 256),
+        "status": "0x1",
+        "to": _hex(0xB0B + index % num_addresses, 20),
+        "transactionHash": _hex(index, 32),
+        "transactionIndex": hex(index),
+        "type": "0x2",
+    }
+
+
+def build_block(num_transactions: int, num_addresses: int = 100) -> dict[str, Any]:
+    return {
+        "baseFeePerGas": "0x3b9aca00",
+        "difficulty": "0x0",
+        "extraData": "0x6265617665726275696c642e6f7267",
+        "gasLimit": "0x1c9c380",
+        "gasUsed": "0x1c9c380",
+        "hash": _hex(1, 32),
+        "logsBloom": _hex(0, 256),
+        "miner": _hex(0xFEE, 20),
+        "mixHash": _hex(2, 32),
+        "nonce": "0x0000000000000000",
+        "number": "0x112a880",
+        "parentHash": _hex(3, 32),
+        "receiptsRoot": _hex(4, 32),
+        "sha3Uncles": _hex(5, 32),
+        "size": "0x2a7c5",
+        "stateRoot": _hex(6, 32),
+        "timestamp": "0x6554a7b3",
+        "totalDifficulty": "0xc70d815d562d3cfa955",
+        "transactions": [
+            build_transaction(i, num_addresses) for i in range(num_transactions)
+        ],
+        "transactionsRoot": _hex(7, 32),
+        "uncles": [],
+        "withdrawals": [
+            {
+                "index": hex(i),
+                "validatorIndex": hex(i),
+                "address": _hex(0xD00D + i, 20),
+                "amount": "0x1",
+            }
+            for i in range(16)
+        ],
+        "withdrawalsRoot": _hex(8, 32),
+    }
+
+
+def build_generic_formatters() -> dict[str, Callable[[Any], Any]]:
+    """
+    The block, transaction, receipt and log result formatters built from curried
+    ``eth_utils`` applicators and applied with
+    ``type_aware_apply_formatters_to_dict``, as a baseline for the compiled ones.
+    """
+    is_not_null = complement(is_null)
+    to_integer_if_hex = apply_formatter_if(is_string, hex_to_integer)
+    hash32 = apply_formatter_if(is_not_null, to_hexbytes(32))
+    integer = apply_formatter_if(is_not_null, to_integer_if_hex)
+
+    access_list = type_aware_apply_formatters_to_dict(
+        {
+            "address": to_checksum_address,
+            "storageKeys": apply_list_to_array_formatter(storage_key_to_hexstr),
+        }
+    )
+    transaction = type_aware_apply_formatters_to_dict(
+        {
+            "blockHash": hash32,
+            "blockNumber": integer,
+            "transactionIndex": integer,
+            "nonce": to_integer_if_hex,
+            "gas": to_integer_if_hex,
+            "gasPrice": to_integer_if_hex,
+            "maxFeePerGas": to_integer_if_hex,
+            "maxPriorityFeePerGas": to_integer_if_hex,
+            "value": to_integer_if_hex,
+            "from": to_checksum_address,
+            "r": apply_formatter_if(is_not_null, to_hexbytes(32, variable_length=True)),
+            "s": apply_formatter_if(is_not_null, to_hexbytes(32, variable_length=True)),
+            "to": apply_formatter_if(is_address, to_checksum_address),
+            "hash": to_hexbytes(32),
+            "v": integer,
+            "yParity": integer,
+            "type": integer,
+            "chainId": integer,
+            "accessList": apply_formatter_if(
+                is_not_null, apply_formatter_to_array(access_list)
+            ),
+            "input": HexBytes,
+        }
+    )
+    withdrawal = type_aware_apply_formatters_to_dict(
+        {
+            "index": to_integer_if_hex,
+            "validatorIndex": to_integer_if_hex,
+            "address": to_checksum_address,
+            "amount": to_integer_if_hex,
+        }
+    )
+    log = type_aware_apply_formatters_to_dict(
+        {
+            "blockHash": hash32,
+            "blockNumber": integer,
+            "transactionIndex": integer,
+            "transactionHash": hash32,
+            "logIndex": to_integer_if_hex,
+            "address": to_checksum_address,
+            "topics": apply_list_to_array_formatter(to_hexbytes(32)),
+            "data": HexBytes,
+        }
+    )
+    receipt = type_aware_apply_formatters_to_dict(
+        {
+            "blockHash": hash32,
+            "blockNumber": integer,
+            "transactionIndex": integer,
+            "transactionHash": to_hexbytes(32),
+            "cumulativeGasUsed": to_integer_if_hex,
+            "status": to_integer_if_hex,
+            "gasUsed": to_integer_if_hex,
+            "contractAddress": apply_formatter_if(is_not_null, to_checksum_address),
+            "logs": apply_list_to_array_formatter(log),
+            "logsBloom": to_hexbytes(256, variable_length=True),
+            "from": apply_formatter_if(is_not_null, to_checksum_address),
+            "to": apply_formatter_if(is_address, to_checksum_address),
+            "effectiveGasPrice": to_integer_if_hex,
+            "type": to_integer_if_hex,
+        }
+    )
+    block = type_aware_apply_formatters_to_dict(
+        {
+            "baseFeePerGas": to_integer_if_hex,
+            "extraData": apply_formatter_if(
+                is_not_null, to_hexbytes(32, variable_length=True)
+            ),
+            "gasLimit": to_integer_if_hex,
+            "gasUsed": to_integer_if_hex,
+            "size": to_integer_if_hex,
+            "timestamp": to_integer_if_hex,
+            "hash": hash32,
+            "logsBloom": apply_formatter_if(
+                is_not_null, to_hexbytes(256, variable_length=True)
+            ),
+            "miner": apply_formatter_if(is_not_null, to_checksum_address),
+            "mixHash": hash32,
+            "nonce": apply_formatter_if(
+                is_not_null, to_hexbytes(8, variable_length=True)
+            ),
+            "number": integer,
+            "parentHash": hash32,
+            "sha3Uncles": hash32,
+            "uncles": apply_list_to_array_formatter(to_hexbytes(32)),
+            "difficulty": to_integer_if_hex,
+            "receiptsRoot": hash32,
+            "stateRoot": hash32,
+            "totalDifficulty": to_integer_if_hex,
+            "transactions": apply_one_of_formatters(
+                (
+                    (is_array_of_dicts, apply_list_to_array_formatter(transaction)),
+                    (
+                        is_array_of_strings,
+                        apply_list_to_array_formatter(to_hexbytes(32)),
+                    ),
+                )
+            ),
+            "transactionsRoot": hash32,
+            "withdrawals": apply_formatter_if(
+                is_not_null, apply_list_to_array_formatter(withdrawal)
+            ),
+            "withdrawalsRoot": hash32,
+        }
+    )
+    return {
+        "block": block,
+        "transaction": transaction,
+        "receipt": receipt,
+        "log": log,
+    }
+
+
+def benchmark(func: Callable[[], Any], num_calls: int) -> float:
+    """The fastest of five rounds, in milliseconds per call."""
+    return min(timeit.repeat(func, number=num_calls, repeat=5)) / num_calls * 1000
+
+
+def without_checksum_cache(func: Callable[[], Any]) -> Callable[[], Any]:
+    def _without_checksum_cache() -> Any:
+        _checksum_unprefixed_hex_address.cache_clear()
+        return func()
+
+    return _without_checksum_cache
+
+
+def main(
+    logger: logging.Logger, num_transactions: int, num_calls: int, num_addresses: int
+) -> None:
+    block = build_block(num_transactions, num_addresses)
+    transaction = build_transaction(0, num_addresses)
+    receipts = [build_receipt(i, num_addresses) for i in range(num_transactions)]
+    logs = [build_log(i, num_addresses) for i in range(num_transactions)]
+    bytes_log_formatter = compile_dict_formatter(
+        build_result_schemas(BytesRepresentation.BYTES).log_entry
+    )
+    hex_log_formatter = compile_dict_formatter(
+        build_result_schemas(BytesRepresentation.HEX).log_entry
+    )
+
+    generic = build_generic_formatters()
+
+    def compare(
+        compiled: Callable[[], Any], baseline: Callable[[], Any]
+    ) -> tuple[float, float | None]:
+        return benchmark(compiled, num_calls), benchmark(baseline, num_calls)
+
+    results: list[tuple[str, tuple[float, float | None]]] = [
+        (
+            f"block ({num_transactions} txs)",
+            compare(
+                lambda: block_result_formatter(block),
+                lambda: generic["block"](block),
+            ),
+        ),
+        (
+            "transaction",
+            compare(
+                lambda: transaction_result_formatter(transaction),
+                lambda: generic["transaction"](transaction),
+            ),
+        ),
+        (
+            f"receipts ({num_transactions})",
+            compare(
+                lambda: [receipt_formatter(r) for r in receipts],
+                lambda: [generic["receipt"](r) for r in receipts],
+            ),
+        ),
+        (
+            f"logs ({num_transactions})",
+            compare(
+                lambda: [log_entry_formatter(log) for log in logs],
+                lambda: [generic["log"](log) for log in logs],
+            ),
+        ),
+        (
+            f"logs ({num_transactions}), bytes",
+            (
+                benchmark(
+                    lambda: [bytes_log_formatter(log) for log in logs], num_calls
+                ),
+                None,
+            ),
+        ),
+        (
+            f"logs ({num_transactions}), hex",
+            (
+                benchmark(lambda: [hex_log_formatter(log) for log in logs], num_calls),
+                None,
+            ),
+        ),
+        (
+            f"block ({num_transactions} txs), cold",
+            compare(
+                without_checksum_cache(lambda: block_result_formatter(block)),
+                lambda: generic["block"](block),
+            ),
+        ),
+        (
+            f"logs ({num_transactions}), cold",
+            compare(
+                without_checksum_cache(
+                    lambda: [log_entry_formatter(log) for log in logs]
+                ),
+                lambda: [generic["log"](log) for log in logs],
+            ),
+        ),
+    ]
+
+    logger.info(
+        "|{:^32}|{:^14}|{:^14}|{:^10}|".format(
+            "Formatted result", "compiled ms", "generic ms", "speedup"
+        )
+    )
+    logger.info("-" * 75)
+    for name, (compiled_ms, generic_ms) in results:
+        if generic_ms is None:
+            logger.info(f"|{name:^32}|{compiled_ms:^14.4f}|{'-':^14}|{'-':^10}|")
+        else:
+            speedup = f"{generic_ms / compiled_ms:.1f}x"
+            logger.info(
+                f"|{name:^32}|{compiled_ms:^14.4f}|{generic_ms:^14.4f}|{speedup:^10}|"
+            )
+    logger.info("-" * 75)
+    logger.info("generic: the same schema through type_aware_apply_formatters_to_dict")
+    logger.info("bytes, hex: with w3.bytes_representation set to BYTES or HEX")
+    logger.info("cold: the checksum address cache is cleared before each call")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_transactions, args.num_calls, args.num_addresses)
@@ -0,0 +1,94 @@
+"""
+Benchmark the per-call overhead of ``Method.process_params`` without a node, with the
+module's cache of composed formatters and with the formatters composed on every
+call, as they were before they were cached.
+"""
+
+import argparse
+import logging
+import sys
+import timeit
+from typing import (
+    Any,
+    Callable,
+)
+
+from web3 import (
+    HTTPProvider,
+    Web3,
+)
+from web3.eth import (
+    Eth,
+)
+from web3.method import (
+    Method,
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-calls",
+    type=int,
+    default=10000,
+    help="The number of times the params of each method are processed",
+)
+
+ADDRESS = "0x" + "00" * 19 + "01"
+HASH = "0x" + "11" * 32
+
+
+def benchmark(func: Callable[[], Any], num_calls: int) -> float:
+    """The fastest of five rounds, in microseconds per call."""
+    return min(timeit.repeat(func, number=num_calls, repeat=5)) / num_calls * 10**6
+
+
+def main(logger: logging.Logger, num_calls: int) -> None:
+    # no request is made, the provider is never connected to
+    w3 = Web3(HTTPProvider("http://127.0.0.1:8545"))
+    eth = w3.eth
+    cache = eth._method_formatters_cache
+
+    # the ``Method`` descriptors themselves, rather than their bound callers
+    calls: list[tuple[str, Method[Any], tuple[Any, ...]]] = [
+        (rpc_method, vars(Eth)[attribute], args)
+        for rpc_method, attribute, args in (
+            ("eth_chainId", "_chain_id", ()),
+            ("eth_getBalance", "_get_balance", (ADDRESS, "latest")),
+            ("eth_getBlockByNumber", "_get_block", (123, False)),
+            ("eth_getTransactionReceipt", "_transaction_receipt", (HASH,)),
+            ("eth_getLogs", "_get_logs", ({"fromBlock": 1, "toBlock": 2},)),
+            ("eth_call", "_call", ({"to": ADDRESS, "data": "0x"}, "latest")),
+        )
+    ]
+
+    def process_params(method: Method[Any], args: tuple[Any, ...]) -> Any:
+        return method.process_params(eth, *args)
+
+    def without_cache(method: Method[Any], args: tuple[Any, ...]) -> Any:
+        cache.clear()
+        return method.process_params(eth, *args)
+
+    logger.info(
+        "|{:^28}|{:^14}|{:^14}|{:^10}|".format(
+            "Method", "cached us", "uncached us", "speedup"
+        )
+    )
+    logger.info("-" * 71)
+    for name, method, args in calls:
+        cached_us = benchmark(lambda: process_params(method, args), num_calls)
+        uncached_us = benchmark(lambda: without_cache(method, args), num_calls)
+        speedup = f"{uncached_us / cached_us:.1f}x"
+        logger.info(
+            f"|{name:^28}|{cached_us:^14.2f}|{uncached_us:^14.2f}|{speedup:^10}|"
+        )
+    logger.info("-" * 71)
+    logger.info("uncached: the formatter cache is cleared before each call")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+
+    main(logger, args.num_calls)
@@ -42,6 +42,13 @@ from .caching import (
 from .exception_handling import (
     handle_offchain_lookup,
 )
+from .formatting import (
+    BytesRepresentation,
+)
+from .numeric import (
+    fee_history_to_arrays,
+    hex_quantities_to_array,
+)
 from .subscriptions import (
     EthSubscription,
 )
@@ -75,4 +82,7 @@ __all__ = [
     "SimpleCache",
     "EthSubscription",
     "handle_offchain_lookup",
+    "BytesRepresentation",
+    "fee_history_to_arrays",
+    "hex_quantities_to_array",
 ]
@@ -0,0 +1,17 @@
+from enum import (
+    Enum,
+)
+
+
+class BytesRepresentation(str, Enum):
+    """
+    How the hashes, topics and other byte fields of blocks, transactions, receipts
+    and logs are returned, set per instance with ``w3.bytes_representation``.
+    """
+
+    # ``HexBytes``, the default
+    HEXBYTES = "hexbytes"
+    # plain ``bytes``
+    BYTES = "bytes"
+    # 0x-prefixed, lower case hex strings, as most nodes return them
+    HEX = "hex"
@@ -0,0 +1,146 @@
+import functools
+from types import (
+    ModuleType,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Mapping,
+    Sequence,
+)
+
+from web3.exceptions import (
+    Web3ValueError,
+)
+
+if TYPE_CHECKING:
+    import numpy  # noqa: F401
+    from numpy.typing import NDArray  # noqa: F401
+
+# hex digits in a ``numpy.uint64``
+_UINT64_HEX_DIGITS = 16
+# the fee history fields which are arrays of hex quantities and of floats
+_FEE_HISTORY_QUANTITY_ARRAYS = ("baseFeePerGas", "baseFeePerBlobGas")
+_FEE_HISTORY_RATIO_ARRAYS = ("gasUsedRatio", "blobGasUsedRatio")
+
+
+def _import_numpy() -> ModuleType:
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "Decoding hex quantities into arrays requires NumPy. Install it with "
+            '`pip install "web3[numpy]"`.'
+        ) from exc
+    return numpy
+
+
+@functools.lru_cache(maxsize=None)
+def _hex_digit_table() -> "NDArray[numpy.uint8]":
+    # maps each ascii character to its hex digit value, or 0xFF if it is not one
+    np = _import_numpy()
+    table = np.full(256, 0xFF, dtype=np.uint8)
+    for value, char in enumerate(b"0123456789abcdef"):
+        table[char] = value
+    for value, char in enumerate(b"ABCDEF", start=10):
+        table[char] = value
+    return table
+
+
+def hex_quantities_to_array(values: Sequence[str | int]) -> "NDArray[numpy.uint64]":
+    """
+    Decode hex quantities, such as ``["0x1", "0x3b9aca00"]``, into a ``numpy.uint64``
+    array with array operations over all the values, without a Python ``int`` per
+    value. Values that are already integers are copied into the array as is. Every
+    value must fit in 64 bits.
+    """
+    np = _import_numpy()
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.uint64)
+    elif not isinstance(values[0], str):
+        try:
+            return np.asarray(values, dtype=np.uint64)
+        except (OverflowError, TypeError, ValueError) as exc:
+            raise Web3ValueError(
+                f"Values must be non-negative integers of at most 64 bits: {exc}"
+            ) from exc
+
+    try:
+        ascii_strings = np.array(values, dtype="S")
+    except UnicodeEncodeError as exc:
+        raise Web3ValueError("Hex quantities must be ascii strings") from exc
+
+    # ``S`` arrays pad shorter strings with trailing null bytes
+    chars = ascii_strings.view(np.uint8).reshape(len(ascii_strings), -1)
+    if chars.shape[1] > 2:
+        is_prefixed = (
+            (chars[:, 0] == ord("0"))
+            & ((chars[:, 1] == ord("x")) | (chars[:, 1] == ord("X")))
+            & (chars[:, 2] != 0)
+        )
+    else:
+        is_prefixed = np.zeros(len(chars), dtype=bool)
+    if not is_prefixed.all():
+        raise Web3ValueError(
+            f"Invalid hex quantity: {values[int(np.argmin(is_prefixed))]!r}"
+        )
+
+    # the digits without the prefix and leading zeros, right aligned to 16 digits
+    unprefixed = np.ascontiguousarray(chars[:, 2:]).view(f"S{chars.shape[1] - 2}")
+    digits = np.strings.lstrip(unprefixed.ravel(), b"0")
+    is_too_large = np.strings.str_len(digits) > _UINT64_HEX_DIGITS
+    if is_too_large.any():
+        raise Web3ValueError(
+            "Hex quantity does not fit in 64 bits: "
+            f"{values[int(np.argmax(is_too_large))]!r}"
+        )
+    aligned = np.strings.rjust(digits, _UINT64_HEX_DIGITS, b"0").astype(
+        f"S{_UINT64_HEX_DIGITS}"
+    )
+    hex_digits = _hex_digit_table()[
+        aligned.view(np.uint8).reshape(len(aligned), _UINT64_HEX_DIGITS)
+    ]
+    is_invalid = (hex_digits == 0xFF).any(axis=1)
+    if is_invalid.any():
+        raise Web3ValueError(
+            f"Invalid hex quantity: {values[int(np.argmax(is_invalid))]!r}"
+        )
+
+    # pack each pair of digits into a byte, and each 8 bytes into a big endian uint64
+    packed = (hex_digits[:, 0::2] << 4) | hex_digits[:, 1::2]
+    return packed.view(">u8").ravel().astype(np.uint64)
+
+
+def fee_history_to_arrays(fee_history: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Convert an ``eth_feeHistory`` result into NumPy arrays: ``numpy.uint64`` arrays of
+    base fees, a 2-D ``numpy.uint64`` array of rewards with a row per block and a
+    column per reward percentile, and ``numpy.float64`` arrays of gas used ratios.
+    Hex quantities in a raw result are decoded with ``hex_quantities_to_array``.
+    """
+    np = _import_numpy()
+    oldest_block = fee_history["oldestBlock"]
+    arrays: dict[str, Any] = {
+        "oldestBlock": (
+            int(oldest_block, 16) if isinstance(oldest_block, str) else oldest_block
+        ),
+    }
+    for field in _FEE_HISTORY_QUANTITY_ARRAYS:
+        if fee_history.get(field) is not None:
+            arrays[field] = hex_quantities_to_array(fee_history[field])
+    for field in _FEE_HISTORY_RATIO_ARRAYS:
+        if fee_history.get(field) is not None:
+            arrays[field] = np.asarray(fee_history[field], dtype=np.float64)
+
+    rewards = fee_history.get("reward")
+    if rewards is not None:
+        num_percentiles = len(rewards[0]) if rewards else 0
+        if any(len(block_rewards) != num_percentiles for block_rewards in rewards):
+            raise Web3ValueError(
+                "Expected the same number of rewards for every block, got: "
+                f"{[len(block_rewards) for block_rewards in rewards]}"
+            )
+        arrays["reward"] = hex_quantities_to_array(
+            [reward for block_rewards in rewards for reward in block_rewards]
+        ).reshape(len(rewards), num_percentiles)
+    return arrays
@@ -1,9 +1,14 @@
+from enum import (
+    Enum,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Coroutine,
     Generic,
+    Hashable,
+    Mapping,
     Sequence,
     TypeVar,
     Union,
@@ -98,6 +103,41 @@ def handler_wrapper(
     return wrapped_handler
 
 
+class HandlerBackpressurePolicy(str, Enum):
+    """
+    What the ``SubscriptionManager`` does with a new notification for a parallelized
+    subscription when ``max_parallel_handlers`` handler calls are already in flight.
+    """
+
+    # stop reading notifications until a handler call finishes
+    BLOCK = "block"
+    # discard the new notification without calling its handler
+    DROP = "drop"
+
+
+HandlerOrderingKey = Callable[[EthSubscriptionContext[Any, Any]], Union[Hashable, None]]
+
+
+def order_by_subscription_id(context: EthSubscriptionContext[Any, Any]) -> HexStr:
+    """
+    Ordering key for parallelized handler calls: calls for the same subscription run
+    one after another, in the order the notifications were received.
+    """
+    return context.subscription.id
+
+
+def order_by_log_address(
+    context: EthSubscriptionContext[Any, Any],
+) -> ChecksumAddress | None:
+    """
+    Ordering key for parallelized handler calls: calls for logs emitted by the same
+    address run one after another. Results that are not logs are not ordered.
+    """
+    if isinstance(context.result, Mapping):
+        return context.result.get("address")
+    return None
+
+
 class EthSubscription(Generic[TSubscriptionResult]):
     _id: HexStr = None
     manager: "SubscriptionManager" = None
@@ -109,6 +149,7 @@ class EthSubscription(Generic[TSubscriptionResult]):
         handler_context: dict[str, Any] | None = None,
         label: str | None = None,
         parallelize: bool | None = None,
+        raw: bool = False,
     ) -> None:
         self._subscription_params = subscription_params
         self._handler = handler_wrapper(handler)
@@ -116,6 +157,8 @@ class EthSubscription(Generic[TSubscriptionResult]):
         self._label = label
 
         self.parallelize = parallelize
+        # pass the raw, unformatted JSON-RPC result to the handler
+        self.raw = raw
         self.handler_call_count = 0
 
     @property
@@ -130,6 +173,7 @@ class EthSubscription(Generic[TSubscriptionResult]):
         handler_context: dict[str, Any] | None = None,
         label: str | None = None,
         parallelize: bool | None = None,
+        raw: bool = False,
     ) -> "EthSubscription[Any]":
         subscription_type = subscription_params[0]
         subscription_arg = (
@@ -141,6 +185,7 @@ class EthSubscription(Generic[TSubscriptionResult]):
                 handler_context=handler_context,
                 label=label,
                 parallelize=parallelize,
+                raw=raw,
             )
         elif subscription_type == "logs":
             subscription_arg = subscription_arg or {}
@@ -150,6 +195,7 @@ class EthSubscription(Generic[TSubscriptionResult]):
                 handler_context=handler_context,
                 label=label,
                 parallelize=parallelize,
+                raw=raw,
             )
         elif subscription_type == "newPendingTransactions":
             subscription_arg = subscription_arg or False
@@ -159,6 +205,7 @@ class EthSubscription(Generic[TSubscriptionResult]):
                 handler_context=handler_context,
                 label=label,
                 parallelize=parallelize,
+                raw=raw,
             )
         elif subscription_type == "syncing":
             return SyncingSubscription(
@@ -166,6 +213,7 @@ class EthSubscription(Generic[TSubscriptionResult]):
                 handler_context=handler_context,
                 label=label,
                 parallelize=parallelize,
+                raw=raw,
             )
         else:
             params = (
@@ -179,6 +227,7 @@ class EthSubscription(Generic[TSubscriptionResult]):
                 handler_context=handler_context,
                 label=label,
                 parallelize=parallelize,
+                raw=raw,
             )
 
     @property
@@ -217,9 +266,14 @@ class LogsSubscription(EthSubscription[LogReceipt]):
         handler_context: dict[str, Any] | None = None,
         label: str | None = None,
         parallelize: bool | None = None,
+        raw: bool = False,
     ) -> None:
         self.address = address
         self.topics = topics
+        # the block of the latest log received and the ``(blockHash, logIndex)`` of
+        # each log received for it, used to backfill logs missed while reconnecting
+        self.last_block_number: int | None = None
+        self._last_block_log_keys: set[Hashable] = set()
 
         logs_filter: FilterParams = {}
         if address:
@@ -234,6 +288,7 @@ class LogsSubscription(EthSubscription[LogReceipt]):
             handler_context=handler_context,
             label=label,
             parallelize=parallelize,
+            raw=raw,
         )
 
 
@@ -250,13 +305,18 @@ class NewHeadsSubscription(EthSubscription[BlockData]):
         handler: NewHeadsSubscriptionHandler | None = None,
         handler_context: dict[str, Any] | None = None,
         parallelize: bool | None = None,
+        raw: bool = False,
     ) -> None:
+        # the number of the latest header received, used to backfill headers missed
+        # while reconnecting
+        self.last_block_number: int | None = None
         super().__init__(
             subscription_params=("newHeads",),
             handler=handler,
             handler_context=handler_context,
             label=label,
             parallelize=parallelize,
+            raw=raw,
         )
 
 
@@ -276,6 +336,7 @@ class PendingTxSubscription(EthSubscription[Union[HexBytes, TxData]]):
         handler: PendingTxSubscriptionHandler | None = None,
         handler_context: dict[str, Any] | None = None,
         parallelize: bool | None = None,
+        raw: bool = False,
     ) -> None:
         self.full_transactions = full_transactions
         super().__init__(
@@ -284,6 +345,7 @@ class PendingTxSubscription(EthSubscription[Union[HexBytes, TxData]]):
             handler_context=handler_context,
             label=label,
             parallelize=parallelize,
+            raw=raw,
         )
 
 
@@ -300,6 +362,7 @@ class SyncingSubscription(EthSubscription[SyncProgress]):
         handler: SyncingSubscriptionHandler | None = None,
         handler_context: dict[str, Any] | None = None,
         parallelize: bool | None = None,
+        raw: bool = False,
     ) -> None:
         super().__init__(
             subscription_params=("syncing",),
@@ -307,4 +370,5 @@ class SyncingSubscription(EthSubscription[SyncProgress]):
             handler_context=handler_context,
             label=label,
             parallelize=parallelize,
+            raw=raw,
         )